@@ -0,0 +1,94 @@
+from dependency_injector.wiring import inject
+from fastapi import HTTPException
+
+from app.application.app_service import AppService
+from chunks.domain.model.chunk_job_schema import (
+    ChunkJobDocumentSchema,
+    ChunkJobSchema,
+)
+from chunks.domain.model.chunk_schema import ChunkParameterSchema
+from chunks.domain.repository.chunk_job_queue import IChunkJobQueue
+from chunks.domain.repository.chunk_job_repository import IChunkJobRepository
+from document.application.document_service import DocumentService
+from utils.object import get_object_id
+
+
+class ChunkJobService:
+
+    @inject
+    def __init__(
+        self,
+        app_service: AppService,
+        document_service: DocumentService,
+        chunk_job_repository: IChunkJobRepository,
+        chunk_job_queue: IChunkJobQueue,
+    ):
+        self.app_service = app_service
+        self.document_service = document_service
+        self.chunk_job_repository = chunk_job_repository
+        self.chunk_job_queue = chunk_job_queue
+
+    async def create_chunk_job(
+        self,
+        app_id: str,
+        chunk_parameter: ChunkParameterSchema,
+        user_id: str,
+    ) -> ChunkJobSchema:
+        """
+        App 단위 청크 생성 작업을 등록하고 큐에 넣는다.
+        실제 청크 생성은 ChunkJobWorker가 수행한다.
+        """
+
+        app = await self.app_service.get_app(app_id)
+
+        if app.creator != user_id:
+            raise HTTPException(
+                status_code=403,
+                detail="App에 chunk를 생성할 권한이 없습니다.",
+            )
+
+        document_list = await self.document_service.get_document_by_app(
+            app_id=app_id,
+        )
+
+        job = await self.chunk_job_repository.create_job(
+            ChunkJobSchema(
+                app_id=app.id,
+                chunk_parameter=chunk_parameter,
+                total_count=len(document_list),
+                document_list=[
+                    ChunkJobDocumentSchema(document_id=document.id)
+                    for document in document_list
+                ],
+                creator=user_id,
+            )
+        )
+
+        await self.chunk_job_queue.put(job.id)
+
+        return job
+
+    async def get_chunk_job(
+        self,
+        job_id: str,
+        user_id: str,
+    ) -> ChunkJobSchema:
+        """
+        청크 생성 작업의 진행 현황 조회
+        """
+
+        job = await self.chunk_job_repository.get_job(get_object_id(job_id))
+
+        if job is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Chunk 생성 작업을 찾을 수 없습니다.",
+            )
+
+        if job.creator != user_id:
+            raise HTTPException(
+                status_code=403,
+                detail="Chunk 생성 작업을 조회할 권한이 없습니다.",
+            )
+
+        return job
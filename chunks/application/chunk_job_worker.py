@@ -0,0 +1,202 @@
+import asyncio
+import os
+import socket
+import uuid
+from typing import Callable, List, Optional
+
+from bson import ObjectId
+
+from chunks.application.chunk_service import ChunkService
+from chunks.domain.model.chunk_job_schema import (
+    ChunkJobDocumentSchema,
+    ChunkJobSchema,
+    ChunkJobStatus,
+)
+from chunks.domain.repository.chunk_job_queue import IChunkJobQueue
+from chunks.domain.repository.chunk_job_repository import IChunkJobRepository
+from common.log_config import get_logger
+from utils.object import get_str_id
+
+logger = get_logger(__name__)
+
+
+class ChunkJobWorker:
+    """
+    큐에 등록된 청크 생성 작업을 프로세스 내 worker task로 실행한다.
+    """
+
+    def __init__(
+        self,
+        chunk_job_queue: IChunkJobQueue,
+        chunk_job_repository: IChunkJobRepository,
+        chunk_service_factory: Callable[[], ChunkService],
+        worker_count: int,
+        lease_sec: float = 300.0,
+        heartbeat_sec: float = 60.0,
+    ):
+        self.chunk_job_queue = chunk_job_queue
+        self.chunk_job_repository = chunk_job_repository
+        self.chunk_service_factory = chunk_service_factory
+        self.worker_count = worker_count
+        self.lease_sec = lease_sec
+        self.heartbeat_sec = heartbeat_sec
+        # 여러 프로세스가 같은 작업 컬렉션을 공유하므로 프로세스마다 고유한 식별자를 사용
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"chunk-job-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        self._tasks.append(
+            asyncio.create_task(self._reclaim(), name="chunk-job-reclaimer")
+        )
+        logger.info(f"[ChunkJob] worker {self.worker_count}개 시작")
+
+    async def recover(self) -> int:
+        """
+        재시작 전에 끝나지 않은 작업을 다시 큐에 등록한다.
+        lease가 만료된 running 작업은 진행 현황을 초기화하고 처음부터 다시 처리하며,
+        heartbeat가 갱신되고 있는(다른 프로세스가 실행 중인) 작업은 건드리지 않는다.
+        """
+
+        await self.chunk_job_repository.reclaim_expired_jobs(self.lease_sec)
+        job_ids = await self.chunk_job_repository.get_pending_job_ids()
+        for job_id in job_ids:
+            await self.chunk_job_queue.put(job_id)
+
+        if job_ids:
+            logger.info(f"[ChunkJob] 미완료 작업 {len(job_ids)}개 재등록")
+        return len(job_ids)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("[ChunkJob] worker 종료")
+
+    async def _reclaim(self) -> None:
+        """
+        실행 중 종료된 다른 프로세스의 작업을 주기적으로 회수해 큐에 등록한다.
+        """
+        while True:
+            await asyncio.sleep(self.lease_sec)
+            try:
+                job_ids = await self.chunk_job_repository.reclaim_expired_jobs(
+                    self.lease_sec
+                )
+            except Exception as e:
+                logger.error(f"[ChunkJob] lease 만료 작업 회수 실패: {e}")
+                continue
+
+            for job_id in job_ids:
+                await self.chunk_job_queue.put(job_id)
+            if job_ids:
+                logger.info(f"[ChunkJob] lease 만료 작업 {len(job_ids)}개 재등록")
+
+    async def _heartbeat(self, job_id: ObjectId) -> None:
+        """
+        작업이 끝날 때까지 lease를 연장한다. 다른 worker에게 회수되면 종료한다.
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_sec)
+            try:
+                if not await self.chunk_job_repository.heartbeat(job_id, self.owner):
+                    logger.warning(f"[ChunkJob] {job_id} 작업의 lease를 잃었습니다.")
+                    return
+            except Exception as e:
+                logger.warning(f"[ChunkJob] {job_id} heartbeat 실패: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            job_id = await self.chunk_job_queue.get()
+            try:
+                await self.process_job(job_id)
+            except Exception as e:
+                logger.error(f"[ChunkJob] {job_id} 작업 실패: {e}")
+                await self.chunk_job_repository.update_job_status(
+                    job_id, ChunkJobStatus.FAILED, error=str(e)
+                )
+            finally:
+                self.chunk_job_queue.task_done()
+
+    async def process_job(self, job_id: ObjectId) -> None:
+
+        job = await self.chunk_job_repository.get_job(job_id)
+
+        if job is None:
+            logger.error(f"[ChunkJob] {job_id} 작업이 존재하지 않습니다.")
+            return
+
+        # 같은 작업이 중복 등록되어도 한 번만 실행
+        if not await self.chunk_job_repository.claim_job(job.id, self.owner):
+            logger.info(f"[ChunkJob] {job_id} 이미 처리 중이거나 종료된 작업입니다.")
+            return
+
+        logger.info(f"[ChunkJob] {job_id} 작업 시작: 문서 {job.total_count}개")
+
+        heartbeat = asyncio.create_task(self._heartbeat(job.id))
+        try:
+            await self._chunk_documents(job)
+        finally:
+            lease_lost = heartbeat.done()
+            heartbeat.cancel()
+
+        # 회수된 작업은 다른 worker가 처음부터 다시 실행하므로 완료로 기록하지 않음
+        if lease_lost:
+            logger.warning(f"[ChunkJob] {job_id} 다른 worker가 회수한 작업입니다.")
+            return
+
+        await self.chunk_job_repository.update_job_status(
+            job.id, ChunkJobStatus.COMPLETED
+        )
+        logger.info(f"[ChunkJob] {job_id} 작업 완료")
+
+    async def _chunk_documents(self, job: ChunkJobSchema) -> None:
+
+        chunk_service = self.chunk_service_factory()
+
+        document_map = {
+            document.id: document
+            for document in await chunk_service.document_service.get_document_by_app(
+                app_id=get_str_id(job.app_id)
+            )
+        }
+
+        async def _on_complete(
+            document_id: ObjectId, chunk_count: int, error: Optional[str]
+        ) -> None:
+            await self.chunk_job_repository.update_job_document(
+                job.id,
+                ChunkJobDocumentSchema(
+                    document_id=document_id,
+                    status=(
+                        ChunkJobStatus.FAILED if error else ChunkJobStatus.COMPLETED
+                    ),
+                    chunk_count=chunk_count,
+                    error=error,
+                ),
+            )
+
+        document_list = []
+        for job_document in job.document_list:
+            document = document_map.get(job_document.document_id)
+            if document is None:
+                await _on_complete(
+                    job_document.document_id, 0, "문서가 존재하지 않습니다."
+                )
+            else:
+                document_list.append(document)
+
+        # 권한 검사는 작업 등록 시 완료
+        await chunk_service.chunk_document_list(
+            document_list=document_list,
+            chunk_parameter=job.chunk_parameter,
+            user_id=job.creator,
+            on_complete=_on_complete,
+        )
@@ -1,13 +1,28 @@
-from typing import List, Optional
+import asyncio
+import hashlib
+import json
+from collections import deque
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+)
+from bson import ObjectId
 from dependency_injector.wiring import inject
 from fastapi import HTTPException
+from langchain_core.documents import Document
 
 from app.application.app_service import AppService
 from chunks.application.image_service import ImageService
 from chunks.domain.model.chunk_schema import (
-    ChunkBulkCreateSchema,
-    ChunkCreateErrorSchema,
-    ChunkCreateSuccessSchema,
+    CHUNK_PROJECTION_FIELDS,
+    ChunkPageSchema,
     ChunkParameterSchema,
     ChunkSchema,
 )
@@ -15,8 +30,28 @@ from chunks.domain.model.image_schema import ChunkImageSchema
 from chunks.domain.repository.chunk_repository import IChunkRepository
 from document.application.document_service import DocumentService
 from document.domain.model.document_schema import DocumentSchema
+from embed.application.embedding_service import EmbeddingService
+from search.application.lexical_index_service import LexicalIndexService
+from utils.chunking_executor import ChunkingExecutor
 from utils.object import get_object_id, get_str_id
-from utils.preprocess import chunking
+from utils.preprocess import chunking_pages, get_page_count, get_page_windows
+
+
+def get_chunk_content_hash(
+    content: str,
+    tags: List[str],
+    page: int,
+    images: List[str],
+    index_flags: Dict[str, bool],
+) -> str:
+    """
+    청크 diff 비교용 해시. 본문, 태그, 페이지, 이미지 경로가 모두 같아야 같은 청크로 본다.
+    색인 활성 여부도 포함하여, 색인을 새로 켠 뒤에는 기존 청크를 재사용하지 않고 다시 색인한다.
+    """
+    payload = json.dumps(
+        [content, tags, page, images, index_flags], ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 class ChunkService:
@@ -28,11 +63,23 @@ class ChunkService:
         document_service: DocumentService,
         image_service: ImageService,
         chunk_repository: IChunkRepository,
+        chunking_executor: ChunkingExecutor,
+        embedding_service: EmbeddingService,
+        lexical_index_service: LexicalIndexService,
+        page_window: int = 50,
+        parallel_windows: int = 1,
+        max_parallel_documents: int = 8,
     ):
         self.app_service = app_service
         self.chunk_repository = chunk_repository
         self.document_service = document_service
         self.image_service = image_service
+        self.chunking_executor = chunking_executor
+        self.embedding_service = embedding_service
+        self.lexical_index_service = lexical_index_service
+        self.page_window = page_window
+        self.parallel_windows = parallel_windows
+        self.max_parallel_documents = max_parallel_documents
 
     async def create_chunk_by_document(
         self,
@@ -47,6 +94,33 @@ class ChunkService:
             document_id
         )
 
+        await self.chunk_document(
+            document_id=document_id,
+            chunk_parameter=chunk_parameter,
+            user_id=user_id,
+            pre_auth_check=pre_auth_check,
+            document_schema=document,
+        )
+
+        return await self.chunk_repository.get_chunk_by_document_id(document.id)
+
+    async def chunk_document(
+        self,
+        document_id: str,
+        chunk_parameter: ChunkParameterSchema,
+        user_id: str,
+        pre_auth_check: bool = False,
+        document_schema: DocumentSchema | None = None,
+    ) -> int:
+        """
+        Document를 페이지 구간 단위로 파싱하여 구간마다 바로 저장하고, 생성된 청크 수를 반환한다.
+        실패 시 이번 실행에서 저장한 청크/이미지/벡터를 모두 되돌린다.
+        """
+
+        document = document_schema or await self.document_service.get_document(
+            document_id
+        )
+
         if document.extension != "pdf":
             raise HTTPException(
                 status_code=400,
@@ -60,132 +134,240 @@ class ChunkService:
                     detail="Document에 chunk를 생성할 권한이 없습니다.",
                 )
 
-        await self.delete_chunk_by_document_id(
-            document_id=document_id,
-            user_id=user_id,
-            pre_auth_check=True,
-            document_schema=document,
-        )
-
-        try:
-            file_path = (
-                document.file_path
-            )  # ./static/data/app_id/source/document.name.extension
-            img_save_path = f"{document.app_id}/{document.id}"  # app_id/document_id
-
-            _documents = chunking(
-                chunk_size=chunk_parameter.chunk_size,
-                chunk_overlap=chunk_parameter.chunk_overlap,
-                file_path=file_path,
-                img_save_path=img_save_path,
+        index_flags = self._get_index_flags()
+        signature = chunk_parameter.get_signature(document.hash, index_flags)
+
+        # content_hash가 같은 기존 청크는 재사용하고, 남은 기존 청크는 삭제 대상
+        reusable: Dict[str, List[ObjectId]] = {}
+
+        if chunk_parameter.incremental:
+            async for raw in self.chunk_repository.iter_chunk_by_document_id(
+                document_id=document.id,
+                fields=["content_hash"],
+            ):
+                reusable.setdefault(raw.get("content_hash", ""), []).append(raw["_id"])
+
+            existing_count = sum(len(chunk_ids) for chunk_ids in reusable.values())
+
+            # 파일과 파라미터가 그대로면 파싱 없이 기존 청크를 사용
+            if existing_count and document.chunk_signature == signature:
+                return existing_count
+        else:
+            await self.delete_chunk_by_document_id(
+                document_id=document_id,
+                user_id=user_id,
+                pre_auth_check=True,
+                document_schema=document,
             )
 
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Document Preprocessing 중 오류 발생: {e}",
-            )
+        # 반영 도중 실패하면 다음 incremental 실행이 생략되지 않도록 먼저 초기화
+        await self.document_service.update_chunk_signature([document.id], None)
 
-        chunk_list: List[ChunkSchema] = []
-        image_list: List[ChunkImageSchema] = []
+        chunk_count = 0
+        inserted_chunk_ids: List[ObjectId] = []
+        inserted_image_ids: List[ObjectId] = []
 
-        for doc in _documents:
-            try:
-
-                chunk_schema = ChunkSchema(
-                    content=doc.page_content,
-                    tags=doc.metadata.get("tags", []),
-                    page=doc.metadata.get("page", 0),
-                    file_creation_date=doc.metadata.get("creationDate", ""),
-                    file_mod_date=doc.metadata.get("modDate", ""),
-                    document_id=document.id,
-                    creator=user_id,
-                )
-
-                _images = doc.metadata.get("images", [])
-
-                for image in _images:
-                    chunk_image_schema = await self.image_service.create_image(
-                        ChunkImageSchema(
-                            chunk_id=chunk_schema.id,
-                            image_url=image,
+        try:
+            # 중간에 빠져나가도 generator의 finally(대기 중인 파싱 취소)가 즉시 실행되도록 닫음
+            async with aclosing(
+                self._iter_document_batches(document, chunk_parameter)
+            ) as batches:
+                async for _documents in batches:
+                    chunk_list: List[ChunkSchema] = []
+                    image_list: List[ChunkImageSchema] = []
+
+                    for doc in _documents:
+                        images = doc.metadata.get("images", [])
+                        chunk_schema = ChunkSchema(
+                            content=doc.page_content,
+                            tags=doc.metadata.get("tags", []),
+                            page=doc.metadata.get("page", 0),
+                            file_creation_date=doc.metadata.get("creationDate", ""),
+                            file_mod_date=doc.metadata.get("modDate", ""),
+                            document_id=document.id,
+                            content_hash=get_chunk_content_hash(
+                                doc.page_content,
+                                doc.metadata.get("tags", []),
+                                doc.metadata.get("page", 0),
+                                images,
+                                index_flags,
+                            ),
                             creator=user_id,
                         )
+                        chunk_count += 1
+
+                        same_list = reusable.get(chunk_schema.content_hash)
+                        if same_list:
+                            same_list.pop(0)
+                            continue
+
+                        chunk_list.append(chunk_schema)
+
+                        for image in images:
+                            image_list.append(
+                                ChunkImageSchema(
+                                    chunk_id=chunk_schema.id,
+                                    image_url=image,
+                                    creator=user_id,
+                                )
+                            )
+
+                    # unordered insert는 부분 성공할 수 있으므로 insert 전에 rollback 대상으로 등록
+                    inserted_chunk_ids.extend(chunk.id for chunk in chunk_list)
+                    inserted_image_ids.extend(image.id for image in image_list)
+
+                    await self.image_service.create_images_bulk(image_list)
+                    await self.chunk_repository.create_chunks_bulk(chunk_list)
+                    await self.embedding_service.embed_chunks(
+                        document.app_id, chunk_list
+                    )
+                    await self.lexical_index_service.index_chunks(
+                        document.app_id, chunk_list
                     )
-                    image_list.append(chunk_image_schema)
 
-                await self.chunk_repository.create_chunk(chunk_schema)
-                chunk_list.append(chunk_schema)
+        except Exception as e:
 
-            except Exception as e:
+            await self.embedding_service.delete_vectors(
+                document.app_id, inserted_chunk_ids
+            )
+            await self.lexical_index_service.delete_chunks(
+                document.app_id, inserted_chunk_ids
+            )
+            await self.image_service.delete_images(inserted_image_ids)
+            await self.chunk_repository.delete_chunks(inserted_chunk_ids)
 
-                # rollback
+            if isinstance(e, HTTPException):
+                raise
 
-                for image in image_list:
-                    await self.image_service.delete_image(image.id)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Chunk 생성 중 오류 발생: {e}",
+            )
 
-                for chunk in chunk_list:
-                    await self.chunk_repository.delete_chunk(chunk.id)
+        stale_ids = [
+            chunk_id for chunk_ids in reusable.values() for chunk_id in chunk_ids
+        ]
 
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Chunk 생성 중 오류 발생: {e}",
+        try:
+            if stale_ids:
+                await self.embedding_service.delete_vectors(document.app_id, stale_ids)
+                await self.lexical_index_service.delete_chunks(
+                    document.app_id, stale_ids
                 )
+                await self.image_service.delete_image_by_chunk_ids(stale_ids)
+                await self.chunk_repository.delete_chunks(stale_ids)
 
-        return chunk_list
+            await self.document_service.update_chunk_signature([document.id], signature)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"기존 Chunk 정리 중 오류 발생: {e}",
+            )
+
+        return chunk_count
 
-    async def create_chunk_by_app(
+    def _get_index_flags(self) -> Dict[str, bool]:
+        return {
+            "embedding": self.embedding_service.enabled,
+            "lexical": self.lexical_index_service.enabled,
+        }
+
+    async def _iter_document_batches(
         self,
-        app_id: str,
+        document: DocumentSchema,
         chunk_parameter: ChunkParameterSchema,
-        user_id: str,
-    ) -> ChunkBulkCreateSchema:
+    ) -> AsyncIterator[List[Document]]:
+        """
+        PDF를 page_window 페이지 단위로 프로세스 풀에서 파싱하여 구간별 Document 목록을 순서대로 반환한다.
+        구간은 각 worker 프로세스가 파일을 독립적으로 열어 처리하므로 여러 코어에서 동시에 파싱된다.
+        """
 
-        app = await self.app_service.get_app(app_id)
+        file_path = (
+            document.file_path
+        )  # ./static/data/app_id/source/document.name.extension
+        img_save_path = f"{document.app_id}/{document.id}"  # app_id/document_id
 
-        if app.creator != user_id:
-            raise HTTPException(
-                status_code=403,
-                detail="App에 chunk를 생성할 권한이 없습니다.",
-            )
+        # 최대 parallel_windows개의 구간을 동시에 파싱하되, 결과는 페이지 순서대로 반환
+        pending: Deque[asyncio.Future] = deque()
 
-        document_list = await self.document_service.get_document_by_app(
-            app_id=app_id,
-        )
+        try:
+            page_count = await self.chunking_executor.run(get_page_count, file_path)
+
+            for pages in get_page_windows(page_count, self.page_window):
+                # PDF 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 프로세스 풀에서 실행
+                pending.append(
+                    asyncio.ensure_future(
+                        self.chunking_executor.run(
+                            chunking_pages,
+                            chunk_size=chunk_parameter.chunk_size,
+                            chunk_overlap=chunk_parameter.chunk_overlap,
+                            file_path=file_path,
+                            img_save_path=img_save_path,
+                            document_hash=document.hash,
+                            pages=pages,
+                            length_unit=chunk_parameter.length_unit,
+                        )
+                    )
+                )
 
-        success_document_list: List[ChunkCreateSuccessSchema] = []
-        error_document_list: List[ChunkCreateErrorSchema] = []
+                if len(pending) >= self.parallel_windows:
+                    yield await pending.popleft()
 
-        for document in document_list:
+            while pending:
+                yield await pending.popleft()
 
-            try:
+        except TimeoutError as e:
+            raise HTTPException(
+                status_code=504,
+                detail=f"Document Preprocessing 시간 초과: {e}",
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Document Preprocessing 중 오류 발생: {e}",
+            )
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-                chunk_list = await self.create_chunk_by_document(
-                    document_id=get_str_id(document.id),
-                    chunk_parameter=chunk_parameter,
-                    user_id=user_id,
-                    pre_auth_check=True,
-                    document_schema=document,
-                )
+    async def chunk_document_list(
+        self,
+        document_list: List[DocumentSchema],
+        chunk_parameter: ChunkParameterSchema,
+        user_id: str,
+        on_complete: Callable[[ObjectId, int, Optional[str]], Awaitable[None]],
+    ) -> None:
+        """
+        권한 검사가 끝난 문서 목록의 청크를 생성한다.
+        최대 max_parallel_documents개(설정된 상한 이하)의 문서를 동시에 처리하며, 문서 하나가 끝날 때마다
+        on_complete(document_id, chunk_count, error)를 호출한다. 한 문서의 실패는 다른 문서에 영향을 주지 않는다.
+        """
+
+        # 상한 이전에 등록된 작업도 있으므로 요청 검증과 별개로 제한
+        semaphore = asyncio.Semaphore(
+            min(chunk_parameter.max_parallel_documents, self.max_parallel_documents)
+        )
 
-                success_document_list.append(
-                    ChunkCreateSuccessSchema(
-                        document_id=document.id,
-                        chunk_list=chunk_list,
+        async def _chunk(document: DocumentSchema) -> None:
+            async with semaphore:
+                try:
+                    chunk_count = await self.chunk_document(
+                        document_id=get_str_id(document.id),
+                        chunk_parameter=chunk_parameter,
+                        user_id=user_id,
+                        pre_auth_check=True,
+                        document_schema=document,
                     )
-                )
-            except Exception as e:
-                error_document_list.append(
-                    ChunkCreateErrorSchema(
-                        document_id=document.id,
-                        error=str(e),
-                    )
-                )
+                    error = None
+                except Exception as e:
+                    chunk_count, error = 0, str(e)
 
-        return ChunkBulkCreateSchema(
-            success_document_list=success_document_list,
-            error_document_list=error_document_list,
-        )
+            await on_complete(document.id, chunk_count, error)
+
+        await asyncio.gather(*[_chunk(document) for document in document_list])
 
     async def get_chunk(
         self,
@@ -238,6 +420,85 @@ class ChunkService:
                 detail=f"Document의 Chunk 조회 중 오류 발생: {e}",
             )
 
+    async def get_chunk_page_by_document_id(
+        self,
+        document_id: str,
+        user_id: str,
+        cursor: Optional[str],
+        limit: int,
+        fields: Optional[List[str]] = None,
+    ) -> ChunkPageSchema:
+
+        document = await self._get_readable_document(document_id, user_id, fields)
+        after = get_object_id(cursor) if cursor else None
+
+        try:
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            chunk_list = await self.chunk_repository.get_chunk_page(
+                document_id=document.id,
+                after=after,
+                limit=limit + 1,
+                fields=fields,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Document의 Chunk 조회 중 오류 발생: {e}",
+            )
+
+        has_next = len(chunk_list) > limit
+        chunk_list = chunk_list[:limit]
+
+        return ChunkPageSchema(
+            chunk_list=chunk_list,
+            next_cursor=chunk_list[-1]["_id"] if has_next else None,
+        )
+
+    async def stream_chunk_by_document_id(
+        self,
+        document_id: str,
+        user_id: str,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        권한 검사 후 Document의 청크를 DB cursor에서 바로 흘려보내는 iterator를 반환한다.
+        """
+
+        document = await self._get_readable_document(document_id, user_id, fields)
+        after = get_object_id(cursor) if cursor else None
+
+        return self.chunk_repository.iter_chunk_by_document_id(
+            document_id=document.id,
+            after=after,
+            fields=fields,
+        )
+
+    async def _get_readable_document(
+        self,
+        document_id: str,
+        user_id: str,
+        fields: Optional[List[str]],
+    ) -> DocumentSchema:
+
+        document = await self.document_service.get_document(document_id)
+
+        if document.creator != user_id:
+            raise HTTPException(
+                status_code=403,
+                detail="Document의 chunk를 조회할 권한이 없습니다.",
+            )
+
+        if fields:
+            invalid_fields = set(fields) - CHUNK_PROJECTION_FIELDS
+            if invalid_fields:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"조회할 수 없는 필드입니다: {sorted(invalid_fields)}",
+                )
+
+        return document
+
     async def delete_chunk(
         self,
         chunk_id: str,
@@ -253,9 +514,17 @@ class ChunkService:
             get_str_id(chunk.id), user_id
         )
 
+        document = await self.document_service.get_document(
+            get_str_id(chunk.document_id)
+        )
+
         rollback_list: List[ChunkImageSchema] = []
 
         try:
+            await self.document_service.update_chunk_signature([document.id], None)
+            await self.embedding_service.delete_vectors(document.app_id, [chunk.id])
+            await self.lexical_index_service.delete_chunks(document.app_id, [chunk.id])
+
             for image in img_list:
                 if await self.image_service.delete_image(get_str_id(image.id)):
                     rollback_list.append(image)
@@ -290,83 +559,116 @@ class ChunkService:
                     detail="Document의 chunk를 삭제할 권한이 없습니다.",
                 )
 
-        chunk_list: List[ChunkSchema] = await self.get_chunk_by_document_id(
-            document_id=document_id,
-            user_id=user_id,
-            pre_auth_check=True,
-            document_schema=document,
-        )
-
-        doc_rollback_list: List[ChunkSchema] = []
-        img_rollback_list: List[ChunkImageSchema] = []
-
-        for chunk in chunk_list:
-            try:
-
-                img_list = await self.image_service.get_image_by_chunk_id(
-                    get_str_id(chunk.id),
-                    user_id,
-                )
-
-                for image in img_list:
-                    if await self.image_service.delete_image(image.id):
-                        img_rollback_list.append(image)
-
-                if await self.chunk_repository.delete_chunk(chunk.id):
-                    doc_rollback_list.append(chunk)
+        try:
+            return await self._delete_chunk_by_document_ids(
+                document.app_id, [document.id]
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Chunk 삭제 중 오류 발생: {e}",
+            )
 
-            except Exception as e:
+    async def delete_chunk_by_app_id(
+        self,
+        app_id: str,
+        user_id: str,
+    ) -> bool:
 
-                for image in img_rollback_list:
-                    await self.image_service.create_image(image)
+        app = await self.app_service.get_app(app_id)
 
-                for chunk in doc_rollback_list:
-                    await self.chunk_repository.create_chunk(chunk)
+        if app.creator != user_id:
+            raise HTTPException(
+                status_code=403,
+                detail="App에 chunk를 삭제할 권한이 없습니다.",
+            )
 
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Chunk 삭제 중 오류 발생: {e}",
-                )
+        # app에 대한 권한이 있으면 document에 대한 권한도 있음
+        document_list = await self.document_service.get_document_by_app(
+            app_id=app_id,
+        )
 
-        return True
+        try:
+            return await self._delete_chunk_by_document_ids(
+                app.id, [document.id for document in document_list]
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Chunk 삭제 중 오류 발생: {e}",
+            )
 
-    async def delete_chunk_by_app_id(
+    async def rebuild_lexical_index(
         self,
         app_id: str,
         user_id: str,
-    ) -> bool:
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Mongo에 저장된 App의 청크로 역색인을 다시 만들고, 색인한 청크 수를 반환한다.
+        역색인 파일이 유실/손상되었을 때 사용하며, 실행 중 생성되는 청크는 반영되지 않을 수 있다.
+        """
 
         app = await self.app_service.get_app(app_id)
 
         if app.creator != user_id:
             raise HTTPException(
                 status_code=403,
-                detail="App에 chunk를 삭제할 권한이 없습니다.",
+                detail="App의 역색인을 재생성할 권한이 없습니다.",
             )
 
         document_list = await self.document_service.get_document_by_app(
             app_id=app_id,
         )
 
-        rollback_list: List[DocumentSchema] = []
-        try:
+        async def _iter_chunk_batches() -> AsyncIterator[List[ChunkSchema]]:
+            chunk_list: List[ChunkSchema] = []
             for document in document_list:
+                async for raw in self.chunk_repository.iter_chunk_by_document_id(
+                    document_id=document.id
+                ):
+                    chunk_list.append(ChunkSchema.model_validate(raw))
+                    if len(chunk_list) >= batch_size:
+                        yield chunk_list
+                        chunk_list = []
+            if chunk_list:
+                yield chunk_list
 
-                await self.delete_chunk_by_document_id(
-                    document_id=get_str_id(document.id),
-                    user_id=user_id,
-                    pre_auth_check=True,  # app에 대한 권한이 있으면 document에 대한 권한도 있음
-                    document_schema=document,
-                )
-                rollback_list.append(document)
-
+        try:
+            return await self.lexical_index_service.rebuild_index(
+                app.id, _iter_chunk_batches()
+            )
         except Exception as e:
-            for document in rollback_list:
-                await self.document_service.create_document(document)
-
             raise HTTPException(
                 status_code=500,
-                detail=f"Chunk 삭제 중 오류 발생: {e}",
+                detail=f"역색인 재생성 중 오류 발생: {e}",
             )
 
+    async def _delete_chunk_by_document_ids(
+        self,
+        app_id: ObjectId,
+        document_ids: List[ObjectId],
+    ) -> bool:
+        """
+        권한 검사가 끝난 문서들의 벡터, 역색인, 청크, 이미지를 set 단위로 삭제한다.
+        시그니처 -> 벡터/역색인 -> 이미지 -> 청크 순서로 삭제하므로 중간에 실패해도 재시도로 정리할 수 있다.
+        """
+
+        if not document_ids:
+            return True
+
+        chunk_ids = await self.chunk_repository.get_chunk_ids_by_document_ids(
+            document_ids
+        )
+
+        await self.document_service.update_chunk_signature(document_ids, None)
+        await self.embedding_service.delete_vectors_by_document_ids(
+            app_id, document_ids
+        )
+        await self.lexical_index_service.delete_chunks_by_document_ids(
+            app_id, document_ids
+        )
+        await self.image_service.delete_image_by_chunk_ids(chunk_ids)
+        await self.chunk_repository.delete_chunk_by_document_ids(document_ids)
+
         return True
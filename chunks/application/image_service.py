@@ -1,4 +1,5 @@
 from typing import List, Optional
+from bson import ObjectId
 from dependency_injector.wiring import inject
 from fastapi import HTTPException, UploadFile
 from chunks.domain.model.image_schema import ChunkImageSchema
@@ -21,6 +22,13 @@ class ImageService:
     async def create_image(self, image: ChunkImageSchema) -> ChunkImageSchema:
         return await self.image_repository.create_image(image)
 
+    async def create_images_bulk(
+        self, images: List[ChunkImageSchema]
+    ) -> List[ChunkImageSchema]:
+        if not images:
+            return []
+        return await self.image_repository.create_images_bulk(images)
+
     async def get_image(
         self,
         image_id: str,
@@ -99,3 +107,13 @@ class ImageService:
     async def delete_image(self, image_id: str):
         oid = get_object_id(image_id)
         return await self.image_repository.delete_image(oid)
+
+    async def delete_images(self, image_ids: List[ObjectId]) -> int:
+        if not image_ids:
+            return 0
+        return await self.image_repository.delete_images(image_ids)
+
+    async def delete_image_by_chunk_ids(self, chunk_ids: List[ObjectId]) -> int:
+        if not chunk_ids:
+            return 0
+        return await self.image_repository.delete_image_by_chunk_ids(chunk_ids)
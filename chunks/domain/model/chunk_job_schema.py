@@ -0,0 +1,55 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from bson import ObjectId
+from pydantic import BaseModel, Field
+
+from chunks.domain.model.chunk_schema import ChunkParameterSchema
+from common.model import LifeCycle
+
+
+class ChunkJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ChunkJobDocumentSchema(BaseModel):
+    document_id: ObjectId = Field(..., description="문서 ID")
+    status: ChunkJobStatus = Field(
+        default=ChunkJobStatus.PENDING, description="문서 처리 상태"
+    )
+    chunk_count: int = Field(default=0, description="생성된 청크 수")
+    error: Optional[str] = Field(default=None, description="청크 생성 실패 이유")
+
+    class Config:
+        arbitrary_types_allowed = True
+        populate_by_name = True
+        use_enum_values = True
+
+
+class ChunkJobSchema(LifeCycle):
+    id: ObjectId = Field(default_factory=ObjectId, alias="_id")
+    app_id: ObjectId = Field(..., description="APP ID, 식별자")
+    chunk_parameter: ChunkParameterSchema = Field(..., description="청크 파라미터")
+    status: ChunkJobStatus = Field(
+        default=ChunkJobStatus.PENDING, description="작업 상태"
+    )
+    total_count: int = Field(default=0, description="전체 문서 수")
+    success_count: int = Field(default=0, description="청크 생성에 성공한 문서 수")
+    error_count: int = Field(default=0, description="청크 생성에 실패한 문서 수")
+    document_list: List[ChunkJobDocumentSchema] = Field(
+        default=[], description="문서별 처리 현황"
+    )
+    error: Optional[str] = Field(default=None, description="작업 실패 이유")
+    owner: Optional[str] = Field(
+        default=None, description="작업을 실행 중인 worker 식별자 (running 상태일 때)"
+    )
+    started_at: Optional[datetime] = Field(default=None, description="작업 시작 일시")
+    finished_at: Optional[datetime] = Field(default=None, description="작업 종료 일시")
+
+    class Config:
+        arbitrary_types_allowed = True
+        populate_by_name = True
+        use_enum_values = True
@@ -1,4 +1,7 @@
-from typing import List, Optional
+import hashlib
+import json
+from enum import Enum
+from typing import Any, Dict, List, Optional
 from bson import ObjectId
 from pydantic import BaseModel, Field
 from common.model import LifeCycle
@@ -18,39 +21,75 @@ class ChunkDetail(ChunkUpdateSchema):
 class ChunkSchema(ChunkDetail, LifeCycle):
     id: ObjectId = Field(default_factory=ObjectId, alias="_id")
     document_id: ObjectId = Field(..., description="문서 ID, 식별자")
+    content_hash: str = Field(
+        default="", description="청크 내용(본문, 태그, 페이지, 이미지)의 해시값"
+    )
 
     class Config:
         arbitrary_types_allowed = True
         populate_by_name = True
 
 
-class ChunkParameterSchema(BaseModel):
-    chunk_size: int = Field(default=250, description="청크 크기")
-    chunk_overlap: int = Field(default=20, description="청크 중복")
-
-
-class ChunkCreateSuccessSchema(BaseModel):
-    document_id: ObjectId = Field(..., description="문서 ID")
-    chunk_list: List[ChunkSchema] = Field(..., description="청크 리스트")
+# 청크 목록 조회 시 projection으로 선택 가능한 필드
+CHUNK_PROJECTION_FIELDS = {
+    "document_id",
+    "content",
+    "tags",
+    "page",
+    "file_creation_date",
+    "file_mod_date",
+    "content_hash",
+    "creator",
+    "updater",
+    "created_at",
+    "updated_at",
+}
+
+
+class ChunkPageSchema(BaseModel):
+    chunk_list: List[Dict[str, Any]] = Field(
+        default=[], description="projection이 적용된 청크 목록"
+    )
+    next_cursor: Optional[ObjectId] = Field(
+        default=None, description="다음 페이지 조회용 커서 (마지막 청크 ID)"
+    )
 
     class Config:
         arbitrary_types_allowed = True
         populate_by_name = True
 
 
-class ChunkCreateErrorSchema(BaseModel):
-    document_id: ObjectId = Field(..., description="문서 ID")
-    error: str = Field(..., description="청크 생성 실패 이유")
-
-    class Config:
-        arbitrary_types_allowed = True
-        populate_by_name = True
+class ChunkLengthUnit(str, Enum):
+    CHARACTER = "character"
+    TOKEN = "token"
 
 
-class ChunkBulkCreateSchema(BaseModel):
-    success_document_list: List[ChunkCreateSuccessSchema] = Field(
-        default=[], description="성공한 문서 리스트"
+class ChunkParameterSchema(BaseModel):
+    chunk_size: int = Field(default=250, description="청크 크기")
+    chunk_overlap: int = Field(default=20, description="청크 중복")
+    length_unit: ChunkLengthUnit = Field(
+        default=ChunkLengthUnit.CHARACTER,
+        description="chunk_size/chunk_overlap의 단위 (character: 글자 수, token: 토큰 수)",
     )
-    error_document_list: List[ChunkCreateErrorSchema] = Field(
-        default=[], description="실패한 문서 리스트"
+    max_parallel_documents: int = Field(
+        default=1, ge=1, description="App 단위 청크 생성 시 동시에 처리할 최대 문서 수"
     )
+    incremental: bool = Field(
+        default=False,
+        description="기존 청크와 비교하여 변경된 청크만 생성/삭제",
+    )
+
+    def get_signature(
+        self, document_hash: str, index_flags: Dict[str, bool] | None = None
+    ) -> str:
+        """
+        문서 해시와 청크 생성 결과에 영향을 주는 파라미터, 색인(임베딩/lexical) 활성 여부로 만든 시그니처.
+        """
+        parameter = self.model_dump(exclude={"max_parallel_documents", "incremental"})
+        payload = json.dumps(
+            [document_hash, parameter, index_flags or {}], sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    class Config:
+        use_enum_values = True
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from bson import ObjectId
+
+
+class IChunkJobQueue(ABC):
+
+    @abstractmethod
+    async def put(self, job_id: ObjectId) -> None:
+        """
+        실행할 청크 생성 작업을 큐에 넣는다.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self) -> ObjectId:
+        """
+        실행할 청크 생성 작업을 큐에서 꺼낸다. 작업이 없으면 대기한다.
+        """
+        pass
+
+    @abstractmethod
+    def task_done(self) -> None:
+        """
+        get으로 꺼낸 작업의 처리가 끝났음을 알린다.
+        """
+        pass
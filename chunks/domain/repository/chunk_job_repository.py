@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from bson import ObjectId
+
+from chunks.domain.model.chunk_job_schema import (
+    ChunkJobDocumentSchema,
+    ChunkJobSchema,
+    ChunkJobStatus,
+)
+
+
+class IChunkJobRepository(ABC):
+
+    @abstractmethod
+    async def create_job(self, job: ChunkJobSchema) -> ChunkJobSchema:
+        """
+        청크 생성 작업을 DB에 저장한다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: ObjectId) -> Optional[ChunkJobSchema]:
+        """
+        job_id에 해당하는 청크 생성 작업을 조회한다.
+        """
+        pass
+
+    @abstractmethod
+    async def claim_job(self, job_id: ObjectId, owner: str) -> bool:
+        """
+        pending 상태인 작업만 owner의 running 작업으로 변경한다. 이미 다른 worker가 가져간 작업이면 False.
+        """
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, job_id: ObjectId, owner: str) -> bool:
+        """
+        owner가 실행 중인 작업의 갱신 일시(lease)를 연장한다. 다른 worker에게 회수된 작업이면 False.
+        """
+        pass
+
+    @abstractmethod
+    async def reclaim_expired_jobs(self, lease_sec: float) -> List[ObjectId]:
+        """
+        lease_sec 동안 갱신되지 않은 running 작업을 pending으로 되돌리고 ID를 반환한다.
+        회수한 작업은 문서별 진행 현황과 성공/실패 수를 초기화한다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_pending_job_ids(self) -> List[ObjectId]:
+        """
+        pending 상태인 작업 ID를 생성 순서대로 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    async def update_job_status(
+        self,
+        job_id: ObjectId,
+        status: ChunkJobStatus,
+        error: Optional[str] = None,
+    ) -> bool:
+        """
+        작업 상태를 변경한다. 상태에 따라 시작/종료 일시를 함께 기록한다.
+        """
+        pass
+
+    @abstractmethod
+    async def update_job_document(
+        self,
+        job_id: ObjectId,
+        job_document: ChunkJobDocumentSchema,
+    ) -> bool:
+        """
+        작업에 포함된 문서 1건의 처리 결과를 기록하고 성공/실패 수를 증가시킨다.
+        """
+        pass
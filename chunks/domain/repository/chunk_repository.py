@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from bson import ObjectId
 
@@ -15,6 +15,13 @@ class IChunkRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_chunks_bulk(self, chunks: List[ChunkSchema]) -> List[ChunkSchema]:
+        """
+        청크 목록을 batch 단위 insert_many로 DB에 저장한다.
+        """
+        pass
+
     @abstractmethod
     async def get_chunk(self, chunk_id: ObjectId) -> Optional[ChunkSchema]:
         """
@@ -22,6 +29,13 @@ class IChunkRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_chunks_by_ids(self, chunk_ids: List[ObjectId]) -> List[ChunkSchema]:
+        """
+        chunk_ids에 해당하는 청크를 한 번의 조회로 가져온다. (순서는 보장하지 않음)
+        """
+        pass
+
     @abstractmethod
     async def get_chunk_by_document_id(
         self, document_id: ObjectId
@@ -31,9 +45,58 @@ class IChunkRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_chunk_page(
+        self,
+        document_id: ObjectId,
+        after: Optional[ObjectId],
+        limit: int,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        document_id에 해당하는 청크를 _id 오름차순으로 after 이후부터 limit개 조회한다.
+        fields가 주어지면 해당 필드(+_id)만 조회한다.
+        """
+        pass
+
+    @abstractmethod
+    def iter_chunk_by_document_id(
+        self,
+        document_id: ObjectId,
+        after: Optional[ObjectId] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        document_id에 해당하는 청크를 _id 오름차순으로 cursor에서 하나씩 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_chunk_ids_by_document_ids(
+        self, document_ids: List[ObjectId]
+    ) -> List[ObjectId]:
+        """
+        document_ids에 속한 청크의 ID 목록만 조회한다.
+        """
+        pass
+
     @abstractmethod
     async def delete_chunk(self, chunk_id: ObjectId) -> bool:
         """
         chunk_id에 해당하는 청크를 삭제한다.
         """
         pass
+
+    @abstractmethod
+    async def delete_chunks(self, chunk_ids: List[ObjectId]) -> int:
+        """
+        chunk_ids에 해당하는 청크를 일괄 삭제하고 삭제된 개수를 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_chunk_by_document_ids(self, document_ids: List[ObjectId]) -> int:
+        """
+        document_ids에 속한 청크를 일괄 삭제하고 삭제된 개수를 반환한다.
+        """
+        pass
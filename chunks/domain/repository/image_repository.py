@@ -15,6 +15,15 @@ class IImageRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_images_bulk(
+        self, images: List[ChunkImageSchema]
+    ) -> List[ChunkImageSchema]:
+        """
+        이미지 목록을 batch 단위 insert_many로 DB에 저장한다.
+        """
+        pass
+
     @abstractmethod
     async def get_image(self, image_id: ObjectId) -> Optional[ChunkImageSchema]:
         """
@@ -44,3 +53,17 @@ class IImageRepository(ABC):
         image_id에 해당하는 이미지를 삭제한다.
         """
         pass
+
+    @abstractmethod
+    async def delete_images(self, image_ids: List[ObjectId]) -> int:
+        """
+        image_ids에 해당하는 이미지를 일괄 삭제하고 삭제된 개수를 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_image_by_chunk_ids(self, chunk_ids: List[ObjectId]) -> int:
+        """
+        chunk_ids에 속한 이미지를 일괄 삭제하고 삭제된 개수를 반환한다.
+        """
+        pass
@@ -0,0 +1,24 @@
+import asyncio
+
+from bson import ObjectId
+
+from chunks.domain.repository.chunk_job_queue import IChunkJobQueue
+
+
+class LocalChunkJobQueue(IChunkJobQueue):
+    """
+    프로세스 내 asyncio.Queue 기반 작업 큐.
+    큐 자체는 재시작 시 비워지므로, 시작 시 ChunkJobWorker.recover가 DB에 남은 미완료 작업을 다시 등록한다.
+    """
+
+    def __init__(self):
+        self.queue: asyncio.Queue[ObjectId] = asyncio.Queue()
+
+    async def put(self, job_id: ObjectId) -> None:
+        await self.queue.put(job_id)
+
+    async def get(self) -> ObjectId:
+        return await self.queue.get()
+
+    def task_done(self) -> None:
+        self.queue.task_done()
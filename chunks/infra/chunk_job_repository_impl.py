@@ -0,0 +1,150 @@
+from datetime import UTC, datetime, timedelta
+from typing import List, Optional
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from chunks.domain.model.chunk_job_schema import (
+    ChunkJobDocumentSchema,
+    ChunkJobSchema,
+    ChunkJobStatus,
+)
+from chunks.domain.repository.chunk_job_repository import IChunkJobRepository
+from config import get_settings
+
+DB_CONFIG = get_settings().mongo
+DB = DB_CONFIG.mongodb_db
+
+
+class ChunkJobRepository(IChunkJobRepository):
+
+    def __init__(self, mongo_client: AsyncIOMotorClient):
+        self.db = mongo_client[DB]
+        self.collection = self.db["chunk_job"]
+
+    async def create_job(self, job: ChunkJobSchema) -> ChunkJobSchema:
+        job.created_at = datetime.now(UTC)
+        await self.collection.insert_one(job.model_dump(by_alias=True))
+        return job
+
+    async def get_job(self, job_id: ObjectId) -> ChunkJobSchema | None:
+
+        raw = await self.collection.find_one({"_id": job_id})
+        if not raw:
+            return None
+        return ChunkJobSchema.model_validate(raw)
+
+    async def claim_job(self, job_id: ObjectId, owner: str) -> bool:
+
+        now = datetime.now(UTC)
+        result = await self.collection.update_one(
+            {"_id": job_id, "status": ChunkJobStatus.PENDING.value},
+            {
+                "$set": {
+                    "status": ChunkJobStatus.RUNNING.value,
+                    "owner": owner,
+                    "started_at": now,
+                    "updated_at": now,
+                }
+            },
+        )
+        return result.modified_count > 0
+
+    async def heartbeat(self, job_id: ObjectId, owner: str) -> bool:
+
+        result = await self.collection.update_one(
+            {"_id": job_id, "status": ChunkJobStatus.RUNNING.value, "owner": owner},
+            {"$set": {"updated_at": datetime.now(UTC)}},
+        )
+        return result.matched_count > 0
+
+    async def reclaim_expired_jobs(self, lease_sec: float) -> List[ObjectId]:
+
+        now = datetime.now(UTC)
+        expired_at = now - timedelta(seconds=lease_sec)
+        job_ids = []
+
+        # 조회와 변경을 한 번에 수행해 lease가 갱신된 작업이나 다른 worker가 회수한 작업은 건드리지 않음
+        while True:
+            raw = await self.collection.find_one_and_update(
+                {
+                    "status": ChunkJobStatus.RUNNING.value,
+                    "updated_at": {"$lt": expired_at},
+                },
+                [
+                    {
+                        "$set": {
+                            "status": ChunkJobStatus.PENDING.value,
+                            "owner": None,
+                            "success_count": 0,
+                            "error_count": 0,
+                            "started_at": None,
+                            "updated_at": now,
+                            "document_list": {
+                                "$map": {
+                                    "input": "$document_list",
+                                    "as": "document",
+                                    "in": {
+                                        "document_id": "$$document.document_id",
+                                        "status": ChunkJobStatus.PENDING.value,
+                                        "chunk_count": 0,
+                                        "error": None,
+                                    },
+                                }
+                            },
+                        }
+                    }
+                ],
+                projection={"_id": 1},
+            )
+            if raw is None:
+                return job_ids
+            job_ids.append(raw["_id"])
+
+    async def get_pending_job_ids(self) -> List[ObjectId]:
+
+        cursor = self.collection.find(
+            {"status": ChunkJobStatus.PENDING.value}, {"_id": 1}
+        ).sort("created_at", 1)
+        return [raw["_id"] async for raw in cursor]
+
+    async def update_job_status(
+        self,
+        job_id: ObjectId,
+        status: ChunkJobStatus,
+        error: Optional[str] = None,
+    ) -> bool:
+
+        now = datetime.now(UTC)
+        update = {"status": status.value, "error": error, "updated_at": now}
+
+        if status == ChunkJobStatus.RUNNING:
+            update["started_at"] = now
+        elif status in (ChunkJobStatus.COMPLETED, ChunkJobStatus.FAILED):
+            update["finished_at"] = now
+
+        result = await self.collection.update_one({"_id": job_id}, {"$set": update})
+        return result.modified_count > 0
+
+    async def update_job_document(
+        self,
+        job_id: ObjectId,
+        job_document: ChunkJobDocumentSchema,
+    ) -> bool:
+
+        counter = (
+            "success_count"
+            if job_document.status == ChunkJobStatus.COMPLETED
+            else "error_count"
+        )
+
+        result = await self.collection.update_one(
+            {"_id": job_id, "document_list.document_id": job_document.document_id},
+            {
+                "$set": {
+                    "document_list.$": job_document.model_dump(),
+                    "updated_at": datetime.now(UTC),
+                },
+                "$inc": {counter: 1},
+            },
+        )
+        return result.modified_count > 0
@@ -1,10 +1,15 @@
 from datetime import UTC, datetime
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
 from chunks.domain.model.chunk_schema import ChunkSchema
 from chunks.domain.repository.chunk_repository import IChunkRepository
 from config import get_settings
+from database.mongo import (
+    CURSOR_BATCH_SIZE,
+    delete_many_in_batches,
+    insert_many_in_batches,
+)
 
 DB_CONFIG = get_settings().mongo
 DB = DB_CONFIG.mongodb_db
@@ -24,6 +29,19 @@ class ChunkRepository(IChunkRepository):
         await self.collection.insert_one(chunk.model_dump(by_alias=True))
         return chunk
 
+    async def create_chunks_bulk(
+        self,
+        chunks: List[ChunkSchema],
+    ) -> List[ChunkSchema]:
+        created_at = datetime.now(UTC)
+        for chunk in chunks:
+            chunk.created_at = created_at
+        await insert_many_in_batches(
+            self.collection,
+            [chunk.model_dump(by_alias=True) for chunk in chunks],
+        )
+        return chunks
+
     async def get_chunk(self, chunk_id: ObjectId) -> ChunkSchema | None:
 
         raw = await self.collection.find_one({"_id": chunk_id})
@@ -31,6 +49,13 @@ class ChunkRepository(IChunkRepository):
             return None
         return ChunkSchema.model_validate(raw)
 
+    async def get_chunks_by_ids(self, chunk_ids: List[ObjectId]) -> List[ChunkSchema]:
+        if not chunk_ids:
+            return []
+
+        cursor = self.collection.find({"_id": {"$in": chunk_ids}})
+        return [ChunkSchema.model_validate(raw) async for raw in cursor]
+
     async def get_chunk_by_document_id(
         self, document_id: ObjectId
     ) -> List[ChunkSchema]:
@@ -38,7 +63,69 @@ class ChunkRepository(IChunkRepository):
         raw = await self.collection.find({"document_id": document_id}).to_list(None)
         return [ChunkSchema.model_validate(chunk) for chunk in raw]
 
+    async def get_chunk_page(
+        self,
+        document_id: ObjectId,
+        after: Optional[ObjectId],
+        limit: int,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+
+        query: Dict[str, Any] = {"document_id": document_id}
+        if after is not None:
+            query["_id"] = {"$gt": after}
+
+        projection = {field: 1 for field in fields} if fields else None
+
+        return (
+            await self.collection.find(query, projection=projection)
+            .sort("_id", 1)
+            .limit(limit)
+            .to_list(limit)
+        )
+
+    async def iter_chunk_by_document_id(
+        self,
+        document_id: ObjectId,
+        after: Optional[ObjectId] = None,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+
+        query: Dict[str, Any] = {"document_id": document_id}
+        if after is not None:
+            query["_id"] = {"$gt": after}
+
+        projection = {field: 1 for field in fields} if fields else None
+
+        cursor = (
+            self.collection.find(query, projection=projection)
+            .sort("_id", 1)
+            .batch_size(CURSOR_BATCH_SIZE)
+        )
+        async for raw in cursor:
+            yield raw
+
+    async def get_chunk_ids_by_document_ids(
+        self, document_ids: List[ObjectId]
+    ) -> List[ObjectId]:
+
+        raw = await self.collection.find(
+            {"document_id": {"$in": document_ids}},
+            projection={"_id": 1},
+        ).to_list(None)
+        return [chunk["_id"] for chunk in raw]
+
     async def delete_chunk(self, chunk_id: ObjectId) -> bool:
 
         result = await self.collection.delete_one({"_id": chunk_id})
         return result.deleted_count > 0
+
+    async def delete_chunks(self, chunk_ids: List[ObjectId]) -> int:
+
+        return await delete_many_in_batches(self.collection, "_id", chunk_ids)
+
+    async def delete_chunk_by_document_ids(self, document_ids: List[ObjectId]) -> int:
+
+        return await delete_many_in_batches(
+            self.collection, "document_id", document_ids
+        )
@@ -6,6 +6,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from chunks.domain.model.image_schema import ChunkImageSchema
 from chunks.domain.repository.image_repository import IImageRepository
 from config import get_settings
+from database.mongo import delete_many_in_batches, insert_many_in_batches
 
 DB_CONFIG = get_settings().mongo
 DB = DB_CONFIG.mongodb_db
@@ -25,6 +26,19 @@ class ImageRepository(IImageRepository):
         await self.collection.insert_one(image.model_dump(by_alias=True))
         return image
 
+    async def create_images_bulk(
+        self,
+        images: List[ChunkImageSchema],
+    ) -> List[ChunkImageSchema]:
+        created_at = datetime.now(UTC)
+        for image in images:
+            image.created_at = created_at
+        await insert_many_in_batches(
+            self.collection,
+            [image.model_dump(by_alias=True) for image in images],
+        )
+        return images
+
     async def get_image(self, image_id: ObjectId) -> ChunkImageSchema | None:
 
         raw = await self.collection.find_one({"_id": image_id})
@@ -48,3 +62,11 @@ class ImageRepository(IImageRepository):
 
         result = await self.collection.delete_one({"_id": image_id})
         return result.deleted_count > 0
+
+    async def delete_images(self, image_ids: List[ObjectId]) -> int:
+
+        return await delete_many_in_batches(self.collection, "_id", image_ids)
+
+    async def delete_image_by_chunk_ids(self, chunk_ids: List[ObjectId]) -> int:
+
+        return await delete_many_in_batches(self.collection, "chunk_id", chunk_ids)
@@ -1,6 +1,7 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
+from chunks.application.chunk_job_service import ChunkJobService
 from chunks.application.chunk_service import ChunkService
 from chunks.domain.model.chunk_schema import ChunkSchema
 from dependency_injector.wiring import inject, Provide
@@ -8,6 +9,8 @@ from dependency_injector.wiring import inject, Provide
 from chunks.interface.dto.chunk_dto import ChunkParameterRequest
 from chunks.interface.dto.chunk_mapper import ChunkMapper
 from common.dto import CommonResponse
+from common.ndjson import accepts_ndjson, ndjson_response
+from config import get_settings
 from containers import Container
 from user.domain.user import User
 from user.interface.user_depends import get_current_user
@@ -15,41 +18,113 @@ from common.log_config import get_logger
 
 router = APIRouter(prefix="/chunk")
 
+chunk_setting = get_settings().chunk
+
 
 logger = get_logger(__name__)
 
 
-@router.post("/app/{app_id}")
+@router.post("/app/{app_id}", status_code=202)
 @inject
 async def create_chunk_by_app(
     app_id: str,
     chunk_parameter: ChunkParameterRequest,
-    chunk_service: ChunkService = Depends(Provide[Container.chunk_service]),
+    chunk_job_service: ChunkJobService = Depends(Provide[Container.chunk_job_service]),
     user: User = Depends(get_current_user),
 ):
     try:
-        logger.info(f"Chunk 생성 요청: {user.user_id}-{app_id}")
-        chunk_bulk_create_schema = await chunk_service.create_chunk_by_app(
+        logger.info(f"Chunk 생성 작업 등록 요청: {user.user_id}-{app_id}")
+        chunk_job = await chunk_job_service.create_chunk_job(
             app_id=app_id,
             chunk_parameter=ChunkMapper.to_chunk_parameter_schema(chunk_parameter),
             user_id=user.user_id,
         )
-        logger.info(f"Chunk 생성 완료: {user.user_id} -> app_id: {app_id}")
+        logger.info(
+            f"Chunk 생성 작업 등록 완료: {user.user_id} -> app_id: {app_id}, job_id: {chunk_job.id}"
+        )
 
-        return ChunkMapper.to_chunk_bulk_create_response(chunk_bulk_create_schema)
+        return ChunkMapper.to_chunk_job_response(chunk_job)
 
     except HTTPException as e:
         logger.error(
-            f"Chunk 생성 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {e.detail}"
+            f"Chunk 생성 작업 등록 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {e.detail}"
         )
         raise
     except Exception as e:
         logger.error(
-            f"Chunk 생성 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {str(e)}"
+            f"Chunk 생성 작업 등록 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {str(e)}"
         )
         raise HTTPException(
             status_code=500,
-            detail=f"Chunk 생성 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {str(e)}",
+            detail=f"Chunk 생성 작업 등록 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {str(e)}",
+        )
+
+
+@router.post("/app/{app_id}/lexical-index")
+@inject
+async def rebuild_lexical_index(
+    app_id: str,
+    chunk_service: ChunkService = Depends(Provide[Container.chunk_service]),
+    user: User = Depends(get_current_user),
+):
+    """
+    App의 BM25 역색인을 Mongo에 저장된 청크로 다시 만든다.
+    """
+    try:
+        logger.info(f"역색인 재생성 요청: {user.user_id} -> app_id: {app_id}")
+        chunk_count = await chunk_service.rebuild_lexical_index(
+            app_id=app_id,
+            user_id=user.user_id,
+        )
+        logger.info(
+            f"역색인 재생성 완료: {user.user_id} -> app_id: {app_id}, {chunk_count}건"
+        )
+        return CommonResponse(
+            message=f"{app_id} App의 역색인 재생성 완료",
+            data={"chunk_count": chunk_count},
+        )
+    except HTTPException as e:
+        logger.error(
+            f"역색인 재생성 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {e.detail}"
+        )
+        raise
+    except Exception as e:
+        logger.error(
+            f"역색인 재생성 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {str(e)}"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"역색인 재생성 중 오류 발생: {str(e)}",
+        )
+
+
+@router.get("/job/{job_id}")
+@inject
+async def get_chunk_job(
+    job_id: str,
+    chunk_job_service: ChunkJobService = Depends(Provide[Container.chunk_job_service]),
+    user: User = Depends(get_current_user),
+):
+    try:
+        logger.info(f"Chunk 생성 작업 조회 요청: {user.user_id} -> job_id: {job_id}")
+        chunk_job = await chunk_job_service.get_chunk_job(
+            job_id=job_id,
+            user_id=user.user_id,
+        )
+        logger.info(f"Chunk 생성 작업 조회 완료: {user.user_id} -> job_id: {job_id}")
+        return ChunkMapper.to_chunk_job_response(chunk_job)
+    except HTTPException as e:
+        logger.error(
+            f"Chunk 생성 작업 조회 중 오류 발생: {user.user_id} -> job_id: {job_id}, error: {e.detail}"
+        )
+        raise
+    except Exception as e:
+        logger.error(
+            f"Chunk 생성 작업 조회 중 오류 발생: {user.user_id} -> job_id: {job_id}, error: {str(e)}"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Chunk 생성 작업 조회 중 오류 발생: {str(e)}",
         )
 
 
@@ -121,21 +196,50 @@ async def get_chunk(
 @inject
 async def get_chunk_by_document(
     document_id: str,
+    request: Request,
+    cursor: Optional[str] = Query(
+        default=None, description="이전 응답의 next_cursor (첫 페이지는 생략)"
+    ),
+    limit: int = Query(
+        default=chunk_setting.chunk_page_size_default,
+        ge=1,
+        le=chunk_setting.chunk_page_size_max,
+        description="페이지 크기",
+    ),
+    fields: Optional[List[str]] = Query(
+        default=None, description="조회할 필드 목록 (생략 시 전체 필드)"
+    ),
     chunk_service: ChunkService = Depends(Provide[Container.chunk_service]),
     user: User = Depends(get_current_user),
 ):
+    """
+    Accept: application/x-ndjson 요청 시 limit 없이 cursor 이후 전체 청크를 한 줄씩 스트리밍
+    """
     try:
         logger.info(
-            f"Document의 Chunk 조회 요청: {user.user_id} -> document_id: {document_id}"
+            f"Document의 Chunk 조회 요청: {user.user_id} -> document_id: {document_id}, cursor: {cursor}"
         )
-        chunk_list = await chunk_service.get_chunk_by_document_id(
+
+        if accepts_ndjson(request):
+            chunk_stream = await chunk_service.stream_chunk_by_document_id(
+                document_id=document_id,
+                user_id=user.user_id,
+                cursor=cursor,
+                fields=fields,
+            )
+            return ndjson_response(chunk_stream, ChunkMapper.to_chunk_dict)
+
+        chunk_page = await chunk_service.get_chunk_page_by_document_id(
             document_id=document_id,
             user_id=user.user_id,
+            cursor=cursor,
+            limit=limit,
+            fields=fields,
         )
         logger.info(
             f"Document의 Chunk 조회 완료: {user.user_id} -> document_id: {document_id}"
         )
-        return [ChunkMapper.to_chunk_response(chunk) for chunk in chunk_list]
+        return ChunkMapper.to_chunk_page_response(chunk_page)
     except HTTPException as e:
         logger.error(
             f"Document의 Chunk 조회 중 오류 발생: {user.user_id} -> document_id: {document_id}, error: {e.detail}"
@@ -1,11 +1,30 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
+from chunks.domain.model.chunk_schema import ChunkLengthUnit
 from common.dto import LifeCycleResponse
+from config import get_settings
+
+chunk_setting = get_settings().chunk
 
 
 class ChunkParameterRequest(BaseModel):
     chunk_size: int = Field(default=250, description="청크 크기")
     chunk_overlap: int = Field(default=20, description="청크 중복")
+    length_unit: ChunkLengthUnit = Field(
+        default=ChunkLengthUnit.CHARACTER,
+        description="chunk_size/chunk_overlap의 단위 (character: 글자 수, token: 토큰 수)",
+    )
+    max_parallel_documents: int = Field(
+        default=1,
+        ge=1,
+        le=chunk_setting.chunk_max_parallel_documents,
+        description="App 단위 청크 생성 시 동시에 처리할 최대 문서 수",
+    )
+    incremental: bool = Field(
+        default=False,
+        description="기존 청크와 비교하여 변경된 청크만 생성/삭제",
+    )
 
 
 class ChunkResponse(LifeCycleResponse):
@@ -21,20 +40,33 @@ class ChunkResponse(LifeCycleResponse):
         populate_by_name = True
 
 
-class ChunkCreateSuccessResponse(BaseModel):
-    document_id: str = Field(..., description="문서 ID")
-    chunk_list: List[ChunkResponse] = Field(..., description="청크 리스트")
+class ChunkPageResponse(BaseModel):
+    chunk_list: List[Dict[str, Any]] = Field(
+        default=[], description="요청한 필드만 포함된 청크 목록"
+    )
+    next_cursor: Optional[str] = Field(
+        default=None, description="다음 페이지 커서, 마지막 페이지이면 null"
+    )
 
 
-class ChunkCreateErrorResponse(BaseModel):
+class ChunkJobDocumentResponse(BaseModel):
     document_id: str = Field(..., description="문서 ID")
-    error: str = Field(..., description="청크 생성 실패 이유")
+    status: str = Field(..., description="문서 처리 상태")
+    chunk_count: int = Field(..., description="생성된 청크 수")
+    error: Optional[str] = Field(default=None, description="청크 생성 실패 이유")
 
 
-class ChunkBulkCreateResponse(BaseModel):
-    success_document_list: List[ChunkCreateSuccessResponse] = Field(
-        default=[], description="성공한 문서 리스트"
-    )
-    error_document_list: List[ChunkCreateErrorResponse] = Field(
-        default=[], description="실패한 문서 리스트"
+class ChunkJobResponse(LifeCycleResponse):
+    id: str = Field(..., description="작업 ID")
+    app_id: str = Field(..., description="APP ID")
+    status: str = Field(..., description="작업 상태")
+    total_count: int = Field(..., description="전체 문서 수")
+    processed_count: int = Field(..., description="처리가 끝난 문서 수")
+    success_count: int = Field(..., description="청크 생성에 성공한 문서 수")
+    error_count: int = Field(..., description="청크 생성에 실패한 문서 수")
+    document_list: List[ChunkJobDocumentResponse] = Field(
+        default=[], description="문서별 처리 현황"
     )
+    error: Optional[str] = Field(default=None, description="작업 실패 이유")
+    started_at: Optional[datetime] = Field(default=None, description="작업 시작 일시")
+    finished_at: Optional[datetime] = Field(default=None, description="작업 종료 일시")
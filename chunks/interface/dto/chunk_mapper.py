@@ -1,14 +1,18 @@
+from typing import Any, Dict
+from bson import ObjectId
+from chunks.domain.model.chunk_job_schema import (
+    ChunkJobDocumentSchema,
+    ChunkJobSchema,
+)
 from chunks.domain.model.chunk_schema import (
-    ChunkBulkCreateSchema,
-    ChunkCreateErrorSchema,
-    ChunkCreateSuccessSchema,
+    ChunkPageSchema,
     ChunkParameterSchema,
     ChunkSchema,
 )
 from chunks.interface.dto.chunk_dto import (
-    ChunkBulkCreateResponse,
-    ChunkCreateErrorResponse,
-    ChunkCreateSuccessResponse,
+    ChunkJobDocumentResponse,
+    ChunkJobResponse,
+    ChunkPageResponse,
     ChunkParameterRequest,
     ChunkResponse,
 )
@@ -23,6 +27,9 @@ class ChunkMapper:
         return ChunkParameterSchema(
             chunk_size=request.chunk_size,
             chunk_overlap=request.chunk_overlap,
+            length_unit=request.length_unit,
+            max_parallel_documents=request.max_parallel_documents,
+            incremental=request.incremental,
         )
 
     @staticmethod
@@ -44,37 +51,62 @@ class ChunkMapper:
         )
 
     @staticmethod
-    def to_chunk_create_success_response(
-        chunk_create_success_schema: ChunkCreateSuccessSchema,
-    ) -> ChunkCreateSuccessResponse:
-        return ChunkCreateSuccessResponse(
-            document_id=get_str_id(chunk_create_success_schema.document_id),
+    def to_chunk_dict(
+        raw: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        # projection된 Mongo 문서를 응답 형태(id, str ID)로 변환
+        chunk = {"id": get_str_id(raw["_id"])}
+        for key, value in raw.items():
+            if key == "_id":
+                continue
+            chunk[key] = get_str_id(value) if isinstance(value, ObjectId) else value
+        return chunk
+
+    @staticmethod
+    def to_chunk_page_response(
+        chunk_page: ChunkPageSchema,
+    ) -> ChunkPageResponse:
+        return ChunkPageResponse(
             chunk_list=[
-                ChunkMapper.to_chunk_response(chunk)
-                for chunk in chunk_create_success_schema.chunk_list
+                ChunkMapper.to_chunk_dict(raw) for raw in chunk_page.chunk_list
             ],
+            next_cursor=(
+                get_str_id(chunk_page.next_cursor) if chunk_page.next_cursor else None
+            ),
         )
 
     @staticmethod
-    def to_chunk_create_error_response(
-        chunk_create_error_schema: ChunkCreateErrorSchema,
-    ) -> ChunkCreateErrorResponse:
-        return ChunkCreateErrorResponse(
-            document_id=get_str_id(chunk_create_error_schema.document_id),
-            error=chunk_create_error_schema.error,
+    def to_chunk_job_document_response(
+        job_document: ChunkJobDocumentSchema,
+    ) -> ChunkJobDocumentResponse:
+        return ChunkJobDocumentResponse(
+            document_id=get_str_id(job_document.document_id),
+            status=job_document.status,
+            chunk_count=job_document.chunk_count,
+            error=job_document.error,
         )
 
     @staticmethod
-    def to_chunk_bulk_create_response(
-        chunk_bulk_create_schema: ChunkBulkCreateSchema,
-    ) -> ChunkBulkCreateResponse:
-        return ChunkBulkCreateResponse(
-            success_document_list=[
-                ChunkMapper.to_chunk_create_success_response(schema)
-                for schema in chunk_bulk_create_schema.success_document_list
-            ],
-            error_document_list=[
-                ChunkMapper.to_chunk_create_error_response(schema)
-                for schema in chunk_bulk_create_schema.error_document_list
+    def to_chunk_job_response(
+        job: ChunkJobSchema,
+    ) -> ChunkJobResponse:
+        return ChunkJobResponse(
+            id=get_str_id(job.id),
+            app_id=get_str_id(job.app_id),
+            status=job.status,
+            total_count=job.total_count,
+            processed_count=job.success_count + job.error_count,
+            success_count=job.success_count,
+            error_count=job.error_count,
+            document_list=[
+                ChunkMapper.to_chunk_job_document_response(job_document)
+                for job_document in job.document_list
             ],
+            error=job.error,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            creator=job.creator,
+            updater=job.updater,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
         )
@@ -0,0 +1,35 @@
+import asyncio
+
+
+class ConcurrencyLimiter:
+    """
+    동시에 실행할 수 있는 요청 수를 max_concurrency로 제한한다.
+    acquire_timeout(초) 안에 자리가 나지 않으면 TimeoutError를 발생시켜
+    대기열이 무한히 쌓이지 않도록 한다.
+    """
+
+    def __init__(self, max_concurrency: int, acquire_timeout: float):
+        self.max_concurrency = max_concurrency
+        self.acquire_timeout = acquire_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.waiting = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self.max_concurrency - self._semaphore._value
+
+    async def acquire(self) -> None:
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(
+                self._semaphore.acquire(), timeout=self.acquire_timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"동시 실행 제한({self.max_concurrency}건)으로 {self.acquire_timeout}초 동안 대기했습니다."
+            )
+        finally:
+            self.waiting -= 1
+
+    def release(self) -> None:
+        self._semaphore.release()
@@ -0,0 +1,34 @@
+import math
+from collections import deque
+from typing import Deque, Dict
+
+
+class LatencyTracker:
+    """
+    최근 window건의 처리 시간(초)을 보관하고 백분위(ms)를 계산한다.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentiles(self, *percents: int) -> Dict[str, float]:
+        """
+        nearest-rank 방식의 백분위. ex) percentiles(50, 95) -> {"p50": 1.2, "p95": 3.4}
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {f"p{percent}": 0.0 for percent in percents}
+
+        return {
+            f"p{percent}": samples[
+                min(
+                    len(samples) - 1,
+                    max(0, math.ceil(percent / 100 * len(samples)) - 1),
+                )
+            ]
+            * 1000
+            for percent in percents
+        }
@@ -0,0 +1,39 @@
+import json
+from typing import Any, AsyncIterator, Callable
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from common.log_config import get_logger
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+logger = get_logger(__name__)
+
+
+def accepts_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(
+    records: AsyncIterator[Any],
+    serialize: Callable[[Any], Any],
+) -> StreamingResponse:
+    """
+    records를 한 줄에 하나의 JSON으로 변환하며 바로 흘려보내는 응답.
+    전체 목록을 메모리에 올리지 않으며, 첫 레코드가 조회되는 즉시 전송을 시작한다.
+    """
+
+    async def _generate():
+        try:
+            async for record in records:
+                yield (
+                    json.dumps(jsonable_encoder(serialize(record)), ensure_ascii=False)
+                    + "\n"
+                )
+        except Exception as e:
+            # 스트리밍 도중에는 상태 코드를 바꿀 수 없으므로 로그만 남기고 종료
+            logger.error(f"[NDJSON] 스트리밍 중 오류 발생: {e}")
+            raise
+
+    return StreamingResponse(_generate(), media_type=NDJSON_MEDIA_TYPE)
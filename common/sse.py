@@ -0,0 +1,43 @@
+import json
+from typing import Any, AsyncIterator, Callable, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from common.log_config import get_logger
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+logger = get_logger(__name__)
+
+
+def format_sse(event: str, data: Any) -> str:
+    return (
+        f"event: {event}\n"
+        f"data: {json.dumps(jsonable_encoder(data), ensure_ascii=False)}\n\n"
+    )
+
+
+def sse_response(
+    records: AsyncIterator[Any],
+    serialize: Callable[[Any], Tuple[str, Any]],
+) -> StreamingResponse:
+    """
+    records를 (event, data)로 변환하여 Server-Sent Events로 흘려보내는 응답.
+    프록시 버퍼링을 끄므로 생성되는 즉시 클라이언트에 전달된다.
+    """
+
+    async def _generate():
+        try:
+            async for record in records:
+                yield format_sse(*serialize(record))
+        except Exception as e:
+            # 스트리밍 도중에는 상태 코드를 바꿀 수 없으므로 error 이벤트로 알리고 종료
+            logger.error(f"[SSE] 스트리밍 중 오류 발생: {e}")
+            yield format_sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        _generate(),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,8 +1,13 @@
 from functools import lru_cache
 
+from config.chunk_setting import ChunkSetting
+from config.document_setting import DocumentSetting
+from config.embedding_setting import EmbeddingSetting
 from config.haiqv_setting import HaiqvSetting
 from config.jwt_setting import JWTSetting
+from config.llm_setting import LLMSetting
 from config.mongo_setting import MongoSetting
+from config.search_setting import SearchSetting
 from config.milvus_setting import MilvusSetting
 
 
@@ -12,6 +17,11 @@ class Settings:
         self.jwt = JWTSetting()
         self.haiqv = HaiqvSetting()
         self.milvus = MilvusSetting()
+        self.chunk = ChunkSetting()
+        self.document = DocumentSetting()
+        self.embedding = EmbeddingSetting()
+        self.search = SearchSetting()
+        self.llm = LLMSetting()
 
 
 @lru_cache()
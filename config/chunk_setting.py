@@ -0,0 +1,23 @@
+from config.setting import BaseAppSettings
+
+
+class ChunkSetting(BaseAppSettings):
+    chunking_pool_size: int = 2
+    chunking_timeout_sec: float = 600.0
+    chunking_start_method: str = "spawn"
+    chunk_job_worker_count: int = 2
+    chunk_max_parallel_documents: int = 8  # App 단위 청크 생성 시 동시에 처리할 문서 수 상한
+    # heartbeat가 이 시간 이상 끊긴 running 작업만 다른 worker가 회수
+    chunk_job_lease_sec: float = 300.0
+    chunk_job_heartbeat_sec: float = 60.0
+    chunk_page_size_default: int = 100
+    chunk_page_size_max: int = 1000
+    markdown_cache_enabled: bool = True
+    markdown_cache_dir: str = "./cache/markdown"
+    markdown_cache_max_bytes: int = 512 * 1024 * 1024
+    markdown_cache_max_entries: int = 1000
+    chunking_page_window: int = 50
+    chunking_parallel_windows: int = 1
+    chunk_tokenizer_path: str = ""  # 임베딩 모델의 tokenizer.json 경로, 비어 있으면 근사치
+    token_count_cache_size: int = 4096
+    token_count_cache_max_chars: int = 2048
@@ -0,0 +1,5 @@
+from config.setting import BaseAppSettings
+
+
+class DocumentSetting(BaseAppSettings):
+    document_upload_concurrency: int = 8
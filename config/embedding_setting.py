@@ -0,0 +1,12 @@
+from config.setting import BaseAppSettings
+
+
+class EmbeddingSetting(BaseAppSettings):
+    embedding_enabled: bool = True
+    embedding_model: str = "kure"  # kure | nomic
+    embedding_batch_size: int = 64
+    embedding_concurrency: int = 4
+    vector_backend: str = "milvus"  # milvus | memory
+    embedding_cache_size: int = 10000
+    embedding_cache_persistent: bool = True
+    embedding_cache_ttl_days: int = 30
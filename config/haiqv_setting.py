@@ -8,3 +8,9 @@ class HaiqvSetting(BaseAppSettings):
     haiqv_embed_kure_model: str
     haiqv_embed_nomic_url: str
     haiqv_embed_nomic_model: str
+    haiqv_embed_max_batch_size: int = 32
+    haiqv_embed_max_in_flight: int = 4
+    haiqv_embed_max_retries: int = 3
+    haiqv_embed_backoff_sec: float = 0.5
+    haiqv_embed_timeout_sec: float = 60.0
+    haiqv_embed_max_connections: int = 16
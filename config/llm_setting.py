@@ -0,0 +1,17 @@
+from config.setting import BaseAppSettings
+
+
+class LLMSetting(BaseAppSettings):
+    # haiqv: HaiQV Ollama proxy, fake: 네트워크 없이 동작하는 로컬 테스트용 LLM
+    llm_backend: str = "haiqv"
+    llm_fake_token_delay_sec: float = 0.0
+    rag_top_k_default: int = 5
+    rag_context_max_chars: int = 6000
+    rag_metrics_window: int = 1000
+    # 동시에 HaiQV로 보낼 수 있는 LLM 요청 수와 자리 대기/생성 제한 시간(초)
+    llm_max_concurrency: int = 4
+    llm_acquire_timeout_sec: float = 10.0
+    llm_timeout_sec: float = 120.0
+    llm_cache_enabled: bool = True
+    llm_cache_size: int = 1000
+    llm_cache_ttl_sec: float = 3600.0
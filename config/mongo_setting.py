@@ -15,3 +15,6 @@ class MongoSetting(BaseAppSettings):
     server_selection_timeout_ms: int
     reload_period: int
     query_string: str
+    bulk_write_batch_size: int = 1000
+    bulk_delete_batch_size: int = 10000
+    cursor_batch_size: int = 500
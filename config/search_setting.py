@@ -0,0 +1,14 @@
+from config.setting import BaseAppSettings
+
+
+class SearchSetting(BaseAppSettings):
+    search_top_k_default: int = 5
+    search_top_k_max: int = 100
+    search_latency_window: int = 1000
+    lexical_index_enabled: bool = True
+    lexical_index_dir: str = "./cache/lexical"
+    lexical_compaction_threshold: int = 10000
+    bm25_k1: float = 1.2
+    bm25_b: float = 0.75
+    search_rrf_k: int = 60
+    search_hybrid_candidate_factor: int = 4
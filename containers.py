@@ -3,16 +3,43 @@ from dependency_injector import containers, providers
 from app.application.app_service import AppService
 
 from app.infra.app_repository_impl import AppRepository
+from chunks.application.chunk_job_service import ChunkJobService
+from chunks.application.chunk_job_worker import ChunkJobWorker
 from chunks.application.chunk_service import ChunkService
 from chunks.application.image_service import ImageService
+from chunks.infra.chunk_job_queue_impl import LocalChunkJobQueue
+from chunks.infra.chunk_job_repository_impl import ChunkJobRepository
 from chunks.infra.chunk_repository_impl import ChunkRepository
 from chunks.infra.image_repository_impl import ImageRepository
+from config import get_settings
 from database.mongo import get_async_mongo_client
 from document.application.document_service import DocumentService
 from document.infra.document_repository_impl import DocumentRepository
+from embed.application.embedding_service import EmbeddingService
+from embed.infra.embedding_cache_repository_impl import EmbeddingCacheRepository
+from embed.infra.memory_vector_repository_impl import MemoryVectorRepository
+from embed.infra.milvus_vector_repository_impl import MilvusVectorRepository
+from embed.wrapper.cached_embedding import CachedEmbeddings
+from embed.wrapper.haiqv_kure_embedding import HaiqvKureEmbedding
+from embed.wrapper.haiqv_nomic_embedding import HaiqvNomicEmbedding
+from common.concurrency import ConcurrencyLimiter
+from common.latency import LatencyTracker
+from llm.application.llm_response_cache import LLMResponseCache
 from llm.application.llm_service import LLMService
+from llm.infra.repository.fake_llm_repository_impl import FakeLLMRepository
 from llm.infra.repository.llm_repository_impl import HaiqvLLMRepository
+from search.application.lexical_index_service import LexicalIndexService
+from search.application.rag_service import RAGService
+from search.application.search_service import SearchService
+from search.infra.bm25_index_repository_impl import BM25IndexRepository
 from user.application.token_service import TokenService
+from utils.chunking_executor import ChunkingExecutor
+
+chunk_setting = get_settings().chunk
+document_setting = get_settings().document
+embedding_setting = get_settings().embedding
+search_setting = get_settings().search
+llm_setting = get_settings().llm
 
 
 class Container(containers.DeclarativeContainer):
@@ -23,6 +50,8 @@ class Container(containers.DeclarativeContainer):
             "document",
             "chunks",
             "llm",
+            "embed",
+            "search",
         ],
     )
 
@@ -51,6 +80,7 @@ class Container(containers.DeclarativeContainer):
         DocumentService,
         app_service=app_service,
         document_repository=document_repository,
+        upload_concurrency=document_setting.document_upload_concurrency,
     )
 
     chunk_repository = providers.Factory(
@@ -69,17 +99,151 @@ class Container(containers.DeclarativeContainer):
         chunk_repository=chunk_repository,
     )
 
+    chunking_executor = providers.Singleton(ChunkingExecutor)
+
+    base_embedder = providers.Selector(
+        providers.Object(embedding_setting.embedding_model),
+        kure=providers.Singleton(HaiqvKureEmbedding),
+        nomic=providers.Singleton(HaiqvNomicEmbedding),
+    )
+
+    embedding_cache_repository = providers.Factory(
+        EmbeddingCacheRepository,
+        mongo_client,
+    )
+
+    embedder = providers.Singleton(
+        CachedEmbeddings,
+        embedder=base_embedder,
+        cache_repository=(
+            embedding_cache_repository
+            if embedding_setting.embedding_cache_persistent
+            else None
+        ),
+        cache_size=embedding_setting.embedding_cache_size,
+    )
+
+    vector_repository = providers.Selector(
+        providers.Object(embedding_setting.vector_backend),
+        milvus=providers.Singleton(MilvusVectorRepository),
+        memory=providers.Singleton(MemoryVectorRepository),
+    )
+
+    embedding_service = providers.Factory(
+        EmbeddingService,
+        embedder=embedder,
+        vector_repository=vector_repository,
+        batch_size=embedding_setting.embedding_batch_size,
+        concurrency=embedding_setting.embedding_concurrency,
+        enabled=embedding_setting.embedding_enabled,
+    )
+
+    lexical_index_repository = providers.Singleton(
+        BM25IndexRepository,
+        index_dir=search_setting.lexical_index_dir,
+        k1=search_setting.bm25_k1,
+        b=search_setting.bm25_b,
+        compaction_threshold=search_setting.lexical_compaction_threshold,
+    )
+
+    lexical_index_service = providers.Factory(
+        LexicalIndexService,
+        lexical_index_repository=lexical_index_repository,
+        enabled=search_setting.lexical_index_enabled,
+    )
+
     chunk_service = providers.Factory(
         ChunkService,
         app_service=app_service,
         document_service=document_service,
         image_service=image_service,
         chunk_repository=chunk_repository,
+        chunking_executor=chunking_executor,
+        embedding_service=embedding_service,
+        lexical_index_service=lexical_index_service,
+        page_window=chunk_setting.chunking_page_window,
+        parallel_windows=chunk_setting.chunking_parallel_windows,
+        max_parallel_documents=chunk_setting.chunk_max_parallel_documents,
+    )
+
+    chunk_job_repository = providers.Factory(
+        ChunkJobRepository,
+        mongo_client,
+    )
+
+    chunk_job_queue = providers.Singleton(LocalChunkJobQueue)
+
+    chunk_job_service = providers.Factory(
+        ChunkJobService,
+        app_service=app_service,
+        document_service=document_service,
+        chunk_job_repository=chunk_job_repository,
+        chunk_job_queue=chunk_job_queue,
+    )
+
+    chunk_job_worker = providers.Singleton(
+        ChunkJobWorker,
+        chunk_job_queue=chunk_job_queue,
+        chunk_job_repository=chunk_job_repository,
+        chunk_service_factory=chunk_service.provider,
+        worker_count=chunk_setting.chunk_job_worker_count,
+        lease_sec=chunk_setting.chunk_job_lease_sec,
+        heartbeat_sec=chunk_setting.chunk_job_heartbeat_sec,
+    )
+
+    search_service = providers.Factory(
+        SearchService,
+        app_service=app_service,
+        embedding_service=embedding_service,
+        lexical_index_service=lexical_index_service,
+        chunk_repository=chunk_repository,
+        rrf_k=search_setting.search_rrf_k,
+        hybrid_candidate_factor=search_setting.search_hybrid_candidate_factor,
     )
 
-    llm_repository = providers.Singleton(HaiqvLLMRepository)
+    search_latency_tracker = providers.Singleton(
+        LatencyTracker,
+        window=search_setting.search_latency_window,
+    )
+
+    llm_repository = providers.Selector(
+        providers.Object(llm_setting.llm_backend),
+        haiqv=providers.Singleton(HaiqvLLMRepository),
+        fake=providers.Singleton(
+            FakeLLMRepository,
+            token_delay=llm_setting.llm_fake_token_delay_sec,
+        ),
+    )
+
+    llm_limiter = providers.Singleton(
+        ConcurrencyLimiter,
+        max_concurrency=llm_setting.llm_max_concurrency,
+        acquire_timeout=llm_setting.llm_acquire_timeout_sec,
+    )
+
+    llm_response_cache = providers.Singleton(
+        LLMResponseCache,
+        maxsize=llm_setting.llm_cache_size,
+        ttl=llm_setting.llm_cache_ttl_sec,
+    )
 
     llm_service = providers.Factory(
         LLMService,
         llm_repository=llm_repository,
+        limiter=llm_limiter,
+        timeout=llm_setting.llm_timeout_sec,
+        response_cache=(llm_response_cache if llm_setting.llm_cache_enabled else None),
+    )
+
+    rag_ttft_tracker = providers.Singleton(
+        LatencyTracker,
+        window=llm_setting.rag_metrics_window,
+    )
+
+    rag_service = providers.Factory(
+        RAGService,
+        search_service=search_service,
+        llm_service=llm_service,
+        ttft_tracker=rag_ttft_tracker,
+        context_max_chars=llm_setting.rag_context_max_chars,
     )
@@ -1,4 +1,3 @@
-from langchain_community.vectorstores import Milvus
 from pymilvus import connections
 
 from config import get_settings
@@ -9,8 +8,16 @@ MILVUS_HOST = milvus_setting.milvus_host
 MILVUS_PORT = milvus_setting.milvus_port
 MILVUS_ALIAS = milvus_setting.milvus_alias
 
-connections.connect(
-    alias=MILVUS_ALIAS,
-    host=MILVUS_HOST,
-    port=MILVUS_PORT,
-)
+
+def get_milvus_alias() -> str:
+    """
+    Milvus 연결을 보장하고 connection alias를 반환한다.
+    import 시점이 아닌 첫 사용 시점에 연결한다.
+    """
+    if not connections.has_connection(MILVUS_ALIAS):
+        connections.connect(
+            alias=MILVUS_ALIAS,
+            host=MILVUS_HOST,
+            port=MILVUS_PORT,
+        )
+    return MILVUS_ALIAS
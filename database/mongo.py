@@ -1,4 +1,5 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from typing import Any, Dict, List
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
 from config import get_settings
 
 CHAT_DB_CONFIG = get_settings().mongo
@@ -12,6 +13,9 @@ CTS = CHAT_DB_CONFIG.connection_timeout_ms
 STS = CHAT_DB_CONFIG.socket_timeout_ms
 SSTS = CHAT_DB_CONFIG.server_selection_timeout_ms
 QUERY_STRING = CHAT_DB_CONFIG.query_string
+BULK_WRITE_BATCH_SIZE = CHAT_DB_CONFIG.bulk_write_batch_size
+BULK_DELETE_BATCH_SIZE = CHAT_DB_CONFIG.bulk_delete_batch_size
+CURSOR_BATCH_SIZE = CHAT_DB_CONFIG.cursor_batch_size
 
 
 def get_async_mongo_client() -> AsyncIOMotorClient:
@@ -22,3 +26,39 @@ def get_async_mongo_client() -> AsyncIOMotorClient:
         socketTimeoutMS=STS,
         serverSelectionTimeoutMS=SSTS,
     )
+
+
+async def insert_many_in_batches(
+    collection: AsyncIOMotorCollection,
+    documents: List[Dict[str, Any]],
+    batch_size: int = BULK_WRITE_BATCH_SIZE,
+) -> int:
+    """
+    documents를 batch_size 단위로 나누어 unordered insert_many로 저장한다.
+    """
+    inserted = 0
+    for start in range(0, len(documents), batch_size):
+        result = await collection.insert_many(
+            documents[start : start + batch_size],
+            ordered=False,
+        )
+        inserted += len(result.inserted_ids)
+    return inserted
+
+
+async def delete_many_in_batches(
+    collection: AsyncIOMotorCollection,
+    field: str,
+    values: List[Any],
+    batch_size: int = BULK_DELETE_BATCH_SIZE,
+) -> int:
+    """
+    field 값이 values에 포함되는 문서를 batch_size 단위의 $in 조건으로 삭제한다.
+    """
+    deleted = 0
+    for start in range(0, len(values), batch_size):
+        result = await collection.delete_many(
+            {field: {"$in": values[start : start + batch_size]}}
+        )
+        deleted += result.deleted_count
+    return deleted
@@ -0,0 +1,105 @@
+from typing import Dict, List
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, IndexModel
+
+from common.log_config import get_logger
+from config import get_settings
+
+DB = get_settings().mongo.mongodb_db
+EMBEDDING_CACHE_TTL_SEC = get_settings().embedding.embedding_cache_ttl_days * 86400
+
+logger = get_logger(__name__)
+
+# 컬렉션별 조회 경로에 필요한 인덱스 선언
+# document.app_id 단독 조회는 (app_id, hash, size) 복합 인덱스의 prefix로 처리됨
+INDEXES: Dict[str, List[IndexModel]] = {
+    "app": [
+        IndexModel([("app_name", ASCENDING)], name="app_name_unique", unique=True),
+        IndexModel([("creator", ASCENDING)], name="creator"),
+    ],
+    "document": [
+        IndexModel(
+            [("app_id", ASCENDING), ("hash", ASCENDING), ("size", ASCENDING)],
+            name="app_id_hash_size_unique",
+            unique=True,
+        ),
+    ],
+    "chunk": [
+        # document_id 조회 + _id keyset 페이지네이션
+        IndexModel(
+            [("document_id", ASCENDING), ("_id", ASCENDING)],
+            name="document_id__id",
+        ),
+    ],
+    "image": [
+        IndexModel([("chunk_id", ASCENDING)], name="chunk_id"),
+    ],
+    "chunk_job": [
+        # 시작 시 pending 작업 조회 + lease(updated_at)가 만료된 running 작업 회수
+        IndexModel(
+            [("status", ASCENDING), ("updated_at", ASCENDING)],
+            name="status_updated_at",
+        ),
+    ],
+    "embedding_cache": [
+        # 같은 텍스트라도 질의(query)와 문서(document) 임베딩은 별도 항목
+        IndexModel(
+            [("model", ASCENDING), ("kind", ASCENDING), ("text_hash", ASCENDING)],
+            name="model_kind_text_hash_unique",
+            unique=True,
+        ),
+        # 저장 후 TTL이 지난 임베딩은 Mongo가 삭제 (이후 요청 시 재임베딩)
+        # 이미 생성된 인덱스의 TTL 변경은 collMod로 직접 반영해야 함
+        IndexModel(
+            [("created_at", ASCENDING)],
+            name="created_at_ttl",
+            expireAfterSeconds=EMBEDDING_CACHE_TTL_SEC,
+        ),
+    ],
+}
+
+# 선언에서 제외되어 삭제해야 하는 인덱스 (새 인덱스와 충돌하는 unique 인덱스 등)
+# kind 필드가 없는 기존 embedding_cache 항목은 조회되지 않고 TTL로 정리됨
+OBSOLETE_INDEXES: Dict[str, List[str]] = {
+    "embedding_cache": ["model_text_hash_unique"],
+}
+
+
+async def ensure_indexes(mongo_client: AsyncIOMotorClient) -> None:
+    """
+    선언된 인덱스 중 없는 인덱스를 생성하고, 선언되지 않은 인덱스는 로그로 보고한다.
+    OBSOLETE_INDEXES에 등록된 인덱스는 생성 전에 삭제한다.
+    이미 존재하는 인덱스는 건드리지 않으므로 여러 번 실행해도 안전하다.
+    """
+    db = mongo_client[DB]
+
+    for collection_name, index_list in INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+
+        for index_name in OBSOLETE_INDEXES.get(collection_name, []):
+            if index_name not in existing:
+                continue
+            logger.info(f"[Index] {collection_name}: 인덱스 삭제 {index_name}")
+            try:
+                await collection.drop_index(index_name)
+                del existing[index_name]
+            except Exception as e:
+                logger.error(f"[Index] {collection_name}: 인덱스 삭제 실패 - {e}")
+
+        declared_names = {index.document["name"] for index in index_list}
+        missing = [
+            index for index in index_list if index.document["name"] not in existing
+        ]
+        extra = sorted(set(existing) - declared_names - {"_id_"})
+
+        if missing:
+            missing_names = [index.document["name"] for index in missing]
+            logger.info(f"[Index] {collection_name}: 인덱스 생성 {missing_names}")
+            try:
+                await collection.create_indexes(missing)
+            except Exception as e:
+                logger.error(f"[Index] {collection_name}: 인덱스 생성 실패 - {e}")
+
+        if extra:
+            logger.info(f"[Index] {collection_name}: 선언되지 않은 인덱스 {extra}")
@@ -1,5 +1,7 @@
+import asyncio
 import os
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
+from bson import ObjectId
 from fastapi import HTTPException, UploadFile
 from app.application.app_service import AppService
 from document.domain.model.document_schema import (
@@ -10,15 +12,19 @@ from document.domain.model.document_schema import (
 )
 from document.domain.repository.document_repository import IDocumentRepository
 from utils.file_utils import (
-    compute_file_hash,
+    commit_temp_file,
     delete_file,
+    discard_temp_file,
     rename_file,
-    save_file,
+    save_temp_file_with_hash,
 )
 from dependency_injector.wiring import inject
 
+from common.log_config import get_logger
 from utils.object import get_object_id, get_str_id
 
+logger = get_logger(__name__)
+
 
 class DocumentService:
 
@@ -27,9 +33,11 @@ class DocumentService:
         self,
         app_service: AppService,
         document_repository: IDocumentRepository,
+        upload_concurrency: int = 8,
     ):
         self.app_service = app_service
         self.document_repository = document_repository
+        self.upload_concurrency = upload_concurrency
 
     async def create_document(
         self,
@@ -49,70 +57,168 @@ class DocumentService:
 
         existing_app = await self.app_service.get_app(app_id)
 
-        success_list = []
-        error_list = []
-
-        for file in file_list:
+        semaphore = asyncio.Semaphore(self.upload_concurrency)
 
-            try:
-                filename = file.filename or "No name"
-                parts = filename.rsplit(".", 1)
-                source = parts[-1] if len(parts) == 2 else "etc"
+        async def _stage(file: UploadFile) -> Tuple[DocumentSchema, str]:
+            filename = file.filename or "No name"
+            parts = filename.rsplit(".", 1)
+            source = parts[-1] if len(parts) == 2 else "etc"
 
-                hash = await compute_file_hash(file)
-
-                existing_file = await self.document_repository.exist_document(
-                    app_id=existing_app.id,
-                    hash=hash,
-                    size=file.size,
+            async with semaphore:
+                temp_path, hash, size = await save_temp_file_with_hash(
+                    file,
+                    f"{existing_app.app_name}/{source}",  # APP/Source ex) TEST/pdf
                 )
 
-                if existing_file:
-                    raise HTTPException(
-                        status_code=409,
-                        detail="App에 이미 존재하는 문서입니다.",
-                    )
-
+            try:
                 document = DocumentSchema(
                     name=filename,
                     hash=hash,
-                    size=file.size,
+                    size=size,
                     type=file.content_type,
                     extension=source,
                     app_id=existing_app.id,
                     creator=user_id,
                 )
+            except Exception:
+                discard_temp_file(temp_path)
+                raise
 
-                try:
-                    file_path = await save_file(
-                        file,
-                        f"{existing_app.app_name}/{source}",
-                    )  # APP/Source ex) TEST/pdf, TEST/excel, ...
-                except OSError as e:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"파일 시스템 오류: {str(e)}",
-                    )
+            return document, temp_path
 
-                document.file_path = file_path
-                document = await self.document_repository.create_document(document)
-                success_list.append(document)
+        # 1. 파일 저장과 해시 계산을 최대 upload_concurrency개씩 동시에 수행
+        stage_result_list = await asyncio.gather(
+            *[_stage(file) for file in file_list],
+            return_exceptions=True,
+        )
+
+        staged_list: List[Tuple[DocumentSchema, str]] = []
+        stage_error: Optional[BaseException] = None
+
+        for result in stage_result_list:
+            if isinstance(result, BaseException):
+                stage_error = stage_error or result
+            else:
+                staged_list.append(result)
+
+        if stage_error is not None:
+            for _, temp_path in staged_list:
+                discard_temp_file(temp_path)
+
+            if isinstance(stage_error, OSError):
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"파일 시스템 오류: {str(stage_error)}",
+                )
+            raise stage_error
 
-            except HTTPException as e:
-                if e.status_code == 500:
-                    raise
+        # 2. (hash, size) 기준 중복 여부를 한 번의 쿼리로 조회
+        existing_key_set = await self.document_repository.get_existing_document_keys(
+            app_id=existing_app.id,
+            key_list=[(document.hash, document.size) for document, _ in staged_list],
+        )
+
+        success_list: List[DocumentSchema] = []
+        error_list: List[DocumentErrorSchema] = []
+
+        try:
+            for document, temp_path in staged_list:
+                key = (document.hash, document.size)
 
-                if e.status_code == 409:
+                if key in existing_key_set:
+                    discard_temp_file(temp_path)
                     error_list.append(
                         DocumentErrorSchema(
-                            name=file.filename,
-                            error=str(e.detail),
+                            name=document.name,
+                            error="App에 이미 존재하는 문서입니다.",
                         )
                     )
                     continue
 
+                # 같은 요청 안에서 중복된 파일도 한 번만 저장
+                existing_key_set.add(key)
+
+                document.file_path = commit_temp_file(
+                    temp_path,
+                    f"{existing_app.app_name}/{document.extension}",
+                    document.name,
+                )
+                success_list.append(document)
+
+        except OSError as e:
+            for _, temp_path in staged_list:
+                discard_temp_file(temp_path)
+            await self._cleanup_committed_files(success_list)
+
+            raise HTTPException(
+                status_code=500,
+                detail=f"파일 시스템 오류: {str(e)}",
+            )
+
+        # 3. 신규 문서를 insert_many로 일괄 저장
+        if success_list:
+            try:
+                success_list, duplicated_list = (
+                    await self.document_repository.create_documents_bulk(success_list)
+                )
+            except Exception:
+                await self._cleanup_committed_files(success_list)
+                raise
+            await self._discard_duplicated_documents(duplicated_list, error_list)
+
         return success_list, error_list
 
+    async def _delete_unreferenced_files(
+        self, document_list: List[DocumentSchema]
+    ) -> None:
+        """
+        이번 요청에서 저장한 파일 중 DB의 다른 문서가 참조하지 않는 파일을 삭제한다.
+        같은 이름의 파일은 먼저 저장된 문서와 경로가 같으므로, 참조 중인 경로는 남겨둔다.
+        """
+
+        if not document_list:
+            return
+
+        referenced_path_set = await self.document_repository.get_existing_file_paths(
+            [document.file_path for document in document_list]
+        )
+
+        for document in document_list:
+            if document.file_path not in referenced_path_set:
+                delete_file(document.file_path)
+
+    async def _cleanup_committed_files(
+        self, document_list: List[DocumentSchema]
+    ) -> None:
+        """
+        문서 저장에 실패했을 때 이미 옮겨둔 파일을 정리한다.
+        정리 실패는 로그만 남기고 원래 오류를 그대로 전달한다.
+        """
+
+        try:
+            await self._delete_unreferenced_files(document_list)
+        except Exception as e:
+            logger.error(f"[Document] 저장 실패한 문서의 파일 정리 실패: {e}")
+
+    async def _discard_duplicated_documents(
+        self,
+        duplicated_list: List[DocumentSchema],
+        error_list: List[DocumentErrorSchema],
+    ) -> None:
+        """
+        동시 업로드로 unique 인덱스에 걸린 문서를 중복 오류로 돌려주고 저장한 파일을 정리한다.
+        """
+
+        await self._delete_unreferenced_files(duplicated_list)
+
+        for document in duplicated_list:
+            error_list.append(
+                DocumentErrorSchema(
+                    name=document.name,
+                    error="App에 이미 존재하는 문서입니다.",
+                )
+            )
+
     async def get_document(
         self,
         document_id: str,
@@ -146,6 +252,17 @@ class DocumentService:
 
         return document_list
 
+    async def stream_document_by_app(
+        self,
+        app_id: str,
+    ) -> AsyncIterator[DocumentSchema]:
+        """
+        Document 목록 스트리밍 조회
+        """
+        existing_app = await self.app_service.get_app(app_id)
+
+        return self.document_repository.iter_document_by_app(existing_app.id)
+
     async def update_document(
         self,
         document_id: str,
@@ -200,6 +317,19 @@ class DocumentService:
                 detail="앱 정보 수정 실패",
             )
 
+    async def update_chunk_signature(
+        self,
+        document_ids: List[ObjectId],
+        chunk_signature: Optional[str],
+    ) -> int:
+        """
+        권한 검사가 끝난 Document들의 청크 시그니처 수정 (None이면 초기화)
+        """
+
+        return await self.document_repository.update_chunk_signature(
+            document_ids, chunk_signature
+        )
+
     async def delete_document(
         self,
         document_id: str,
@@ -21,6 +21,10 @@ class DocumentDetail(DocumentUpdateSchema):
 class DocumentSchema(DocumentDetail, LifeCycle):
     id: ObjectId = Field(default_factory=ObjectId, alias="_id")
     app_id: ObjectId = Field(..., description="APP ID, 식별자")
+    chunk_signature: Optional[str] = Field(
+        default=None,
+        description="현재 청크를 생성한 문서 해시와 청크 파라미터의 시그니처",
+    )
 
     class Config:
         arbitrary_types_allowed = True
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Set, Tuple
 
 from bson import ObjectId
 
@@ -16,10 +16,28 @@ class IDocumentRepository(ABC):
         pass
 
     @abstractmethod
-    async def exist_document(self, app_id: str, hash: str, size: int) -> bool:
+    async def create_documents_bulk(
+        self, documents: List[DocumentSchema]
+    ) -> Tuple[List[DocumentSchema], List[DocumentSchema]]:
         """
-        App ID, Hash, Size 기반으로 Document 존재 여부 확인
-        Hash와 Size는 App 내에서 문서의 식별자 역할을 함
+        Document 목록을 batch 단위 insert_many로 생성
+        (App ID, Hash, Size) unique 인덱스에 걸려 저장되지 않은 문서는 두 번째 목록으로 반환
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_file_paths(self, file_path_list: List[str]) -> Set[str]:
+        """
+        file_path_list 중 Document가 참조하고 있는 경로를 조회
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_document_keys(
+        self, app_id: ObjectId, key_list: List[Tuple[str, int]]
+    ) -> Set[Tuple[str, int]]:
+        """
+        App 내에 이미 존재하는 (Hash, Size) 조합을 한 번의 쿼리로 조회
         """
         pass
 
@@ -39,6 +57,13 @@ class IDocumentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_document_by_app(self, app_id: ObjectId) -> AsyncIterator[DocumentSchema]:
+        """
+        App ID 기반으로 Document를 cursor에서 하나씩 반환
+        """
+        pass
+
     @abstractmethod
     async def update_document(self, document: DocumentSchema) -> bool:
         """
@@ -46,6 +71,15 @@ class IDocumentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def update_chunk_signature(
+        self, document_ids: List[ObjectId], chunk_signature: Optional[str]
+    ) -> int:
+        """
+        Document들의 청크 시그니처 수정
+        """
+        pass
+
     @abstractmethod
     async def delete_document(self, document_id: ObjectId) -> bool:
         """
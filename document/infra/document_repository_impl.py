@@ -1,9 +1,11 @@
 from datetime import UTC, datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Set, Tuple
 
 from bson import ObjectId
+from pymongo.errors import BulkWriteError
 
 from config import get_settings
+from database.mongo import BULK_WRITE_BATCH_SIZE, CURSOR_BATCH_SIZE
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from document.domain.model.document_schema import DocumentSchema
@@ -12,6 +14,8 @@ from document.domain.repository.document_repository import IDocumentRepository
 DB_CONFIG = get_settings().mongo
 DB = DB_CONFIG.mongodb_db
 
+DUPLICATE_KEY_ERROR = 11000
+
 
 class DocumentRepository(IDocumentRepository):
     def __init__(self, mongo_client: AsyncIOMotorClient):
@@ -24,14 +28,61 @@ class DocumentRepository(IDocumentRepository):
 
         return document
 
-    async def exist_document(self, app_id: str, hash: str, size: int) -> bool:
-        return (
-            await self.collection.find_one(
-                {"app_id": app_id, "hash": hash, "size": size},
-                projection={"_id": 1},
-            )
-            is not None
+    async def create_documents_bulk(
+        self, documents: List[DocumentSchema]
+    ) -> Tuple[List[DocumentSchema], List[DocumentSchema]]:
+        created_at = datetime.now(UTC)
+        for document in documents:
+            document.created_at = created_at
+
+        duplicated_list: List[DocumentSchema] = []
+
+        for start in range(0, len(documents), BULK_WRITE_BATCH_SIZE):
+            batch = documents[start : start + BULK_WRITE_BATCH_SIZE]
+            try:
+                await self.collection.insert_many(
+                    [document.model_dump(by_alias=True) for document in batch],
+                    ordered=False,
+                )
+            except BulkWriteError as e:
+                # 동시에 업로드된 같은 파일은 unique 인덱스 위반으로 해당 문서만 실패
+                write_error_list = e.details.get("writeErrors", [])
+                if any(
+                    error.get("code") != DUPLICATE_KEY_ERROR
+                    for error in write_error_list
+                ):
+                    raise
+                duplicated_list.extend(
+                    batch[error["index"]] for error in write_error_list
+                )
+
+        duplicated_ids = {document.id for document in duplicated_list}
+        return [
+            document for document in documents if document.id not in duplicated_ids
+        ], duplicated_list
+
+    async def get_existing_file_paths(self, file_path_list: List[str]) -> Set[str]:
+        if not file_path_list:
+            return set()
+
+        cursor = self.collection.find(
+            {"file_path": {"$in": file_path_list}},
+            projection={"_id": 0, "file_path": 1},
         )
+        return {raw["file_path"] async for raw in cursor}
+
+    async def get_existing_document_keys(
+        self, app_id: ObjectId, key_list: List[Tuple[str, int]]
+    ) -> Set[Tuple[str, int]]:
+        if not key_list:
+            return set()
+
+        raw = await self.collection.find(
+            {"app_id": app_id, "hash": {"$in": list({hash for hash, _ in key_list})}},
+            projection={"_id": 0, "hash": 1, "size": 1},
+        ).to_list(length=None)
+
+        return {(doc["hash"], doc["size"]) for doc in raw} & set(key_list)
 
     async def get_document(self, document_id: ObjectId) -> Optional[DocumentSchema]:
         raw = await self.collection.find_one({"_id": document_id})
@@ -51,6 +102,13 @@ class DocumentRepository(IDocumentRepository):
 
         return [DocumentSchema.model_validate(doc) for doc in raw]
 
+    async def iter_document_by_app(
+        self, app_id: ObjectId
+    ) -> AsyncIterator[DocumentSchema]:
+        cursor = self.collection.find({"app_id": app_id}).batch_size(CURSOR_BATCH_SIZE)
+        async for raw in cursor:
+            yield DocumentSchema.model_validate(raw)
+
     async def update_document(self, document: DocumentSchema) -> bool:
         document.updated_at = datetime.now(UTC)
         result = await self.collection.update_one(
@@ -59,6 +117,18 @@ class DocumentRepository(IDocumentRepository):
         )
         return result.modified_count > 0
 
+    async def update_chunk_signature(
+        self, document_ids: List[ObjectId], chunk_signature: Optional[str]
+    ) -> int:
+        if not document_ids:
+            return 0
+
+        result = await self.collection.update_many(
+            {"_id": {"$in": document_ids}},
+            {"$set": {"chunk_signature": chunk_signature}},
+        )
+        return result.modified_count
+
     async def delete_document(self, document_id: ObjectId) -> bool:
         result = await self.collection.delete_one({"_id": document_id})
         return result.deleted_count > 0
@@ -1,8 +1,9 @@
 from typing import List
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from dependency_injector.wiring import inject, Provide
 from chunks.application.chunk_service import ChunkService
 from common.log_config import get_logger
+from common.ndjson import accepts_ndjson, ndjson_response
 from containers import Container
 from document.application.document_service import DocumentService
 from document.interface.dto.document_dto import (
@@ -82,11 +83,20 @@ async def get_document(
 @inject
 async def get_document_by_app(
     app_id: str,
+    request: Request,
     document_service: DocumentService = Depends(Provide[Container.document_service]),
     user: User = Depends(get_current_user),
 ):
+    """
+    Accept: application/x-ndjson 요청 시 문서 목록을 한 줄씩 스트리밍
+    """
     try:
         logger.info(f"[Document] {user.user_id}: {app_id} 문서 목록 조회")
+
+        if accepts_ndjson(request):
+            document_stream = await document_service.stream_document_by_app(app_id)
+            return ndjson_response(document_stream, DocumentMapper.to_document_response)
+
         document_list = await document_service.get_document_by_app(app_id)
         logger.info(f"[Document] {user.user_id}: {app_id} 문서 목록 조회 완료")
         return [
@@ -0,0 +1,88 @@
+import asyncio
+from typing import List
+
+from bson import ObjectId
+from langchain_core.embeddings import Embeddings
+
+from chunks.domain.model.chunk_schema import ChunkSchema
+from embed.domain.model.vector_schema import VectorSearchResultSchema
+from embed.domain.repository.vector_repository import IVectorRepository
+
+
+class EmbeddingService:
+
+    def __init__(
+        self,
+        embedder: Embeddings,
+        vector_repository: IVectorRepository,
+        batch_size: int = 64,
+        concurrency: int = 4,
+        enabled: bool = True,
+    ):
+        self.embedder = embedder
+        self.vector_repository = vector_repository
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.enabled = enabled
+
+    async def embed_chunks(
+        self, app_id: ObjectId, chunk_list: List[ChunkSchema]
+    ) -> int:
+        """
+        청크 본문을 batch_size 단위로 임베딩하여 벡터 저장소에 저장한다.
+        최대 concurrency개의 batch를 동시에 요청하며, 본문이 비어 있는 청크는 건너뛴다.
+        """
+
+        if not self.enabled:
+            return 0
+
+        target_list = [chunk for chunk in chunk_list if chunk.content.strip()]
+        if not target_list:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _embed_batch(batch: List[ChunkSchema]) -> int:
+            async with semaphore:
+                vectors = await self.embedder.aembed_documents(
+                    [chunk.content for chunk in batch]
+                )
+
+            return await self.vector_repository.upsert_vectors(
+                app_id=app_id,
+                chunk_ids=[chunk.id for chunk in batch],
+                document_ids=[chunk.document_id for chunk in batch],
+                vectors=vectors,
+            )
+
+        result_list = await asyncio.gather(
+            *[
+                _embed_batch(target_list[i : i + self.batch_size])
+                for i in range(0, len(target_list), self.batch_size)
+            ]
+        )
+
+        return sum(result_list)
+
+    async def embed_query(self, query: str) -> List[float]:
+        # embedder가 CachedEmbeddings이면 같은 질의는 캐시에서 바로 반환됨
+        return await self.embedder.aembed_query(query)
+
+    async def search(
+        self, app_id: ObjectId, vector: List[float], top_k: int
+    ) -> List[VectorSearchResultSchema]:
+        return await self.vector_repository.search(app_id, vector, top_k)
+
+    async def delete_vectors(self, app_id: ObjectId, chunk_ids: List[ObjectId]) -> int:
+        if not self.enabled or not chunk_ids:
+            return 0
+        return await self.vector_repository.delete_vectors(app_id, chunk_ids)
+
+    async def delete_vectors_by_document_ids(
+        self, app_id: ObjectId, document_ids: List[ObjectId]
+    ) -> int:
+        if not self.enabled or not document_ids:
+            return 0
+        return await self.vector_repository.delete_vectors_by_document_ids(
+            app_id, document_ids
+        )
@@ -0,0 +1,12 @@
+from bson import ObjectId
+from pydantic import BaseModel, Field
+
+
+class VectorSearchResultSchema(BaseModel):
+    chunk_id: ObjectId = Field(..., description="청크 ID")
+    document_id: ObjectId = Field(..., description="문서 ID")
+    score: float = Field(..., description="유사도 점수 (cosine, 클수록 유사)")
+
+    class Config:
+        arbitrary_types_allowed = True
+        populate_by_name = True
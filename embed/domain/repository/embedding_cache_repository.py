@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class IEmbeddingCacheRepository(ABC):
+
+    @abstractmethod
+    async def get_vectors(
+        self, model: str, text_hashes: List[str], kind: str
+    ) -> Dict[str, List[float]]:
+        """
+        모델, 종류(document/query), 텍스트 해시 목록으로 저장된 임베딩을 조회한다.
+        없는 해시는 결과에서 빠진다.
+        """
+        pass
+
+    @abstractmethod
+    async def set_vectors(
+        self, model: str, vectors: Dict[str, List[float]], kind: str
+    ) -> None:
+        """
+        종류(document/query)별로 텍스트 해시별 임베딩을 저장한다. 이미 있는 항목은 덮어쓰지 않는다.
+        """
+        pass
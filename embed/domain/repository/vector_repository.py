@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from bson import ObjectId
+
+from embed.domain.model.vector_schema import VectorSearchResultSchema
+
+
+class IVectorRepository(ABC):
+
+    @abstractmethod
+    async def upsert_vectors(
+        self,
+        app_id: ObjectId,
+        chunk_ids: List[ObjectId],
+        document_ids: List[ObjectId],
+        vectors: List[List[float]],
+    ) -> int:
+        """
+        App의 벡터 컬렉션에 chunk_id를 키로 벡터를 저장(덮어쓰기)한다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_vectors(self, app_id: ObjectId, chunk_ids: List[ObjectId]) -> int:
+        """
+        chunk_ids에 해당하는 벡터를 삭제한다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_vectors_by_document_ids(
+        self, app_id: ObjectId, document_ids: List[ObjectId]
+    ) -> int:
+        """
+        document_ids에 속한 벡터를 삭제한다.
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self, app_id: ObjectId, vector: List[float], top_k: int
+    ) -> List[VectorSearchResultSchema]:
+        """
+        App의 벡터 컬렉션에서 vector와 가장 유사한 top_k개의 청크를 유사도 내림차순으로 반환한다.
+        """
+        pass
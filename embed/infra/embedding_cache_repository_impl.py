@@ -0,0 +1,53 @@
+from datetime import UTC, datetime
+from typing import Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from config import get_settings
+from database.mongo import BULK_WRITE_BATCH_SIZE
+from embed.domain.repository.embedding_cache_repository import (
+    IEmbeddingCacheRepository,
+)
+
+DB = get_settings().mongo.mongodb_db
+
+
+class EmbeddingCacheRepository(IEmbeddingCacheRepository):
+
+    def __init__(self, mongo_client: AsyncIOMotorClient):
+        self.db = mongo_client[DB]
+        self.collection = self.db["embedding_cache"]
+
+    async def get_vectors(
+        self, model: str, text_hashes: List[str], kind: str
+    ) -> Dict[str, List[float]]:
+        if not text_hashes:
+            return {}
+
+        cursor = self.collection.find(
+            {"model": model, "kind": kind, "text_hash": {"$in": text_hashes}},
+            {"_id": 0, "text_hash": 1, "embedding": 1},
+        )
+        return {doc["text_hash"]: doc["embedding"] async for doc in cursor}
+
+    async def set_vectors(
+        self, model: str, vectors: Dict[str, List[float]], kind: str
+    ) -> None:
+        if not vectors:
+            return
+
+        created_at = datetime.now(UTC)
+        operations = [
+            UpdateOne(
+                {"model": model, "kind": kind, "text_hash": text_hash},
+                {"$setOnInsert": {"embedding": embedding, "created_at": created_at}},
+                upsert=True,
+            )
+            for text_hash, embedding in vectors.items()
+        ]
+
+        for i in range(0, len(operations), BULK_WRITE_BATCH_SIZE):
+            await self.collection.bulk_write(
+                operations[i : i + BULK_WRITE_BATCH_SIZE], ordered=False
+            )
@@ -0,0 +1,109 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from bson import ObjectId
+
+from embed.domain.model.vector_schema import VectorSearchResultSchema
+from embed.domain.repository.vector_repository import IVectorRepository
+
+
+class MemoryVectorRepository(IVectorRepository):
+    """
+    프로세스 내 dict 기반 벡터 저장소. 로컬 개발과 테스트용.
+    검색은 정규화된 벡터 행렬에 대한 NumPy brute-force(cosine)로 처리하며,
+    행렬은 컬렉션이 변경된 뒤 첫 검색 시점에 다시 만든다.
+    """
+
+    def __init__(self):
+        # app_id -> chunk_id -> (document_id, vector)
+        self.collections: Dict[
+            ObjectId, Dict[ObjectId, Tuple[ObjectId, List[float]]]
+        ] = {}
+        # app_id -> (chunk_ids, document_ids, 정규화된 벡터 행렬)
+        self._matrices: Dict[
+            ObjectId, Tuple[List[ObjectId], List[ObjectId], np.ndarray]
+        ] = {}
+
+    async def upsert_vectors(
+        self,
+        app_id: ObjectId,
+        chunk_ids: List[ObjectId],
+        document_ids: List[ObjectId],
+        vectors: List[List[float]],
+    ) -> int:
+        collection = self.collections.setdefault(app_id, {})
+        for chunk_id, document_id, vector in zip(chunk_ids, document_ids, vectors):
+            collection[chunk_id] = (document_id, vector)
+        self._matrices.pop(app_id, None)
+        return len(chunk_ids)
+
+    async def delete_vectors(self, app_id: ObjectId, chunk_ids: List[ObjectId]) -> int:
+        collection = self.collections.get(app_id, {})
+        deleted = sum(
+            1 for chunk_id in chunk_ids if collection.pop(chunk_id, None) is not None
+        )
+        self._matrices.pop(app_id, None)
+        return deleted
+
+    async def delete_vectors_by_document_ids(
+        self, app_id: ObjectId, document_ids: List[ObjectId]
+    ) -> int:
+        collection = self.collections.get(app_id, {})
+        target = set(document_ids)
+        chunk_ids = [
+            chunk_id
+            for chunk_id, (document_id, _) in collection.items()
+            if document_id in target
+        ]
+        for chunk_id in chunk_ids:
+            del collection[chunk_id]
+        self._matrices.pop(app_id, None)
+        return len(chunk_ids)
+
+    def _get_matrix(
+        self, app_id: ObjectId
+    ) -> Optional[Tuple[List[ObjectId], List[ObjectId], np.ndarray]]:
+        if app_id in self._matrices:
+            return self._matrices[app_id]
+
+        collection = self.collections.get(app_id)
+        if not collection:
+            return None
+
+        chunk_ids = list(collection)
+        document_ids = [collection[chunk_id][0] for chunk_id in chunk_ids]
+        matrix = np.asarray(
+            [collection[chunk_id][1] for chunk_id in chunk_ids], dtype=np.float32
+        )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+
+        self._matrices[app_id] = (chunk_ids, document_ids, matrix)
+        return self._matrices[app_id]
+
+    async def search(
+        self, app_id: ObjectId, vector: List[float], top_k: int
+    ) -> List[VectorSearchResultSchema]:
+        entry = self._get_matrix(app_id)
+        if entry is None or top_k <= 0:
+            return []
+
+        chunk_ids, document_ids, matrix = entry
+
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        scores = matrix @ (query / norm if norm else query)
+
+        # 전체 정렬 대신 상위 top_k만 골라서 정렬
+        k = min(top_k, len(chunk_ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            VectorSearchResultSchema(
+                chunk_id=chunk_ids[i],
+                document_id=document_ids[i],
+                score=float(scores[i]),
+            )
+            for i in top
+        ]
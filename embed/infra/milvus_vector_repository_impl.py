@@ -0,0 +1,178 @@
+import asyncio
+import json
+from typing import Dict, List
+
+from bson import ObjectId
+from pymilvus import (
+    Collection,
+    CollectionSchema,
+    DataType,
+    FieldSchema,
+    utility,
+)
+
+from database.milvus import get_milvus_alias
+from embed.domain.model.vector_schema import VectorSearchResultSchema
+from embed.domain.repository.vector_repository import IVectorRepository
+from utils.object import get_str_id
+
+OBJECT_ID_LENGTH = 24
+SEARCH_EF = 64
+# 삭제 조건식(in [...])의 길이를 제한하기 위한 배치 크기 (id 1건당 약 28자)
+DELETE_BATCH_SIZE = 1000
+
+INDEX_PARAMS = {
+    "index_type": "HNSW",
+    "metric_type": "COSINE",
+    "params": {"M": 16, "efConstruction": 200},
+}
+
+
+class MilvusVectorRepository(IVectorRepository):
+    """
+    App 별 Milvus 컬렉션(app_{app_id})에 chunk_id를 primary key로 벡터를 저장한다.
+    pymilvus는 동기 클라이언트이므로 모든 호출은 thread에서 실행한다.
+    """
+
+    def __init__(self):
+        self._collections: Dict[ObjectId, Collection] = {}
+        self._locks: Dict[ObjectId, asyncio.Lock] = {}
+
+    def _collection_name(self, app_id: ObjectId) -> str:
+        return f"app_{get_str_id(app_id)}"
+
+    def _get_lock(self, app_id: ObjectId) -> asyncio.Lock:
+        return self._locks.setdefault(app_id, asyncio.Lock())
+
+    def _load_collection(self, app_id: ObjectId, dim: int | None = None):
+        alias = get_milvus_alias()
+        name = self._collection_name(app_id)
+
+        # delete(expr)와 search 모두 로드된 컬렉션이 필요하므로 조회/생성 시점에 로드
+        if utility.has_collection(name, using=alias):
+            collection = Collection(name, using=alias)
+            collection.load()
+            return collection
+
+        if dim is None:
+            return None
+
+        # 벡터 차원은 첫 upsert 시점의 임베딩 결과로 결정
+        schema = CollectionSchema(
+            fields=[
+                FieldSchema(
+                    "chunk_id",
+                    DataType.VARCHAR,
+                    is_primary=True,
+                    max_length=OBJECT_ID_LENGTH,
+                ),
+                FieldSchema(
+                    "document_id", DataType.VARCHAR, max_length=OBJECT_ID_LENGTH
+                ),
+                FieldSchema("embedding", DataType.FLOAT_VECTOR, dim=dim),
+            ],
+            description=f"chunk embeddings of app {get_str_id(app_id)}",
+        )
+        collection = Collection(name, schema=schema, using=alias)
+        collection.create_index("embedding", INDEX_PARAMS)
+        collection.load()
+        return collection
+
+    async def _get_collection(self, app_id: ObjectId, dim: int | None = None):
+        if app_id in self._collections:
+            return self._collections[app_id]
+
+        # 동시 배치가 같은 컬렉션을 중복 생성/인덱싱하지 않도록 App 단위로 직렬화
+        async with self._get_lock(app_id):
+            if app_id not in self._collections:
+                collection = await asyncio.to_thread(self._load_collection, app_id, dim)
+                if collection is None:
+                    return None
+                self._collections[app_id] = collection
+        return self._collections[app_id]
+
+    def _upsert(
+        self,
+        collection: Collection,
+        chunk_ids: List[ObjectId],
+        document_ids: List[ObjectId],
+        vectors: List[List[float]],
+    ) -> int:
+        result = collection.upsert(
+            [
+                [get_str_id(chunk_id) for chunk_id in chunk_ids],
+                [get_str_id(document_id) for document_id in document_ids],
+                vectors,
+            ]
+        )
+        return result.upsert_count
+
+    def _search(
+        self, collection: Collection, vector: List[float], top_k: int
+    ) -> List[VectorSearchResultSchema]:
+        hits = collection.search(
+            data=[vector],
+            anns_field="embedding",
+            param={"metric_type": "COSINE", "params": {"ef": max(SEARCH_EF, top_k)}},
+            limit=top_k,
+            output_fields=["document_id"],
+        )[0]
+
+        return [
+            VectorSearchResultSchema(
+                chunk_id=ObjectId(hit.id),
+                document_id=ObjectId(hit.entity.get("document_id")),
+                score=hit.distance,
+            )
+            for hit in hits
+        ]
+
+    def _delete(self, collection: Collection, field: str, ids: List[ObjectId]) -> int:
+        deleted = 0
+        for start in range(0, len(ids), DELETE_BATCH_SIZE):
+            batch = ids[start : start + DELETE_BATCH_SIZE]
+            expr = f"{field} in {json.dumps([get_str_id(id) for id in batch])}"
+            deleted += collection.delete(expr).delete_count
+        return deleted
+
+    async def upsert_vectors(
+        self,
+        app_id: ObjectId,
+        chunk_ids: List[ObjectId],
+        document_ids: List[ObjectId],
+        vectors: List[List[float]],
+    ) -> int:
+        if not vectors:
+            return 0
+        collection = await self._get_collection(app_id, dim=len(vectors[0]))
+        return await asyncio.to_thread(
+            self._upsert, collection, chunk_ids, document_ids, vectors
+        )
+
+    async def delete_vectors(self, app_id: ObjectId, chunk_ids: List[ObjectId]) -> int:
+        if not chunk_ids:
+            return 0
+        collection = await self._get_collection(app_id)
+        if collection is None:
+            return 0
+        return await asyncio.to_thread(self._delete, collection, "chunk_id", chunk_ids)
+
+    async def delete_vectors_by_document_ids(
+        self, app_id: ObjectId, document_ids: List[ObjectId]
+    ) -> int:
+        if not document_ids:
+            return 0
+        collection = await self._get_collection(app_id)
+        if collection is None:
+            return 0
+        return await asyncio.to_thread(
+            self._delete, collection, "document_id", document_ids
+        )
+
+    async def search(
+        self, app_id: ObjectId, vector: List[float], top_k: int
+    ) -> List[VectorSearchResultSchema]:
+        collection = await self._get_collection(app_id)
+        if collection is None:
+            return []
+        return await asyncio.to_thread(self._search, collection, vector, top_k)
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from common.cache import LRUCache
+from common.log_config import get_logger
+from embed.domain.repository.embedding_cache_repository import (
+    IEmbeddingCacheRepository,
+)
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 누적 통계를 INFO로 남기는 호출 간격 (로그가 Mongo에 저장되므로 매 호출 기록하지 않음)
+REPORT_INTERVAL = 100
+
+# 모델에 따라 질의와 문서에 다른 instruction(예: "query: ", "passage: ")을 붙이므로 캐시를 분리
+EMBEDDING_KIND_DOCUMENT = "document"
+EMBEDDING_KIND_QUERY = "query"
+
+
+def get_text_hash(text: str) -> str:
+    """
+    유니코드 정규화(NFC)와 공백 정리를 거친 텍스트의 sha256 해시.
+    """
+    normalized = _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    (모델명, 종류(document/query), 텍스트 해시)를 키로 임베딩 결과를 캐시하는 Embeddings wrapper.
+    프로세스 내 LRU -> 영구 저장소(cache_repository) -> 실제 임베딩 순으로 조회하며,
+    sync 경로(embed_documents/embed_query)는 LRU 계층만 사용한다.
+    """
+
+    def __init__(
+        self,
+        embedder: Embeddings,
+        model_name: Optional[str] = None,
+        cache_repository: Optional[IEmbeddingCacheRepository] = None,
+        cache_size: int = 10000,
+    ):
+        self.embedder = embedder
+        self.model_name = model_name or getattr(
+            embedder, "model", type(embedder).__name__
+        )
+        self.cache_repository = cache_repository
+        self.memory_cache: LRUCache[List[float]] = LRUCache(cache_size)
+
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.calls = 0
+
+    def stats(self) -> Dict[str, float]:
+        total = self.memory_hits + self.persistent_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": (total - self.misses) / total if total else 0.0,
+        }
+
+    def _lookup_memory(
+        self, texts: List[str], kind: str
+    ) -> tuple[List[str], Dict[str, List[float]], Dict[str, str]]:
+        hashes = [get_text_hash(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        missing: Dict[str, str] = {}  # hash -> text, 같은 텍스트는 한 번만 임베딩
+
+        for text_hash, text in zip(hashes, texts):
+            if text_hash in found or text_hash in missing:
+                continue
+            vector = self.memory_cache.get((kind, text_hash))
+            if vector is None:
+                missing[text_hash] = text
+            else:
+                found[text_hash] = vector
+
+        self.memory_hits += len(found)
+        return hashes, found, missing
+
+    def _store_memory(self, vectors: Dict[str, List[float]], kind: str) -> None:
+        for text_hash, vector in vectors.items():
+            self.memory_cache.set((kind, text_hash), vector)
+
+    def _report(self, requested: int, embedded: int) -> None:
+        self.calls += 1
+        logger.debug(
+            f"[Embedding Cache] {self.model_name}: 요청 {requested}건 중 {embedded}건 임베딩"
+        )
+        if self.calls % REPORT_INTERVAL:
+            return
+
+        stats = self.stats()
+        logger.info(
+            f"[Embedding Cache] {self.model_name}: 누적 hit rate {stats['hit_rate']:.2%} "
+            f"(memory {stats['memory_hits']}, persistent {stats['persistent_hits']}, "
+            f"miss {stats['misses']})"
+        )
+
+    def _embed(self, texts: List[str], kind: str) -> List[List[float]]:
+        if kind == EMBEDDING_KIND_QUERY:
+            return [self.embedder.embed_query(text) for text in texts]
+        return self.embedder.embed_documents(texts)
+
+    async def _aembed(self, texts: List[str], kind: str) -> List[List[float]]:
+        if kind == EMBEDDING_KIND_QUERY:
+            return list(
+                await asyncio.gather(
+                    *[self.embedder.aembed_query(text) for text in texts]
+                )
+            )
+        return await self.embedder.aembed_documents(texts)
+
+    def _embed_cached(self, texts: List[str], kind: str) -> List[List[float]]:
+        hashes, found, missing = self._lookup_memory(texts, kind)
+
+        if missing:
+            embedded = dict(zip(missing, self._embed(list(missing.values()), kind)))
+            self.misses += len(embedded)
+            self._store_memory(embedded, kind)
+            found.update(embedded)
+
+        self._report(len(texts), len(missing))
+        return [found[text_hash] for text_hash in hashes]
+
+    async def _aembed_cached(self, texts: List[str], kind: str) -> List[List[float]]:
+        hashes, found, missing = self._lookup_memory(texts, kind)
+
+        if missing and self.cache_repository is not None:
+            try:
+                stored = await self.cache_repository.get_vectors(
+                    self.model_name, list(missing), kind
+                )
+            except Exception as e:
+                logger.warning(f"[Embedding Cache] 영구 캐시 조회 실패: {e}")
+                stored = {}
+
+            self.persistent_hits += len(stored)
+            self._store_memory(stored, kind)
+            found.update(stored)
+            for text_hash in stored:
+                del missing[text_hash]
+
+        if missing:
+            embedded = dict(
+                zip(missing, await self._aembed(list(missing.values()), kind))
+            )
+            self.misses += len(embedded)
+            self._store_memory(embedded, kind)
+            found.update(embedded)
+
+            if self.cache_repository is not None:
+                try:
+                    await self.cache_repository.set_vectors(
+                        self.model_name, embedded, kind
+                    )
+                except Exception as e:
+                    logger.warning(f"[Embedding Cache] 영구 캐시 저장 실패: {e}")
+
+        self._report(len(texts), len(missing))
+        return [found[text_hash] for text_hash in hashes]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed_cached(texts, EMBEDDING_KIND_DOCUMENT)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_cached([text], EMBEDDING_KIND_QUERY)[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self._aembed_cached(texts, EMBEDDING_KIND_DOCUMENT)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self._aembed_cached([text], EMBEDDING_KIND_QUERY))[0]
+
+    async def aclose(self) -> None:
+        if hasattr(self.embedder, "aclose"):
+            await self.embedder.aclose()
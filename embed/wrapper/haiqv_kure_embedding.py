@@ -5,8 +5,8 @@ from config import get_settings
 
 haiqv_setting = get_settings().haiqv
 
-HAIQV_KURE_EMBEDDING_URL = haiqv_setting.haiqv_kure_embedding_url
-HAIQV_KURE_EMBEDDING_MODEL = haiqv_setting.haiqv_kure_embedding_model
+HAIQV_KURE_EMBEDDING_URL = haiqv_setting.haiqv_embed_kure_url
+HAIQV_KURE_EMBEDDING_MODEL = haiqv_setting.haiqv_embed_kure_model
 
 __all__ = ["HaiqvKureEmbedding"]
 
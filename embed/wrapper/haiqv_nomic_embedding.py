@@ -1,27 +1,162 @@
-from typing import List
-import requests
+import asyncio
+import time
+from typing import List, Optional
+
+import httpx
 from langchain_core.embeddings import Embeddings
 
 from config import get_settings
 
 haiqv_setting = get_settings().haiqv
 
-HAIQV_NOMIC_EMBEDDING_URL = haiqv_setting.haiqv_nomic_embedding_url
-HAIQV_NOMIC_EMBEDDING_MODEL = haiqv_setting.haiqv_nomic_embedding_model
+HAIQV_NOMIC_EMBEDDING_URL = haiqv_setting.haiqv_embed_nomic_url
+HAIQV_NOMIC_EMBEDDING_MODEL = haiqv_setting.haiqv_embed_nomic_model
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
 class HaiqvNomicEmbedding(Embeddings):
-    """Custom embedding class for HTTP-based APIs like nomic v2."""
+    """Custom embedding class for HTTP-based APIs like nomic v2.
+
+    입력은 max_batch_size 단위 요청으로 나누어 보내고, 동시 요청 수는 max_in_flight로 제한한다.
+    HTTP 클라이언트는 인스턴스 단위로 공유하여 keep-alive 연결을 재사용한다.
+    429/5xx 및 네트워크 오류는 지수 백오프로 max_retries회까지 재시도한다.
+    """
 
     base_url: str = HAIQV_NOMIC_EMBEDDING_URL
     model: str = HAIQV_NOMIC_EMBEDDING_MODEL
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        payload = {"model": self.model, "input": texts}
-        response = requests.post(self.base_url, json=payload)
+    def __init__(
+        self,
+        max_batch_size: int = haiqv_setting.haiqv_embed_max_batch_size,
+        max_in_flight: int = haiqv_setting.haiqv_embed_max_in_flight,
+        max_retries: int = haiqv_setting.haiqv_embed_max_retries,
+        backoff_sec: float = haiqv_setting.haiqv_embed_backoff_sec,
+        timeout_sec: float = haiqv_setting.haiqv_embed_timeout_sec,
+        max_connections: int = haiqv_setting.haiqv_embed_max_connections,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.backoff_sec = backoff_sec
+        self.timeout = httpx.Timeout(timeout_sec)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout, limits=self.limits)
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout, limits=self.limits
+            )
+        return self._async_client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+
+    def _split(self, texts: List[str]) -> List[List[str]]:
+        return [
+            texts[i : i + self.max_batch_size]
+            for i in range(0, len(texts), self.max_batch_size)
+        ]
+
+    def _payload(self, texts: List[str]) -> dict:
+        return {"model": self.model, "input": texts}
+
+    def _parse(self, response: httpx.Response) -> List[List[float]]:
         response.raise_for_status()
+        return [data["embedding"] for data in response.json()["data"]]
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff_sec * (2**attempt)
 
-        return response.json()["data"]
+    def _should_retry(self, attempt: int, response: httpx.Response | None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        return response is None or response.status_code in RETRY_STATUS_CODES
+
+    def _post(self, texts: List[str]) -> List[List[float]]:
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self.client.post(self.base_url, json=self._payload(texts))
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return self._parse(response)
+            except httpx.TransportError:
+                if not self._should_retry(attempt, None):
+                    raise
+
+            if response is not None and not self._should_retry(attempt, response):
+                return self._parse(response)
+
+            time.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    async def _apost(self, texts: List[str]) -> List[List[float]]:
+        attempt = 0
+        while True:
+            response = None
+            try:
+                async with self.semaphore:
+                    response = await self.async_client.post(
+                        self.base_url, json=self._payload(texts)
+                    )
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return self._parse(response)
+            except httpx.TransportError:
+                if not self._should_retry(attempt, None):
+                    raise
+
+            if response is not None and not self._should_retry(attempt, response):
+                return self._parse(response)
+
+            # 백오프 대기 중에는 in-flight 슬롯을 점유하지 않음
+            await asyncio.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for batch in self._split(texts):
+            vectors.extend(self._post(batch))
+        return vectors
 
     def embed_query(self, text: str) -> List[float]:
-        return self.embed_documents([text])[0]["embedding"]
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        result_list = await asyncio.gather(
+            *[self._apost(batch) for batch in self._split(texts)]
+        )
+        return [vector for vectors in result_list for vector in vectors]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
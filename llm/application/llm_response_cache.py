@@ -0,0 +1,119 @@
+import asyncio
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from common.cache import LRUCache
+from common.log_config import get_logger
+from llm.domain.model.llm_schema import Message
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def get_cache_key(
+    model: str, temperature: Optional[float], messages: List[Message]
+) -> str:
+    """
+    (모델, temperature, 정규화된 메시지)의 sha256 해시.
+    메시지 본문은 유니코드 정규화(NFC)와 공백 정리 후 비교한다.
+    """
+    normalized = [
+        [
+            message.role.value,
+            _WHITESPACE.sub(" ", unicodedata.normalize("NFC", message.content)).strip(),
+        ]
+        for message in messages
+    ]
+    payload = json.dumps([model, temperature, normalized], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    LLM 응답을 TTL과 크기 제한이 있는 LRU로 캐시한다.
+    같은 키의 요청이 동시에 들어오면 첫 요청만 LLM을 호출하고 나머지는 그 결과를 기다린다(single-flight).
+    실패한 응답은 캐시하지 않으며, 기다리던 요청에도 같은 예외가 전달된다.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: Optional[float] = 3600):
+        self.cache: LRUCache[str] = LRUCache(maxsize, ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.coalesced + self.misses
+        return {
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": (total - self.misses) / total if total else 0.0,
+        }
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        single-flight 없이 캐시만 조회한다. (stream처럼 기다리지 않고 바로 생성하는 경로용)
+        """
+        content = self.cache.get(key)
+        if content is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        self.cache.set(key, content)
+
+    async def get_or_create(
+        self, key: str, create: Callable[[], Awaitable[str]]
+    ) -> str:
+        while True:
+            content = self.cache.get(key)
+            if content is not None:
+                self.hits += 1
+                return content
+
+            future = self._inflight.get(key)
+            if future is None:
+                break
+
+            self.coalesced += 1
+            try:
+                # 기다리던 요청이 취소되어도 선행 요청에는 영향을 주지 않도록 shield
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 선행 요청이 취소된 경우에만 다시 시도
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            content = await create()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            self.cache.set(key, content)
+            future.set_result(content)
+        finally:
+            self._inflight.pop(key, None)
+
+        logger.info(
+            f"[LLM Cache] miss -> 저장, 누적 hit rate {self.stats()['hit_rate']:.2%} "
+            f"(hit {self.hits}, coalesced {self.coalesced}, miss {self.misses})"
+        )
+        return content
@@ -1,4 +1,12 @@
-from typing import AsyncGenerator, Generator, List
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Generator, List, Optional
+
+from fastapi import HTTPException
+
+from common.concurrency import ConcurrencyLimiter
+from llm.application.llm_response_cache import LLMResponseCache, get_cache_key
 from llm.domain.model.llm_schema import Message
 from llm.domain.repository.llm_repository import ILLMRepository
 
@@ -6,21 +14,152 @@ from llm.domain.repository.llm_repository import ILLMRepository
 class LLMService:
     """Encapsulates business rules; can add logging, retries, etc."""
 
-    def __init__(self, llm_repository: ILLMRepository):
+    def __init__(
+        self,
+        llm_repository: ILLMRepository,
+        limiter: Optional[ConcurrencyLimiter] = None,
+        timeout: Optional[float] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
         self.llm_repository = llm_repository
+        self.limiter = limiter
+        self.timeout = timeout
+        self.response_cache = response_cache
+
+    @asynccontextmanager
+    async def _slot(self):
+        """
+        limiter 자리를 확보한다. 대기 시간을 넘기면 503을 반환해
+        LLM 요청이 몰려도 청킹/조회 요청이 밀리지 않도록 한다.
+        """
+
+        if self.limiter is None:
+            yield
+            return
+
+        try:
+            await self.limiter.acquire()
+        except TimeoutError as e:
+            raise HTTPException(
+                status_code=503,
+                detail=f"LLM 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요. ({e})",
+            )
+
+        try:
+            yield
+        finally:
+            self.limiter.release()
+
+    def _raise_timeout(self):
+        raise HTTPException(
+            status_code=504,
+            detail=f"LLM 응답이 제한 시간({self.timeout}초)을 초과했습니다.",
+        )
+
+    def _get_cache_key(self, messages: List[Message]) -> str:
+        return get_cache_key(
+            getattr(self.llm_repository, "model", type(self.llm_repository).__name__),
+            getattr(self.llm_repository, "temperature", None),
+            messages,
+        )
 
     # fully synchronous use‑case
     def chat(self, messages: List[Message]) -> str:
         return self.llm_repository.invoke(messages)
 
     # fully asynchronous
-    async def chat_async(self, messages: List[Message]) -> str:
-        return await self.llm_repository.ainvoke(messages)
+    async def chat_async(self, messages: List[Message], use_cache: bool = True) -> str:
+        if self.response_cache is None or not use_cache:
+            return await self._ainvoke(messages)
+
+        # 동시에 들어온 같은 요청은 한 번만 LLM을 호출 (대기하는 요청은 limiter 자리를 차지하지 않음)
+        return await self.response_cache.get_or_create(
+            self._get_cache_key(messages), lambda: self._ainvoke(messages)
+        )
+
+    async def _ainvoke(self, messages: List[Message]) -> str:
+        async with self._slot():
+            try:
+                return await asyncio.wait_for(
+                    self.llm_repository.ainvoke(messages), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                self._raise_timeout()
 
     # streaming helpers
     def chat_stream(self, messages: List[Message]) -> Generator[str, None, None]:
         return self.llm_repository.stream(messages)
 
-    async def chat_astream(self, messages: List[Message]) -> AsyncGenerator[str, None]:
-        async for chunk in self.llm_repository.astream(messages):
-            yield chunk
+    async def chat_astream(
+        self, messages: List[Message], use_cache: bool = True
+    ) -> AsyncGenerator[str, None]:
+        """
+        limiter 자리를 확보한 뒤 토큰 generator를 반환한다.
+        응답을 시작하기 전에 자리를 잡으므로 과부하는 stream 도중이 아닌 503 응답으로 전달된다.
+        """
+
+        key = None
+        if self.response_cache is not None and use_cache:
+            key = self._get_cache_key(messages)
+            content = self.response_cache.get(key)
+            if content is not None:
+                return self._yield_cached(content)
+
+        stream = self._astream(messages)
+        # 첫 단계(자리 확보)까지 진행. 이후에는 generator가 닫히거나 회수될 때 자리를 반납
+        await stream.__anext__()
+
+        if key is None:
+            return stream
+        return self._cache_stream(key, stream)
+
+    async def _yield_cached(self, content: str) -> AsyncGenerator[str, None]:
+        yield content
+
+    async def _cache_stream(
+        self, key: str, stream: AsyncGenerator[str, None]
+    ) -> AsyncGenerator[str, None]:
+        # stream은 기다리지 않고 바로 생성하며, 끝까지 받은 응답만 캐시에 저장
+        chunk_list: List[str] = []
+        try:
+            async for chunk in stream:
+                chunk_list.append(chunk)
+                yield chunk
+        finally:
+            await stream.aclose()
+
+        self.response_cache.set(key, "".join(chunk_list))
+
+    async def _astream(
+        self, messages: List[Message]
+    ) -> AsyncGenerator[Optional[str], None]:
+        """
+        첫 번째 값(None)은 limiter 자리 확보 완료 신호이며, 이후 토큰을 반환한다.
+        stream 전체에 timeout을 적용하고, stream이 끝날 때까지 limiter 자리를 점유한다.
+        """
+
+        async with self._slot():
+            yield None
+
+            stream = self.llm_repository.astream(messages)
+            deadline = None if self.timeout is None else time.monotonic() + self.timeout
+
+            try:
+                while True:
+                    remaining = (
+                        None
+                        if deadline is None
+                        else max(0, deadline - time.monotonic())
+                    )
+                    try:
+                        chunk = await asyncio.wait_for(
+                            stream.__anext__(), timeout=remaining
+                        )
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        self._raise_timeout()
+
+                    yield chunk
+            finally:
+                await stream.aclose()
@@ -3,6 +3,7 @@ from pydantic import BaseModel
 
 
 class Role(str, Enum):
+    SYSTEM = "system"
     USER = "user"
     ASSISTANT = "assistant"
 
@@ -0,0 +1,63 @@
+import asyncio
+import re
+import time
+from typing import AsyncGenerator, Generator, List, Optional
+
+from llm.domain.model.llm_schema import Message, Role
+from llm.domain.repository.llm_repository import ILLMRepository
+
+# 공백을 앞 토큰에 붙여서 나누므로 토큰을 이어 붙이면 원문이 된다
+TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+
+
+class FakeLLMRepository(ILLMRepository):
+    """
+    네트워크 없이 동작하는 테스트/로컬 개발용 LLM.
+    response가 없으면 마지막 user 메시지를 되돌려준다.
+    공백 단위 토큰마다 token_delay만큼 걸리는 것으로 생성 시간을 흉내낸다.
+    """
+
+    model = "fake"
+    temperature = None
+
+    def __init__(self, response: Optional[str] = None, token_delay: float = 0.0):
+        self.response = response
+        self.token_delay = token_delay
+        self.calls = 0
+
+    def _get_response(self, messages: List[Message]) -> str:
+        self.calls += 1
+        if self.response is not None:
+            return self.response
+
+        question = next(
+            (m.content for m in reversed(messages) if m.role == Role.USER), ""
+        )
+        return f"[fake] {question}"
+
+    def _tokenize(self, messages: List[Message]) -> List[str]:
+        return TOKEN_PATTERN.findall(self._get_response(messages))
+
+    def invoke(self, messages: List[Message]) -> str:
+        token_list = self._tokenize(messages)
+        if self.token_delay:
+            time.sleep(self.token_delay * len(token_list))
+        return "".join(token_list)
+
+    async def ainvoke(self, messages: List[Message]) -> str:
+        token_list = self._tokenize(messages)
+        if self.token_delay:
+            await asyncio.sleep(self.token_delay * len(token_list))
+        return "".join(token_list)
+
+    def stream(self, messages: List[Message]) -> Generator[str, None, None]:
+        for token in self._tokenize(messages):
+            if self.token_delay:
+                time.sleep(self.token_delay)
+            yield token
+
+    async def astream(self, messages: List[Message]) -> AsyncGenerator[str, None]:
+        for token in self._tokenize(messages):
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            yield token
@@ -7,6 +7,10 @@ from llm.infra.api.haiqv_chat_ollama import ollama_client
 class HaiqvLLMRepository(ILLMRepository):
     """Concrete adapter that talks to HaiQV‑proxied Ollama."""
 
+    # response cache key 구성에 사용
+    model = ollama_client.model
+    temperature = ollama_client.temperature
+
     def _to_langchain(self, messages: List[Message]):
         # LangChain expects dict‑style messages
         return [{"role": m.role.value, "content": m.content} for m in messages]
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from dependency_injector.wiring import Provide, inject
 
+from common.sse import sse_response
 from containers import Container
 from llm.application.llm_service import LLMService
 from llm.interface.dto.llm_dto import ChatRequest, ChatResponse
@@ -14,5 +15,26 @@ async def invoke(
     req: ChatRequest,
     llm_service: LLMService = Depends(Provide[Container.llm_service]),
 ):
-    content = llm_service.chat(req.messages)
+    content = await llm_service.chat_async(req.messages, use_cache=req.use_cache)
     return ChatResponse(content=content)
+
+
+@router.post("/stream")
+@inject
+async def stream(
+    req: ChatRequest,
+    llm_service: LLMService = Depends(Provide[Container.llm_service]),
+):
+    """
+    생성 토큰을 Server-Sent Events(event: token)로 stream하고 마지막에 event: done을 보낸다.
+    동시 실행 한도를 넘으면 stream을 시작하지 않고 503을 반환한다.
+    """
+
+    token_stream = await llm_service.chat_astream(req.messages, use_cache=req.use_cache)
+
+    async def _stream():
+        async for chunk in token_stream:
+            yield "token", {"content": chunk}
+        yield "done", {}
+
+    return sse_response(_stream(), lambda event: event)
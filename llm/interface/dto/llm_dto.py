@@ -5,6 +5,7 @@ from typing import List
 
 class ChatRequest(BaseModel):
     messages: List[Message]
+    use_cache: bool = True
 
 
 class ChatResponse(BaseModel):
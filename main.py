@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import APIRouter, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
@@ -14,8 +15,10 @@ from document.interface.controller.document_controller import router as document
 from chunks.interface.controller.chunk_controller import router as chunk_router
 from chunks.interface.controller.image_controller import router as image_router
 from llm.interface.controller.llm_controller import router as llm_router
+from search.interface.controller.search_controller import router as search_router
 
 from containers import Container
+from database.mongo_index import ensure_indexes
 from common.log_config import get_logger
 
 logger = get_logger()
@@ -23,10 +26,33 @@ logger = get_logger()
 prefix = "/embedding"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await ensure_indexes(app.container.mongo_client())
+    except Exception as e:
+        logger.error(f"[MAIN] MongoDB 인덱스 확인 실패: {e}")
+
+    app.container.chunk_job_worker().start()
+    try:
+        await app.container.chunk_job_worker().recover()
+    except Exception as e:
+        logger.error(f"[MAIN] 미완료 Chunk 작업 재등록 실패: {e}")
+    yield
+    logger.info("[MAIN] Application shutdown")
+    await app.container.chunk_job_worker().stop()
+    app.container.chunking_executor().shutdown()
+
+    embedder = app.container.embedder()
+    if hasattr(embedder, "aclose"):
+        await embedder.aclose()
+
+
 def create_app():
     logger.info("[MAIN] Application setup")
     app = FastAPI(
         title="Spider Embedding API",
+        lifespan=lifespan,
         openapi_url=f"{prefix}/openapi.json",
         docs_url=None,
         redoc_url=None,
@@ -44,6 +70,7 @@ def create_app():
     api_router.include_router(chunk_router, tags=["Chunk"])
     api_router.include_router(image_router, tags=["Image"])
     api_router.include_router(llm_router, tags=["LLM"])
+    api_router.include_router(search_router, tags=["Search"])
     app.include_router(api_router)
 
     app.add_middleware(
@@ -61,6 +88,7 @@ def create_app():
             "chunks.interface.controller.chunk_controller",
             "chunks.interface.controller.image_controller",
             "llm.interface.controller.llm_controller",
+            "search.interface.controller.search_controller",
         ]
     )
     app.container = container
@@ -0,0 +1,51 @@
+from typing import AsyncIterator, List
+
+from bson import ObjectId
+
+from chunks.domain.model.chunk_schema import ChunkSchema
+from search.domain.model.search_schema import SearchHitSchema
+from search.domain.repository.lexical_index_repository import ILexicalIndexRepository
+
+
+class LexicalIndexService:
+
+    def __init__(
+        self,
+        lexical_index_repository: ILexicalIndexRepository,
+        enabled: bool = True,
+    ):
+        self.lexical_index_repository = lexical_index_repository
+        self.enabled = enabled
+
+    async def index_chunks(
+        self, app_id: ObjectId, chunk_list: List[ChunkSchema]
+    ) -> int:
+        if not self.enabled or not chunk_list:
+            return 0
+        return await self.lexical_index_repository.add_chunks(app_id, chunk_list)
+
+    async def delete_chunks(self, app_id: ObjectId, chunk_ids: List[ObjectId]) -> int:
+        if not self.enabled or not chunk_ids:
+            return 0
+        return await self.lexical_index_repository.delete_chunks(app_id, chunk_ids)
+
+    async def delete_chunks_by_document_ids(
+        self, app_id: ObjectId, document_ids: List[ObjectId]
+    ) -> int:
+        if not self.enabled or not document_ids:
+            return 0
+        return await self.lexical_index_repository.delete_chunks_by_document_ids(
+            app_id, document_ids
+        )
+
+    async def rebuild_index(
+        self, app_id: ObjectId, chunk_batches: AsyncIterator[List[ChunkSchema]]
+    ) -> int:
+        if not self.enabled:
+            return 0
+        return await self.lexical_index_repository.rebuild(app_id, chunk_batches)
+
+    async def search(
+        self, app_id: ObjectId, query: str, top_k: int
+    ) -> List[SearchHitSchema]:
+        return await self.lexical_index_repository.search(app_id, query, top_k)
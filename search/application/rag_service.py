@@ -0,0 +1,136 @@
+import time
+from typing import AsyncIterator, List
+
+from dependency_injector.wiring import inject
+
+from common.latency import LatencyTracker
+from common.log_config import get_logger
+from llm.application.llm_service import LLMService
+from llm.domain.model.llm_schema import Message, Role
+from search.application.search_service import SearchService
+from search.domain.model.search_schema import (
+    GenerationMetricsSchema,
+    RAGEventSchema,
+    RAGEventType,
+    SearchMode,
+    SearchResultSchema,
+)
+
+logger = get_logger(__name__)
+
+SYSTEM_PROMPT = (
+    "당신은 사내 문서를 바탕으로 답변하는 도우미입니다. "
+    "아래 [문서] 내용만 근거로 질문에 답하고, 근거가 없으면 모른다고 답하세요. "
+    "답변에 사용한 문서 번호를 [1]과 같이 표시하세요."
+)
+
+
+class RAGService:
+
+    @inject
+    def __init__(
+        self,
+        search_service: SearchService,
+        llm_service: LLMService,
+        ttft_tracker: LatencyTracker,
+        context_max_chars: int = 6000,
+    ):
+        self.search_service = search_service
+        self.llm_service = llm_service
+        self.ttft_tracker = ttft_tracker
+        self.context_max_chars = context_max_chars
+
+    def build_messages(
+        self, query: str, result_list: List[SearchResultSchema]
+    ) -> List[Message]:
+        """
+        검색 결과를 점수 순서대로 번호를 붙여 system prompt에 넣는다.
+        context_max_chars를 넘는 뒤쪽 청크는 제외한다.
+        """
+
+        context_list: List[str] = []
+        total = 0
+
+        for i, result in enumerate(result_list, start=1):
+            context = f"[{i}] (p.{result.chunk.page}) {result.chunk.content}"
+            if context_list and total + len(context) > self.context_max_chars:
+                break
+            context_list.append(context[: self.context_max_chars])
+            total += len(context)
+
+        return [
+            Message(
+                role=Role.SYSTEM,
+                content=SYSTEM_PROMPT + "\n\n[문서]\n" + "\n\n".join(context_list),
+            ),
+            Message(role=Role.USER, content=query),
+        ]
+
+    async def chat_by_app(
+        self,
+        app_id: str,
+        query: str,
+        top_k: int,
+        user_id: str,
+        mode: SearchMode = SearchMode.VECTOR,
+        use_cache: bool = True,
+    ) -> AsyncIterator[RAGEventSchema]:
+        """
+        권한 검사와 검색, LLM 자리 확보를 마친 뒤 답변 이벤트 iterator를 반환한다.
+        이 단계의 오류는 stream 시작 전에 HTTPException으로 올라간다.
+        """
+
+        result_list = await self.search_service.search_by_app(
+            app_id=app_id,
+            query=query,
+            top_k=top_k,
+            user_id=user_id,
+            mode=mode,
+        )
+
+        # LLM 동시 실행 자리도 stream 시작 전에 확보하여 과부하는 503으로 반환
+        started = time.perf_counter()
+        token_stream = await self.llm_service.chat_astream(
+            self.build_messages(query, result_list), use_cache=use_cache
+        )
+
+        return self._stream_answer(app_id, result_list, token_stream, started)
+
+    async def _stream_answer(
+        self,
+        app_id: str,
+        result_list: List[SearchResultSchema],
+        token_stream: AsyncIterator[str],
+        started: float,
+    ) -> AsyncIterator[RAGEventSchema]:
+
+        yield RAGEventSchema(event=RAGEventType.CONTEXT, context_list=result_list)
+
+        metrics = GenerationMetricsSchema()
+        first_token_at = None
+
+        async for token in token_stream:
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+                metrics.ttft_ms = (first_token_at - started) * 1000
+                self.ttft_tracker.record(first_token_at - started)
+
+            metrics.token_count += 1
+            yield RAGEventSchema(event=RAGEventType.TOKEN, content=token)
+
+        finished = time.perf_counter()
+        metrics.elapsed_ms = (finished - started) * 1000
+
+        # 첫 토큰 이후의 생성 속도 (decode throughput)
+        if first_token_at is not None and finished > first_token_at:
+            metrics.tokens_per_sec = (metrics.token_count - 1) / (
+                finished - first_token_at
+            )
+
+        logger.info(
+            f"[RAG] 답변 생성 완료: app_id: {app_id}, "
+            f"ttft: {metrics.ttft_ms or 0:.1f}ms, tokens: {metrics.token_count}, "
+            f"{metrics.tokens_per_sec:.1f} tokens/s"
+        )
+
+        yield RAGEventSchema(event=RAGEventType.DONE, metrics=metrics)
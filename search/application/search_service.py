@@ -0,0 +1,141 @@
+import asyncio
+from typing import Dict, List
+
+from bson import ObjectId
+from dependency_injector.wiring import inject
+from fastapi import HTTPException
+
+from app.application.app_service import AppService
+from chunks.domain.repository.chunk_repository import IChunkRepository
+from embed.application.embedding_service import EmbeddingService
+from search.application.lexical_index_service import LexicalIndexService
+from search.domain.model.search_schema import (
+    SearchHitSchema,
+    SearchMode,
+    SearchResultSchema,
+)
+
+
+def fuse_by_reciprocal_rank(
+    ranked_lists: List[List[SearchHitSchema]], rrf_k: int, top_k: int
+) -> List[SearchHitSchema]:
+    """
+    Reciprocal Rank Fusion. 점수 척도가 다른 BM25와 벡터 유사도를 순위만으로 합산한다.
+    score = Σ 1 / (rrf_k + rank), rank는 1부터 시작
+    """
+
+    fused: Dict[ObjectId, SearchHitSchema] = {}
+
+    for hit_list in ranked_lists:
+        for rank, hit in enumerate(hit_list, start=1):
+            score = 1.0 / (rrf_k + rank)
+            if hit.chunk_id in fused:
+                fused[hit.chunk_id].score += score
+            else:
+                fused[hit.chunk_id] = SearchHitSchema(
+                    chunk_id=hit.chunk_id,
+                    document_id=hit.document_id,
+                    score=score,
+                )
+
+    return sorted(fused.values(), key=lambda hit: hit.score, reverse=True)[:top_k]
+
+
+class SearchService:
+
+    @inject
+    def __init__(
+        self,
+        app_service: AppService,
+        embedding_service: EmbeddingService,
+        lexical_index_service: LexicalIndexService,
+        chunk_repository: IChunkRepository,
+        rrf_k: int = 60,
+        hybrid_candidate_factor: int = 4,
+    ):
+        self.app_service = app_service
+        self.embedding_service = embedding_service
+        self.lexical_index_service = lexical_index_service
+        self.chunk_repository = chunk_repository
+        self.rrf_k = rrf_k
+        self.hybrid_candidate_factor = hybrid_candidate_factor
+
+    async def _search_vector(
+        self, app_id: ObjectId, query: str, top_k: int
+    ) -> List[SearchHitSchema]:
+        vector = await self.embedding_service.embed_query(query)
+        return [
+            SearchHitSchema(
+                chunk_id=hit.chunk_id, document_id=hit.document_id, score=hit.score
+            )
+            for hit in await self.embedding_service.search(app_id, vector, top_k)
+        ]
+
+    async def search_by_app(
+        self,
+        app_id: str,
+        query: str,
+        top_k: int,
+        user_id: str,
+        mode: SearchMode = SearchMode.VECTOR,
+    ) -> List[SearchResultSchema]:
+
+        app = await self.app_service.get_app(app_id)
+
+        if app.creator != user_id:
+            raise HTTPException(
+                status_code=403,
+                detail="App을 검색할 권한이 없습니다.",
+            )
+
+        mode = SearchMode(mode)
+
+        if mode != SearchMode.LEXICAL and not self.embedding_service.enabled:
+            raise HTTPException(
+                status_code=400,
+                detail="임베딩이 비활성화되어 있어 검색할 수 없습니다.",
+            )
+
+        if mode != SearchMode.VECTOR and not self.lexical_index_service.enabled:
+            raise HTTPException(
+                status_code=400,
+                detail="키워드 색인이 비활성화되어 있어 검색할 수 없습니다.",
+            )
+
+        try:
+            if mode == SearchMode.VECTOR:
+                hit_list = await self._search_vector(app.id, query, top_k)
+            elif mode == SearchMode.LEXICAL:
+                hit_list = await self.lexical_index_service.search(app.id, query, top_k)
+            else:
+                # 각 검색에서 top_k보다 넉넉한 후보를 가져와 순위를 합산
+                candidate_k = top_k * self.hybrid_candidate_factor
+                # 두 검색은 서로 독립적이므로 동시에 실행
+                ranked_lists = await asyncio.gather(
+                    self._search_vector(app.id, query, candidate_k),
+                    self.lexical_index_service.search(app.id, query, candidate_k),
+                )
+                hit_list = fuse_by_reciprocal_rank(
+                    list(ranked_lists),
+                    rrf_k=self.rrf_k,
+                    top_k=top_k,
+                )
+
+            # 검색 결과 청크를 한 번의 $in 조회로 가져온 뒤 점수 순서로 재배열
+            chunk_map = {
+                chunk.id: chunk
+                for chunk in await self.chunk_repository.get_chunks_by_ids(
+                    [hit.chunk_id for hit in hit_list]
+                )
+            }
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"검색 중 오류 발생: {e}",
+            )
+
+        return [
+            SearchResultSchema(chunk=chunk_map[hit.chunk_id], score=hit.score)
+            for hit in hit_list
+            if hit.chunk_id in chunk_map
+        ]
@@ -0,0 +1,58 @@
+from enum import Enum
+from typing import List, Optional
+
+from bson import ObjectId
+from pydantic import BaseModel, Field
+
+from chunks.domain.model.chunk_schema import ChunkSchema
+
+
+class SearchResultSchema(BaseModel):
+    chunk: ChunkSchema = Field(..., description="검색된 청크")
+    score: float = Field(..., description="유사도 점수")
+
+    class Config:
+        arbitrary_types_allowed = True
+        populate_by_name = True
+
+
+class SearchMode(str, Enum):
+    VECTOR = "vector"
+    LEXICAL = "lexical"
+    HYBRID = "hybrid"
+
+
+class SearchHitSchema(BaseModel):
+    chunk_id: ObjectId = Field(..., description="청크 ID")
+    document_id: ObjectId = Field(..., description="문서 ID")
+    score: float = Field(..., description="검색 점수")
+
+    class Config:
+        arbitrary_types_allowed = True
+        populate_by_name = True
+
+
+class RAGEventType(str, Enum):
+    CONTEXT = "context"
+    TOKEN = "token"
+    DONE = "done"
+
+
+class GenerationMetricsSchema(BaseModel):
+    ttft_ms: Optional[float] = Field(None, description="첫 토큰까지 걸린 시간(ms)")
+    token_count: int = Field(0, description="생성된 토큰(stream chunk) 수")
+    tokens_per_sec: float = Field(0.0, description="첫 토큰 이후 초당 생성 토큰 수")
+    elapsed_ms: float = Field(0.0, description="생성 전체 소요 시간(ms)")
+
+
+class RAGEventSchema(BaseModel):
+    event: RAGEventType = Field(..., description="이벤트 종류")
+    context_list: List[SearchResultSchema] = Field(
+        default_factory=list, description="프롬프트에 사용된 검색 결과"
+    )
+    content: str = Field("", description="생성된 토큰")
+    metrics: Optional[GenerationMetricsSchema] = Field(None, description="생성 지표")
+
+    class Config:
+        arbitrary_types_allowed = True
+        populate_by_name = True
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
+
+from bson import ObjectId
+
+from chunks.domain.model.chunk_schema import ChunkSchema
+from search.domain.model.search_schema import SearchHitSchema
+
+
+class ILexicalIndexRepository(ABC):
+
+    @abstractmethod
+    async def add_chunks(self, app_id: ObjectId, chunk_list: List[ChunkSchema]) -> int:
+        """
+        청크의 content와 tags를 App의 역색인에 추가한다. 이미 있는 청크는 교체한다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_chunks(self, app_id: ObjectId, chunk_ids: List[ObjectId]) -> int:
+        """
+        chunk_ids에 해당하는 청크를 역색인에서 삭제한다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_chunks_by_document_ids(
+        self, app_id: ObjectId, document_ids: List[ObjectId]
+    ) -> int:
+        """
+        document_ids에 속한 청크를 역색인에서 삭제한다.
+        """
+        pass
+
+    @abstractmethod
+    async def rebuild(
+        self, app_id: ObjectId, chunk_batches: AsyncIterator[List[ChunkSchema]]
+    ) -> int:
+        """
+        chunk_batches의 청크만으로 App의 역색인을 다시 만들어 기존 역색인을 교체한다.
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self, app_id: ObjectId, query: str, top_k: int
+    ) -> List[SearchHitSchema]:
+        """
+        BM25 점수 내림차순으로 top_k개의 청크를 반환한다.
+        """
+        pass
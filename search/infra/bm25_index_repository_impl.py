@@ -0,0 +1,553 @@
+import asyncio
+import fcntl
+import json
+import os
+import shutil
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from bson import ObjectId
+
+from chunks.domain.model.chunk_schema import ChunkSchema
+from search.domain.model.search_schema import SearchHitSchema
+from search.domain.repository.lexical_index_repository import ILexicalIndexRepository
+from utils.lexical import tokenize
+
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = "LOCK"
+EMPTY_SEGMENT = "seg-empty"
+SEGMENT_PREFIX = "seg-"
+
+
+def get_index_text(chunk: ChunkSchema) -> str:
+    return " ".join([chunk.content, *chunk.tags])
+
+
+def get_index_entries(
+    chunk_list: List[ChunkSchema],
+) -> List[Tuple[ObjectId, ObjectId, Dict[str, int]]]:
+    return [
+        (chunk.id, chunk.document_id, dict(Counter(tokenize(get_index_text(chunk)))))
+        for chunk in chunk_list
+    ]
+
+
+class _AppIndex:
+    """
+    App 하나의 역색인 상태.
+    문서 번호(idx)는 segment 문서(0 ~ segment_size-1) 뒤에 delta 문서가 이어지는 형태이며,
+    삭제/교체된 문서는 alive 마스크로만 제외하고 compaction 때 실제로 정리한다.
+    """
+
+    def __init__(self, segment: str = EMPTY_SEGMENT):
+        self.segment = segment
+        # term -> (postings offset, postings 길이)
+        self.vocab: Dict[str, Tuple[int, int]] = {}
+        self.postings_doc = np.empty(0, dtype=np.int32)
+        self.postings_tf = np.empty(0, dtype=np.int32)
+        self.segment_size = 0
+        # term -> (idx 목록, tf 목록)
+        self.delta: Dict[str, Tuple[List[int], List[int]]] = {}
+        # idx -> (chunk_id, document_id)
+        self.keys: List[Tuple[ObjectId, ObjectId]] = []
+        self.lengths = np.empty(0, dtype=np.float32)
+        self.alive = np.empty(0, dtype=bool)
+        self.chunk_index: Dict[ObjectId, int] = {}
+        self.document_index: Dict[ObjectId, Set[int]] = {}
+        # 현재 segment 이후 log에 쌓인 변경 수 (compaction 기준)
+        self.log_size = 0
+        # 반영한 log의 byte 위치와 CURRENT 파일 버전 (다른 프로세스의 변경 감지용)
+        self.log_offset = 0
+        self.version: Optional[Tuple[int, int]] = None
+
+    def add(self, entries: List[Tuple[ObjectId, ObjectId, Dict[str, int]]]) -> None:
+        self.delete([chunk_id for chunk_id, _, _ in entries])
+
+        base = len(self.keys)
+        lengths = []
+        for offset, (chunk_id, document_id, terms) in enumerate(entries):
+            idx = base + offset
+            self.keys.append((chunk_id, document_id))
+            self.chunk_index[chunk_id] = idx
+            self.document_index.setdefault(document_id, set()).add(idx)
+            for term, tf in terms.items():
+                doc_list, tf_list = self.delta.setdefault(term, ([], []))
+                doc_list.append(idx)
+                tf_list.append(tf)
+            lengths.append(sum(terms.values()))
+
+        self.lengths = np.concatenate(
+            [self.lengths, np.asarray(lengths, dtype=np.float32)]
+        )
+        self.alive = np.concatenate([self.alive, np.ones(len(entries), dtype=bool)])
+
+    def delete(self, chunk_ids: List[ObjectId]) -> int:
+        deleted = 0
+        for chunk_id in chunk_ids:
+            idx = self.chunk_index.pop(chunk_id, None)
+            if idx is None:
+                continue
+            self.alive[idx] = False
+            self.document_index.get(self.keys[idx][1], set()).discard(idx)
+            deleted += 1
+        return deleted
+
+    def get_chunk_ids_by_document_ids(
+        self, document_ids: List[ObjectId]
+    ) -> List[ObjectId]:
+        return [
+            self.keys[idx][0]
+            for document_id in document_ids
+            for idx in self.document_index.get(document_id, ())
+        ]
+
+    def get_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        doc_list, tf_list = [], []
+
+        if term in self.vocab:
+            offset, size = self.vocab[term]
+            doc_list.append(self.postings_doc[offset : offset + size])
+            tf_list.append(self.postings_tf[offset : offset + size])
+
+        if term in self.delta:
+            delta_doc, delta_tf = self.delta[term]
+            doc_list.append(np.asarray(delta_doc, dtype=np.int32))
+            tf_list.append(np.asarray(delta_tf, dtype=np.int32))
+
+        if not doc_list:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+
+        doc_ids = np.concatenate(doc_list)
+        tfs = np.concatenate(tf_list)
+        mask = self.alive[doc_ids]
+        return doc_ids[mask], tfs[mask]
+
+
+class BM25IndexRepository(ILexicalIndexRepository):
+    """
+    App 단위 BM25 역색인 저장소.
+
+    {index_dir}/app_{app_id}/ 아래에 다음과 같이 저장한다.
+      - CURRENT: 현재 segment 이름
+      - seg-*/: 불변 segment. postings/문서 길이는 .npy로 저장하여 mmap으로 읽는다.
+      - seg-*.jsonl: segment 이후의 추가/삭제 log. 로드 시 segment 위에 다시 적용한다.
+      - LOCK: 프로세스 간 파일 lock (쓰기는 배타, 로드는 공유)
+    log가 compaction_threshold를 넘으면 살아있는 문서만으로 새 segment를 만든 뒤
+    CURRENT를 원자적으로 교체한다.
+
+    여러 uvicorn worker가 같은 디렉터리를 사용할 수 있도록, 쓰기 전과 검색 전에
+    다른 프로세스가 추가한 log를 이어서 반영하고 CURRENT가 바뀌었으면 다시 로드한다.
+    """
+
+    def __init__(
+        self,
+        index_dir: str,
+        k1: float = 1.2,
+        b: float = 0.75,
+        compaction_threshold: int = 10000,
+    ):
+        self.index_dir = Path(index_dir)
+        self.k1 = k1
+        self.b = b
+        self.compaction_threshold = compaction_threshold
+        self._indexes: Dict[ObjectId, _AppIndex] = {}
+        self._locks: Dict[ObjectId, asyncio.Lock] = {}
+
+    def _get_app_dir(self, app_id: ObjectId) -> Path:
+        return self.index_dir / f"app_{app_id}"
+
+    def _get_lock(self, app_id: ObjectId) -> asyncio.Lock:
+        return self._locks.setdefault(app_id, asyncio.Lock())
+
+    def _lock_file(self, app_id: ObjectId, operation: int) -> Optional[IO[Any]]:
+        """
+        App 디렉터리의 LOCK 파일에 flock을 건다. 공유 lock은 아직 디렉터리가 없으면 생략한다.
+        """
+
+        app_dir = self._get_app_dir(app_id)
+        if operation == fcntl.LOCK_SH and not app_dir.exists():
+            return None
+
+        app_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = open(app_dir / LOCK_FILE, "a")
+        fcntl.flock(lock_file, operation)
+        return lock_file
+
+    def _unlock_file(self, lock_file: Optional[IO[Any]]) -> None:
+        if lock_file is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def _get_version(self, app_id: ObjectId) -> Optional[Tuple[int, int]]:
+        # CURRENT는 os.replace로 교체되므로 inode가 바뀌면 다른 segment로 교체된 것
+        try:
+            stat = os.stat(self._get_app_dir(app_id) / CURRENT_FILE)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _get_log_size(self, app_id: ObjectId, segment: str) -> int:
+        try:
+            return os.path.getsize(self._get_app_dir(app_id) / f"{segment}.jsonl")
+        except FileNotFoundError:
+            return 0
+
+    def _is_stale(self, app_id: ObjectId, index: _AppIndex) -> bool:
+        return index.version != self._get_version(app_id) or (
+            index.log_offset != self._get_log_size(app_id, index.segment)
+        )
+
+    def _read_log(
+        self, app_id: ObjectId, segment: str, offset: int
+    ) -> Tuple[List[dict], int]:
+        """
+        offset 이후에 추가된 log를 읽는다. 쓰는 중인 마지막 줄(개행 없음)은 다음에 읽는다.
+        """
+
+        log_path = self._get_app_dir(app_id) / f"{segment}.jsonl"
+        if not log_path.exists():
+            return [], 0
+
+        op_list = []
+        with open(log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                if line.strip():
+                    op_list.append(json.loads(line))
+        return op_list, offset
+
+    def _apply_log(self, index: _AppIndex, op_list: List[dict]) -> None:
+        for op in op_list:
+            if op["op"] == "add":
+                index.add(
+                    [
+                        (ObjectId(chunk_id), ObjectId(document_id), terms)
+                        for chunk_id, document_id, terms in op["entries"]
+                    ]
+                )
+                index.log_size += len(op["entries"])
+            else:
+                index.log_size += index.delete(
+                    [ObjectId(chunk_id) for chunk_id in op["chunk_ids"]]
+                )
+
+    def _load(self, app_id: ObjectId) -> _AppIndex:
+        """
+        segment와 log를 읽어 역색인을 만든다. 호출하는 쪽에서 파일 lock을 잡고 있어야 한다.
+        """
+
+        app_dir = self._get_app_dir(app_id)
+        current_path = app_dir / CURRENT_FILE
+        version = self._get_version(app_id)
+
+        if version is None:
+            index = _AppIndex()
+        else:
+            index = _AppIndex(current_path.read_text().strip())
+            segment_dir = app_dir / index.segment
+
+            with open(segment_dir / "vocab.json", encoding="utf-8") as f:
+                index.vocab = {
+                    term: tuple(value) for term, value in json.load(f).items()
+                }
+            with open(segment_dir / "doc_keys.json", encoding="utf-8") as f:
+                index.keys = [
+                    (ObjectId(chunk_id), ObjectId(document_id))
+                    for chunk_id, document_id in json.load(f)
+                ]
+
+            index.postings_doc = np.load(
+                segment_dir / "postings_doc.npy", mmap_mode="r"
+            )
+            index.postings_tf = np.load(segment_dir / "postings_tf.npy", mmap_mode="r")
+            index.lengths = np.array(np.load(segment_dir / "doc_len.npy"))
+            index.segment_size = len(index.keys)
+            index.alive = np.ones(index.segment_size, dtype=bool)
+
+            for idx, (chunk_id, document_id) in enumerate(index.keys):
+                index.chunk_index[chunk_id] = idx
+                index.document_index.setdefault(document_id, set()).add(idx)
+
+        op_list, index.log_offset = self._read_log(app_id, index.segment, 0)
+        self._apply_log(index, op_list)
+        index.version = version
+
+        return index
+
+    def _load_shared(self, app_id: ObjectId) -> _AppIndex:
+        lock_file = self._lock_file(app_id, fcntl.LOCK_SH)
+        try:
+            return self._load(app_id)
+        finally:
+            self._unlock_file(lock_file)
+
+    def _read_changes(
+        self, app_id: ObjectId, index: _AppIndex
+    ) -> Tuple[Optional[_AppIndex], List[dict], int]:
+        """
+        다른 프로세스의 변경을 읽는다. CURRENT가 바뀌었으면 새로 로드한 역색인을,
+        아니면 이어서 반영할 log와 새 offset을 반환한다.
+        """
+
+        if index.version != self._get_version(app_id):
+            return self._load(app_id), [], 0
+        op_list, offset = self._read_log(app_id, index.segment, index.log_offset)
+        return None, op_list, offset
+
+    def _read_changes_shared(
+        self, app_id: ObjectId, index: _AppIndex
+    ) -> Tuple[Optional[_AppIndex], List[dict], int]:
+        lock_file = self._lock_file(app_id, fcntl.LOCK_SH)
+        try:
+            return self._read_changes(app_id, index)
+        finally:
+            self._unlock_file(lock_file)
+
+    async def _catch_up(self, app_id: ObjectId, read_changes) -> _AppIndex:
+        # 검색이 이벤트 루프에서 역색인을 읽으므로 변경 반영은 이벤트 루프에서 수행
+        index = self._indexes[app_id]
+        loaded, op_list, offset = await asyncio.to_thread(read_changes, app_id, index)
+        if loaded is not None:
+            self._indexes[app_id] = loaded
+            return loaded
+
+        self._apply_log(index, op_list)
+        index.log_offset = offset
+        return index
+
+    async def _get_index(self, app_id: ObjectId) -> _AppIndex:
+        if app_id not in self._indexes:
+            async with self._get_lock(app_id):
+                if app_id not in self._indexes:
+                    self._indexes[app_id] = await asyncio.to_thread(
+                        self._load_shared, app_id
+                    )
+        return self._indexes[app_id]
+
+    @asynccontextmanager
+    async def _write_lock(self, app_id: ObjectId):
+        """
+        프로세스 내 lock과 파일 배타 lock을 잡고, 다른 프로세스의 변경까지 반영한 역색인을 반환한다.
+        """
+
+        await self._get_index(app_id)
+        async with self._get_lock(app_id):
+            lock_file = await asyncio.to_thread(self._lock_file, app_id, fcntl.LOCK_EX)
+            try:
+                yield await self._catch_up(app_id, self._read_changes)
+            finally:
+                self._unlock_file(lock_file)
+
+    def _append_log(self, app_id: ObjectId, index: _AppIndex, op: dict) -> int:
+        app_dir = self._get_app_dir(app_id)
+        app_dir.mkdir(parents=True, exist_ok=True)
+        with open(app_dir / f"{index.segment}.jsonl", "ab") as f:
+            # 반영한 위치 뒤에 남은 내용은 중단된 쓰기의 조각이므로 잘라냄
+            if f.tell() != index.log_offset:
+                f.truncate(index.log_offset)
+            f.write((json.dumps(op, ensure_ascii=False) + "\n").encode("utf-8"))
+            return f.tell()
+
+    def _write_segment(self, app_id: ObjectId, index: _AppIndex) -> None:
+        """
+        살아있는 문서만으로 새 segment를 쓰고 CURRENT를 교체한다.
+        """
+
+        app_dir = self._get_app_dir(app_id)
+        segment = f"seg-{uuid.uuid4().hex}"
+        segment_dir = app_dir / segment
+        segment_dir.mkdir(parents=True)
+
+        # 기존 idx -> 새 idx (삭제된 문서는 -1)
+        remap = np.full(len(index.keys), -1, dtype=np.int32)
+        remap[index.alive] = np.arange(int(index.alive.sum()), dtype=np.int32)
+
+        vocab: Dict[str, List[int]] = {}
+        doc_parts: List[np.ndarray] = []
+        tf_parts: List[np.ndarray] = []
+        offset = 0
+        for term in set(index.vocab) | set(index.delta):
+            doc_ids, tfs = index.get_postings(term)
+            if not len(doc_ids):
+                continue
+            vocab[term] = [offset, len(doc_ids)]
+            doc_parts.append(remap[doc_ids])
+            tf_parts.append(tfs)
+            offset += len(doc_ids)
+
+        np.save(
+            segment_dir / "postings_doc.npy",
+            np.concatenate(doc_parts) if doc_parts else np.empty(0, dtype=np.int32),
+        )
+        np.save(
+            segment_dir / "postings_tf.npy",
+            np.concatenate(tf_parts) if tf_parts else np.empty(0, dtype=np.int32),
+        )
+        np.save(segment_dir / "doc_len.npy", index.lengths[index.alive])
+
+        with open(segment_dir / "vocab.json", "w", encoding="utf-8") as f:
+            json.dump(vocab, f, ensure_ascii=False)
+        with open(segment_dir / "doc_keys.json", "w", encoding="utf-8") as f:
+            json.dump(
+                [
+                    [str(chunk_id), str(document_id)]
+                    for (chunk_id, document_id), alive in zip(index.keys, index.alive)
+                    if alive
+                ],
+                f,
+            )
+
+        tmp_path = app_dir / f"{CURRENT_FILE}.tmp"
+        tmp_path.write_text(segment)
+        os.replace(tmp_path, app_dir / CURRENT_FILE)
+
+        # 교체가 끝난 이전 segment와 log는 정리 (중단된 compaction이 남긴 파일 포함)
+        for path in app_dir.iterdir():
+            if not path.name.startswith(SEGMENT_PREFIX) or path.name == segment:
+                continue
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+    async def _compact_if_needed(self, app_id: ObjectId, index: _AppIndex) -> None:
+        if index.log_size < self.compaction_threshold:
+            return
+
+        await asyncio.to_thread(self._write_segment, app_id, index)
+        self._indexes[app_id] = await asyncio.to_thread(self._load, app_id)
+
+    async def add_chunks(self, app_id: ObjectId, chunk_list: List[ChunkSchema]) -> int:
+        if not chunk_list:
+            return 0
+
+        entries = await asyncio.to_thread(get_index_entries, chunk_list)
+
+        async with self._write_lock(app_id) as index:
+            index.add(entries)
+            index.log_size += len(entries)
+            index.log_offset = await asyncio.to_thread(
+                self._append_log,
+                app_id,
+                index,
+                {
+                    "op": "add",
+                    "entries": [
+                        [str(chunk_id), str(document_id), terms]
+                        for chunk_id, document_id, terms in entries
+                    ],
+                },
+            )
+            await self._compact_if_needed(app_id, index)
+
+        return len(entries)
+
+    async def _delete(
+        self, app_id: ObjectId, index: _AppIndex, chunk_ids: List[ObjectId]
+    ) -> int:
+        deleted = index.delete(chunk_ids)
+        if not deleted:
+            return 0
+
+        index.log_size += deleted
+        index.log_offset = await asyncio.to_thread(
+            self._append_log,
+            app_id,
+            index,
+            {"op": "delete", "chunk_ids": [str(chunk_id) for chunk_id in chunk_ids]},
+        )
+        await self._compact_if_needed(app_id, index)
+        return deleted
+
+    async def delete_chunks(self, app_id: ObjectId, chunk_ids: List[ObjectId]) -> int:
+        if not chunk_ids:
+            return 0
+
+        async with self._write_lock(app_id) as index:
+            return await self._delete(app_id, index, chunk_ids)
+
+    async def delete_chunks_by_document_ids(
+        self, app_id: ObjectId, document_ids: List[ObjectId]
+    ) -> int:
+        if not document_ids:
+            return 0
+
+        async with self._write_lock(app_id) as index:
+            chunk_ids = index.get_chunk_ids_by_document_ids(document_ids)
+            return await self._delete(app_id, index, chunk_ids)
+
+    async def rebuild(
+        self, app_id: ObjectId, chunk_batches: AsyncIterator[List[ChunkSchema]]
+    ) -> int:
+        # 기존 색인과 무관하게 새로 만든 뒤 segment 하나로 저장하고 CURRENT를 교체
+        rebuilt = _AppIndex()
+        count = 0
+        async for chunk_list in chunk_batches:
+            rebuilt.add(await asyncio.to_thread(get_index_entries, chunk_list))
+            count += len(chunk_list)
+
+        async with self._write_lock(app_id):
+            await asyncio.to_thread(self._write_segment, app_id, rebuilt)
+            self._indexes[app_id] = await asyncio.to_thread(self._load, app_id)
+
+        return count
+
+    def _score(self, index: _AppIndex, query: str) -> Optional[np.ndarray]:
+        alive_count = int(index.alive.sum())
+        if not alive_count:
+            return None
+
+        avg_length = float(index.lengths[index.alive].mean()) or 1.0
+        scores = np.zeros(len(index.keys), dtype=np.float32)
+        matched = False
+
+        for term, query_tf in Counter(tokenize(query)).items():
+            doc_ids, tfs = index.get_postings(term)
+            if not len(doc_ids):
+                continue
+
+            matched = True
+            df = len(doc_ids)
+            idf = np.log(1 + (alive_count - df + 0.5) / (df + 0.5))
+            tfs = tfs.astype(np.float32)
+            norm = self.k1 * (1 - self.b + self.b * index.lengths[doc_ids] / avg_length)
+            scores[doc_ids] += query_tf * idf * tfs * (self.k1 + 1) / (tfs + norm)
+
+        return scores if matched else None
+
+    async def search(
+        self, app_id: ObjectId, query: str, top_k: int
+    ) -> List[SearchHitSchema]:
+        if top_k <= 0:
+            return []
+
+        index = await self._get_index(app_id)
+        if self._is_stale(app_id, index):
+            async with self._get_lock(app_id):
+                index = await self._catch_up(app_id, self._read_changes_shared)
+
+        scores = self._score(index, query)
+        if scores is None:
+            return []
+
+        # 점수가 있는 문서 중 상위 top_k만 골라서 정렬
+        candidates = np.flatnonzero(scores > 0)
+        k = min(top_k, len(candidates))
+        top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            SearchHitSchema(
+                chunk_id=index.keys[idx][0],
+                document_id=index.keys[idx][1],
+                score=float(scores[idx]),
+            )
+            for idx in top
+        ]
@@ -0,0 +1,122 @@
+import time
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Response
+
+from common.latency import LatencyTracker
+from common.log_config import get_logger
+from common.sse import sse_response
+from containers import Container
+from search.application.rag_service import RAGService
+from search.application.search_service import SearchService
+from search.interface.dto.search_dto import RAGChatRequest, SearchRequest
+from search.interface.dto.search_mapper import SearchMapper
+from user.domain.user import User
+from user.interface.user_depends import get_current_user
+
+router = APIRouter(prefix="/search")
+
+logger = get_logger(__name__)
+
+
+def set_latency_headers(
+    response: Response, latency_tracker: LatencyTracker, elapsed: float
+) -> None:
+    response.headers["X-Search-Latency-Ms"] = f"{elapsed * 1000:.2f}"
+    for name, value in latency_tracker.percentiles(50, 95, 99).items():
+        response.headers[f"X-Search-Latency-{name.upper()}-Ms"] = f"{value:.2f}"
+
+
+@router.post("/app/{app_id}")
+@inject
+async def search_by_app(
+    app_id: str,
+    req: SearchRequest,
+    response: Response,
+    search_service: SearchService = Depends(Provide[Container.search_service]),
+    latency_tracker: LatencyTracker = Depends(
+        Provide[Container.search_latency_tracker]
+    ),
+    user: User = Depends(get_current_user),
+):
+    try:
+        logger.info(
+            f"검색 요청: {user.user_id} -> app_id: {app_id}, mode: {req.mode.value}"
+        )
+        started = time.perf_counter()
+
+        result_list = await search_service.search_by_app(
+            app_id=app_id,
+            query=req.query,
+            top_k=req.top_k,
+            mode=req.mode,
+            user_id=user.user_id,
+        )
+
+        elapsed = time.perf_counter() - started
+        latency_tracker.record(elapsed)
+        set_latency_headers(response, latency_tracker, elapsed)
+
+        logger.info(
+            f"검색 완료: {user.user_id} -> app_id: {app_id}, {len(result_list)}건, {elapsed * 1000:.1f}ms"
+        )
+
+        return SearchMapper.to_search_response(result_list)
+
+    except HTTPException as e:
+        logger.error(
+            f"검색 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {e.detail}"
+        )
+        raise
+    except Exception as e:
+        logger.error(
+            f"검색 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {str(e)}"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"검색 중 오류 발생: {str(e)}",
+        )
+
+
+@router.post("/app/{app_id}/chat")
+@inject
+async def chat_by_app(
+    app_id: str,
+    req: RAGChatRequest,
+    rag_service: RAGService = Depends(Provide[Container.rag_service]),
+    user: User = Depends(get_current_user),
+):
+    """
+    App 문서를 검색해 답변을 Server-Sent Events로 stream한다.
+    event: context(출처) -> token(생성 토큰, 반복) -> done(TTFT, tokens/sec 등 생성 지표)
+    """
+
+    try:
+        logger.info(
+            f"RAG 요청: {user.user_id} -> app_id: {app_id}, mode: {req.mode.value}"
+        )
+
+        event_stream = await rag_service.chat_by_app(
+            app_id=app_id,
+            query=req.query,
+            top_k=req.top_k,
+            user_id=user.user_id,
+            mode=req.mode,
+            use_cache=req.use_cache,
+        )
+
+        return sse_response(event_stream, SearchMapper.to_rag_event)
+
+    except HTTPException as e:
+        logger.error(
+            f"RAG 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {e.detail}"
+        )
+        raise
+    except Exception as e:
+        logger.error(
+            f"RAG 중 오류 발생: {user.user_id} -> app_id: {app_id}, error: {str(e)}"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"RAG 중 오류 발생: {str(e)}",
+        )
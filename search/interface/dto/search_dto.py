@@ -0,0 +1,54 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from chunks.interface.dto.chunk_dto import ChunkResponse
+from config import get_settings
+from search.domain.model.search_schema import SearchMode
+
+search_setting = get_settings().search
+llm_setting = get_settings().llm
+
+
+class SearchRequest(BaseModel):
+    query: str = Field(..., min_length=1, description="검색 질의")
+    top_k: int = Field(
+        default=search_setting.search_top_k_default,
+        ge=1,
+        le=search_setting.search_top_k_max,
+        description="반환할 최대 청크 수",
+    )
+    mode: SearchMode = Field(
+        default=SearchMode.VECTOR,
+        description="검색 방식 (vector: 벡터 유사도, lexical: BM25, hybrid: RRF 결합)",
+    )
+
+
+class SearchResultResponse(BaseModel):
+    chunk: ChunkResponse = Field(..., description="검색된 청크")
+    score: float = Field(..., description="검색 점수")
+
+
+class SearchResponse(BaseModel):
+    result_list: List[SearchResultResponse] = Field(
+        ..., description="점수 내림차순 검색 결과"
+    )
+
+
+class RAGChatRequest(BaseModel):
+    query: str = Field(..., min_length=1, description="질문")
+    top_k: int = Field(
+        default=llm_setting.rag_top_k_default,
+        ge=1,
+        le=search_setting.search_top_k_max,
+        description="프롬프트에 넣을 최대 청크 수",
+    )
+    mode: SearchMode = Field(default=SearchMode.VECTOR, description="검색 방식")
+    use_cache: bool = Field(default=True, description="LLM 응답 캐시 사용 여부")
+
+
+class RAGContextResponse(BaseModel):
+    chunk_id: str = Field(..., description="청크 ID")
+    document_id: str = Field(..., description="문서 ID")
+    page: int = Field(..., description="페이지 번호")
+    score: float = Field(..., description="검색 점수")
@@ -0,0 +1,52 @@
+from typing import Any, List, Tuple
+
+from chunks.interface.dto.chunk_mapper import ChunkMapper
+from utils.object import get_str_id
+from search.domain.model.search_schema import (
+    RAGEventSchema,
+    RAGEventType,
+    SearchResultSchema,
+)
+from search.interface.dto.search_dto import (
+    RAGContextResponse,
+    SearchResponse,
+    SearchResultResponse,
+)
+
+
+class SearchMapper:
+    @staticmethod
+    def to_search_response(
+        result_list: List[SearchResultSchema],
+    ) -> SearchResponse:
+        return SearchResponse(
+            result_list=[
+                SearchResultResponse(
+                    chunk=ChunkMapper.to_chunk_response(result.chunk),
+                    score=result.score,
+                )
+                for result in result_list
+            ]
+        )
+
+    @staticmethod
+    def to_rag_event(event: RAGEventSchema) -> Tuple[str, Any]:
+        """
+        SSE (event, data) 쌍으로 변환한다. context에는 청크 본문 없이 출처 정보만 보낸다.
+        """
+
+        if event.event == RAGEventType.CONTEXT:
+            return event.event.value, [
+                RAGContextResponse(
+                    chunk_id=get_str_id(result.chunk.id),
+                    document_id=get_str_id(result.chunk.document_id),
+                    page=result.chunk.page,
+                    score=result.score,
+                )
+                for result in event.context_list
+            ]
+
+        if event.event == RAGEventType.TOKEN:
+            return event.event.value, {"content": event.content}
+
+        return event.event.value, event.metrics
@@ -0,0 +1,27 @@
+from typing import Iterable, Optional
+
+import pytest
+from bson import ObjectId
+
+from chunks.domain.model.chunk_schema import ChunkSchema
+
+
+@pytest.fixture
+def make_chunk():
+    def _make_chunk(
+        content: str,
+        document_id: Optional[ObjectId] = None,
+        tags: Iterable[str] = (),
+        page: int = 1,
+    ) -> ChunkSchema:
+        return ChunkSchema(
+            content=content,
+            tags=list(tags),
+            page=page,
+            file_creation_date="",
+            file_mod_date="",
+            document_id=document_id or ObjectId(),
+            creator="tester",
+        )
+
+    return _make_chunk
@@ -0,0 +1,158 @@
+import asyncio
+from typing import Dict, List
+
+from langchain_core.embeddings import Embeddings
+
+from embed.domain.repository.embedding_cache_repository import (
+    IEmbeddingCacheRepository,
+)
+from embed.wrapper.cached_embedding import CachedEmbeddings, get_text_hash
+
+
+class FakeEmbedding(Embeddings):
+    model = "fake"
+
+    def __init__(self):
+        self.requests: List[List[str]] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.requests.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class FakeCacheRepository(IEmbeddingCacheRepository):
+    def __init__(self, fail: bool = False):
+        self.store: Dict[tuple, List[float]] = {}
+        self.fail = fail
+
+    async def get_vectors(
+        self, model: str, text_hashes: List[str], kind: str
+    ) -> Dict[str, List[float]]:
+        if self.fail:
+            raise ConnectionError("mongo down")
+        return {
+            text_hash: self.store[(model, kind, text_hash)]
+            for text_hash in text_hashes
+            if (model, kind, text_hash) in self.store
+        }
+
+    async def set_vectors(
+        self, model: str, vectors: Dict[str, List[float]], kind: str
+    ) -> None:
+        if self.fail:
+            raise ConnectionError("mongo down")
+        for text_hash, vector in vectors.items():
+            self.store.setdefault((model, kind, text_hash), vector)
+
+
+class InstructionEmbedding(FakeEmbedding):
+    """질의와 문서에 서로 다른 instruction을 붙이는 모델(kure 등) 대역"""
+
+    def __init__(self):
+        super().__init__()
+        self.queries: List[str] = []
+
+    def embed_query(self, text: str) -> List[float]:
+        self.queries.append(text)
+        return [float(len(text)), -1.0]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return self.embed_query(text)
+
+
+def test_memory_hit_and_in_batch_deduplication():
+    embedder = FakeEmbedding()
+    cached = CachedEmbeddings(embedder)
+
+    # 정규화 후 같은 텍스트는 한 번만 임베딩
+    vectors = cached.embed_documents(["사과", "바나나", "사과 ", "사과"])
+    assert embedder.requests == [["사과", "바나나"]]
+    assert vectors[0] == vectors[2] == vectors[3] == [2.0, 1.0]
+
+    assert cached.embed_documents(["바나나"]) == [[3.0, 1.0]]
+    assert embedder.requests == [["사과", "바나나"]]
+    assert cached.stats()["memory_hits"] == 1
+    assert cached.stats()["misses"] == 2
+
+
+def test_persistent_hit_after_restart():
+    repository = FakeCacheRepository()
+    first = CachedEmbeddings(FakeEmbedding(), cache_repository=repository)
+    asyncio.run(first.aembed_documents(["사과", "바나나"]))
+
+    # 새 프로세스(빈 LRU)에서는 영구 캐시에서 조회
+    embedder = FakeEmbedding()
+    second = CachedEmbeddings(embedder, cache_repository=repository)
+    vectors = asyncio.run(second.aembed_documents(["바나나", "포도"]))
+
+    assert vectors == [[3.0, 1.0], [2.0, 1.0]]
+    assert embedder.requests == [["포도"]]
+    assert second.stats() == {
+        "memory_hits": 0,
+        "persistent_hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+    asyncio.run(second.aembed_documents(["바나나"]))
+    assert second.stats()["memory_hits"] == 1
+
+
+def test_cache_key_is_scoped_by_model():
+    repository = FakeCacheRepository()
+    asyncio.run(
+        CachedEmbeddings(
+            FakeEmbedding(), model_name="a", cache_repository=repository
+        ).aembed_documents(["사과"])
+    )
+
+    embedder = FakeEmbedding()
+    other = CachedEmbeddings(embedder, model_name="b", cache_repository=repository)
+    asyncio.run(other.aembed_documents(["사과"]))
+
+    assert embedder.requests == [["사과"]]
+    assert set(repository.store) == {
+        ("a", "document", get_text_hash("사과")),
+        ("b", "document", get_text_hash("사과")),
+    }
+
+
+def test_query_and_document_are_embedded_and_cached_separately():
+    repository = FakeCacheRepository()
+    embedder = InstructionEmbedding()
+    cached = CachedEmbeddings(embedder, cache_repository=repository)
+
+    assert asyncio.run(cached.aembed_documents(["사과"])) == [[2.0, 1.0]]
+    # 같은 텍스트라도 질의는 문서 캐시를 쓰지 않고 embed_query로 임베딩
+    assert asyncio.run(cached.aembed_query("사과")) == [2.0, -1.0]
+    assert cached.embed_query("사과") == [2.0, -1.0]
+    assert embedder.requests == [["사과"]]
+    assert embedder.queries == ["사과"]
+    assert set(repository.store) == {
+        ("fake", "document", get_text_hash("사과")),
+        ("fake", "query", get_text_hash("사과")),
+    }
+
+    # 재시작 후에도 질의 벡터는 영구 캐시의 query 항목에서 조회
+    restarted = InstructionEmbedding()
+    second = CachedEmbeddings(restarted, cache_repository=repository)
+    assert asyncio.run(second.aembed_query("사과")) == [2.0, -1.0]
+    assert restarted.queries == []
+
+
+def test_falls_back_to_embedder_when_cache_fails():
+    embedder = FakeEmbedding()
+    cached = CachedEmbeddings(embedder, cache_repository=FakeCacheRepository(True))
+
+    assert asyncio.run(cached.aembed_documents(["사과", "사과"])) == [
+        [2.0, 1.0],
+        [2.0, 1.0],
+    ]
+    assert embedder.requests == [["사과"]]
+
+    # 영구 캐시 저장에 실패해도 LRU 계층은 동작
+    assert asyncio.run(cached.aembed_documents(["사과"])) == [[2.0, 1.0]]
+    assert embedder.requests == [["사과"]]
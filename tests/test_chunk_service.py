@@ -0,0 +1,300 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from langchain_core.documents import Document
+
+from chunks.application.chunk_service import ChunkService
+from chunks.domain.model.chunk_schema import ChunkParameterSchema, ChunkSchema
+from document.domain.model.document_schema import DocumentSchema
+from embed.application.embedding_service import EmbeddingService
+from embed.infra.memory_vector_repository_impl import MemoryVectorRepository
+from search.application.lexical_index_service import LexicalIndexService
+from utils.preprocess import get_page_count
+
+
+class FakeEmbedding:
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FakeChunkingExecutor:
+    """페이지 번호 -> 청크 본문 목록으로 PDF 파싱 결과를 흉내낸다."""
+
+    def __init__(self, pages: Dict[int, List[str]]):
+        self.pages = pages
+        self.calls = 0
+
+    async def run(self, func, *args, **kwargs):
+        self.calls += 1
+        if func is get_page_count:
+            return len(self.pages)
+        return [
+            Document(page_content=content, metadata={"page": page + 1})
+            for page in kwargs["pages"]
+            for content in self.pages[page]
+        ]
+
+
+class FakeChunkRepository:
+    def __init__(self):
+        self.chunks: Dict[ObjectId, ChunkSchema] = {}
+
+    async def iter_chunk_by_document_id(self, document_id, after=None, fields=None):
+        for chunk in list(self.chunks.values()):
+            if chunk.document_id != document_id:
+                continue
+            if fields is None:
+                yield chunk.model_dump(by_alias=True)
+            else:
+                yield {"_id": chunk.id, "content_hash": chunk.content_hash}
+
+    async def create_chunks_bulk(self, chunks: List[ChunkSchema]):
+        self.chunks.update((chunk.id, chunk) for chunk in chunks)
+        return chunks
+
+    async def delete_chunks(self, chunk_ids: List[ObjectId]) -> int:
+        return sum(
+            self.chunks.pop(chunk_id, None) is not None for chunk_id in chunk_ids
+        )
+
+
+class FakeImageService:
+    async def create_images_bulk(self, image_list):
+        return image_list
+
+    async def delete_images(self, image_ids):
+        return 0
+
+    async def delete_image_by_chunk_ids(self, chunk_ids):
+        return 0
+
+
+class FakeDocumentService:
+    def __init__(self, document: DocumentSchema):
+        self.document = document
+
+    async def update_chunk_signature(
+        self, document_ids: List[ObjectId], chunk_signature: Optional[str]
+    ) -> int:
+        self.document.chunk_signature = chunk_signature
+        return 1
+
+    async def get_document_by_app(self, app_id: str) -> List[DocumentSchema]:
+        return [self.document]
+
+
+class FakeAppService:
+    def __init__(self, document: DocumentSchema):
+        self.app = SimpleNamespace(id=document.app_id, creator=document.creator)
+
+    async def get_app(self, app_id: str):
+        return self.app
+
+
+class FakeLexicalIndexRepository:
+    def __init__(self):
+        self.chunk_ids = set()
+
+    async def add_chunks(self, app_id, chunk_list) -> int:
+        self.chunk_ids.update(chunk.id for chunk in chunk_list)
+        return len(chunk_list)
+
+    async def delete_chunks(self, app_id, chunk_ids) -> int:
+        self.chunk_ids.difference_update(chunk_ids)
+        return len(chunk_ids)
+
+    async def rebuild(self, app_id, chunk_batches) -> int:
+        self.batch_sizes = []
+        self.chunk_ids = set()
+        async for chunk_list in chunk_batches:
+            self.batch_sizes.append(len(chunk_list))
+            self.chunk_ids.update(chunk.id for chunk in chunk_list)
+        return len(self.chunk_ids)
+
+
+@pytest.fixture
+def document() -> DocumentSchema:
+    return DocumentSchema(
+        name="manual.pdf",
+        hash="hash",
+        size=1,
+        type="document",
+        extension="pdf",
+        app_id=ObjectId(),
+        creator="tester",
+    )
+
+
+@pytest.fixture
+def make_service(document):
+    def _make_service(
+        executor: FakeChunkingExecutor,
+        chunk_repository: FakeChunkRepository,
+        lexical_index_repository: FakeLexicalIndexRepository,
+        vector_repository: MemoryVectorRepository,
+        lexical_enabled: bool = True,
+    ) -> ChunkService:
+        return ChunkService(
+            app_service=FakeAppService(document),
+            document_service=FakeDocumentService(document),
+            image_service=FakeImageService(),
+            chunk_repository=chunk_repository,
+            chunking_executor=executor,
+            embedding_service=EmbeddingService(FakeEmbedding(), vector_repository),
+            lexical_index_service=LexicalIndexService(
+                lexical_index_repository, enabled=lexical_enabled
+            ),
+            page_window=1,
+        )
+
+    return _make_service
+
+
+def run_chunking(service: ChunkService, document: DocumentSchema) -> int:
+    return asyncio.run(
+        service.chunk_document(
+            document_id=str(document.id),
+            chunk_parameter=ChunkParameterSchema(incremental=True),
+            user_id="tester",
+            document_schema=document,
+        )
+    )
+
+
+def test_incremental_reuses_unchanged_and_drops_stale_chunks(document, make_service):
+    executor = FakeChunkingExecutor({0: ["a", "b"], 1: ["c"]})
+    chunk_repository = FakeChunkRepository()
+    lexical_repository = FakeLexicalIndexRepository()
+    vector_repository = MemoryVectorRepository()
+    service = make_service(
+        executor, chunk_repository, lexical_repository, vector_repository
+    )
+
+    assert run_chunking(service, document) == 3
+    before = {chunk.content: chunk.id for chunk in chunk_repository.chunks.values()}
+
+    # 문서가 바뀌면 (시그니처 변경) 바뀐 청크만 새로 만든다
+    document.hash = "hash-v2"
+    executor.pages = {0: ["a", "b2"], 1: ["c"]}
+    assert run_chunking(service, document) == 3
+
+    after = {chunk.content: chunk.id for chunk in chunk_repository.chunks.values()}
+    assert set(after) == {"a", "b2", "c"}
+    assert after["a"] == before["a"] and after["c"] == before["c"]
+    assert before["b"] not in chunk_repository.chunks
+    assert set(vector_repository.collections[document.app_id]) == set(after.values())
+    assert lexical_repository.chunk_ids == set(after.values())
+
+
+def test_incremental_skips_parsing_when_signature_matches(document, make_service):
+    executor = FakeChunkingExecutor({0: ["a", "b"]})
+    chunk_repository = FakeChunkRepository()
+    service = make_service(
+        executor,
+        chunk_repository,
+        FakeLexicalIndexRepository(),
+        MemoryVectorRepository(),
+    )
+
+    assert run_chunking(service, document) == 2
+    calls = executor.calls
+
+    assert run_chunking(service, document) == 2
+    assert executor.calls == calls
+    assert document.chunk_signature is not None
+
+
+def test_enabling_an_index_invalidates_signature_and_reindexes(document, make_service):
+    executor = FakeChunkingExecutor({0: ["a", "b"]})
+    chunk_repository = FakeChunkRepository()
+    lexical_repository = FakeLexicalIndexRepository()
+    vector_repository = MemoryVectorRepository()
+
+    disabled = make_service(
+        executor,
+        chunk_repository,
+        lexical_repository,
+        vector_repository,
+        lexical_enabled=False,
+    )
+    assert run_chunking(disabled, document) == 2
+    assert lexical_repository.chunk_ids == set()
+    calls = executor.calls
+
+    enabled = make_service(
+        executor, chunk_repository, lexical_repository, vector_repository
+    )
+    assert run_chunking(enabled, document) == 2
+
+    assert executor.calls > calls
+    assert len(chunk_repository.chunks) == 2
+    assert lexical_repository.chunk_ids == set(chunk_repository.chunks)
+    assert set(vector_repository.collections[document.app_id]) == set(
+        chunk_repository.chunks
+    )
+
+
+def test_rebuild_lexical_index_from_stored_chunks(document, make_service):
+    executor = FakeChunkingExecutor({0: ["a", "b", "c"], 1: ["d", "e"]})
+    chunk_repository = FakeChunkRepository()
+    lexical_repository = FakeLexicalIndexRepository()
+    service = make_service(
+        executor, chunk_repository, lexical_repository, MemoryVectorRepository()
+    )
+    run_chunking(service, document)
+
+    # 역색인 파일이 유실된 상황
+    lexical_repository.chunk_ids.clear()
+
+    count = asyncio.run(
+        service.rebuild_lexical_index(str(document.app_id), "tester", batch_size=2)
+    )
+
+    assert count == 5
+    assert lexical_repository.batch_sizes == [2, 2, 1]
+    assert lexical_repository.chunk_ids == set(chunk_repository.chunks)
+
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(service.rebuild_lexical_index(str(document.app_id), "other"))
+    assert e.value.status_code == 403
+
+
+def test_parallel_documents_are_capped_by_setting(document, make_service):
+    service = make_service(
+        FakeChunkingExecutor({}),
+        FakeChunkRepository(),
+        FakeLexicalIndexRepository(),
+        MemoryVectorRepository(),
+    )
+    service.max_parallel_documents = 2
+    running = 0
+    peak = 0
+
+    async def _chunk_document(**kwargs) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 1
+
+    async def _on_complete(document_id, chunk_count, error) -> None:
+        pass
+
+    service.chunk_document = _chunk_document
+    asyncio.run(
+        service.chunk_document_list(
+            document_list=[
+                document.model_copy(update={"id": ObjectId()}) for _ in range(6)
+            ],
+            chunk_parameter=ChunkParameterSchema(max_parallel_documents=100),
+            user_id="tester",
+            on_complete=_on_complete,
+        )
+    )
+
+    assert peak == 2
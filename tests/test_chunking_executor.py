@@ -0,0 +1,79 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from utils.chunking_executor import ChunkingExecutor
+
+
+def sleep_and_return(seconds: float, value: str) -> str:
+    time.sleep(seconds)
+    return value
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+def make_executor(pool_size: int, timeout: float) -> ChunkingExecutor:
+    # 테스트 함수를 pickle 없이 공유하도록 fork 사용
+    return ChunkingExecutor(pool_size=pool_size, timeout=timeout, start_method="fork")
+
+
+def test_timeout_starts_when_the_task_runs():
+    executor = make_executor(pool_size=1, timeout=1.0)
+
+    async def _main():
+        # 두 번째 작업은 첫 작업이 끝날 때까지 대기하므로 대기 시간은 제한 시간에 포함되지 않음
+        return await asyncio.gather(
+            executor.run(sleep_and_return, 0.6, "a"),
+            executor.run(sleep_and_return, 0.6, "b"),
+        )
+
+    try:
+        assert asyncio.run(_main()) == ["a", "b"]
+    finally:
+        executor.shutdown()
+
+
+def test_timeout_kills_worker_and_recycles_pool():
+    executor = make_executor(pool_size=2, timeout=0.5)
+
+    async def _main():
+        worker_pid = await executor.run(get_pid)
+
+        async def _other():
+            # hung 작업이 시간 초과될 때 실행 중이도록 늦게 시작
+            await asyncio.sleep(0.2)
+            return await executor.run(sleep_and_return, 0.4, "other")
+
+        results = await asyncio.gather(
+            executor.run(sleep_and_return, 30, "hung"),
+            _other(),
+            return_exceptions=True,
+        )
+
+        # 시간 초과된 워커가 종료되어 슬롯이 반환되고 새 풀에서 실행됨
+        started = time.monotonic()
+        new_pid = await executor.run(get_pid)
+        return worker_pid, results, new_pid, time.monotonic() - started
+
+    try:
+        worker_pid, results, new_pid, elapsed = asyncio.run(_main())
+    finally:
+        executor.shutdown()
+
+    assert isinstance(results[0], TimeoutError)
+    # 같은 풀에서 실행 중이던 작업은 재생성된 풀에서 다시 실행
+    assert results[1] == "other"
+    assert new_pid != worker_pid
+    assert elapsed < 5
+
+
+def test_timeout_error_message():
+    executor = make_executor(pool_size=1, timeout=0.2)
+
+    with pytest.raises(TimeoutError, match="제한 시간"):
+        asyncio.run(executor.run(sleep_and_return, 30, "hung"))
+    executor.shutdown()
@@ -0,0 +1,57 @@
+import asyncio
+from typing import List
+
+from bson import ObjectId
+from langchain_core.embeddings import Embeddings
+
+from embed.application.embedding_service import EmbeddingService
+from embed.infra.memory_vector_repository_impl import MemoryVectorRepository
+
+
+class FakeEmbedding(Embeddings):
+    def __init__(self):
+        self.batch_sizes: List[int] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.batch_sizes.append(len(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def test_embed_chunks_batches_and_skips_blank_content(make_chunk):
+    app_id = ObjectId()
+    document_id = ObjectId()
+    embedder = FakeEmbedding()
+    repository = MemoryVectorRepository()
+    service = EmbeddingService(embedder, repository, batch_size=2, concurrency=2)
+
+    chunk_list = [make_chunk(f"chunk {i}", document_id) for i in range(5)]
+    chunk_list.append(make_chunk("   ", document_id))
+
+    assert asyncio.run(service.embed_chunks(app_id, chunk_list)) == 5
+    assert sorted(embedder.batch_sizes) == [1, 2, 2]
+    assert set(repository.collections[app_id]) == {c.id for c in chunk_list[:5]}
+
+
+def test_delete_vectors_by_document_ids(make_chunk):
+    app_id = ObjectId()
+    keep, drop = ObjectId(), ObjectId()
+    repository = MemoryVectorRepository()
+    service = EmbeddingService(FakeEmbedding(), repository, batch_size=4)
+
+    chunk_list = [make_chunk("a", keep), make_chunk("b", drop), make_chunk("c", drop)]
+    asyncio.run(service.embed_chunks(app_id, chunk_list))
+
+    assert asyncio.run(service.delete_vectors_by_document_ids(app_id, [drop])) == 2
+    assert set(repository.collections[app_id]) == {chunk_list[0].id}
+
+
+def test_disabled_service_does_not_embed(make_chunk):
+    repository = MemoryVectorRepository()
+    service = EmbeddingService(FakeEmbedding(), repository, enabled=False)
+
+    chunk = make_chunk("content", ObjectId())
+    assert asyncio.run(service.embed_chunks(ObjectId(), [chunk])) == 0
+    assert repository.collections == {}
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from embed.wrapper import haiqv_nomic_embedding
+from embed.wrapper.haiqv_nomic_embedding import HaiqvNomicEmbedding
+
+
+def embedding_response(request: httpx.Request) -> httpx.Response:
+    texts = json.loads(request.content)["input"]
+    return httpx.Response(
+        200, json={"data": [{"embedding": [float(text), 0.0]} for text in texts]}
+    )
+
+
+def make_embedding(handler, **kwargs) -> HaiqvNomicEmbedding:
+    embedding = HaiqvNomicEmbedding(
+        max_retries=kwargs.pop("max_retries", 2),
+        backoff_sec=kwargs.pop("backoff_sec", 0.5),
+        **kwargs,
+    )
+    transport = httpx.MockTransport(handler)
+    embedding._client = httpx.Client(transport=transport)
+    embedding._async_client = httpx.AsyncClient(transport=transport)
+    return embedding
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> List[float]:
+    # 백오프 대기 시간만 기록하고 실제로 기다리지 않음
+    # time/asyncio 모듈 전역을 바꾸므로 pymongo 모니터 등 다른 스레드의 대기는 그대로 수행
+    delays: List[float] = []
+    test_thread = threading.get_ident()
+    real_sleep = time.sleep
+    real_asleep = asyncio.sleep
+
+    def _sleep(delay):
+        if threading.get_ident() != test_thread:
+            return real_sleep(delay)
+        delays.append(delay)
+
+    async def _asleep(delay, *args, **kwargs):
+        if threading.get_ident() != test_thread:
+            return await real_asleep(delay, *args, **kwargs)
+        delays.append(delay)
+
+    monkeypatch.setattr(haiqv_nomic_embedding.asyncio, "sleep", _asleep)
+    monkeypatch.setattr(haiqv_nomic_embedding.time, "sleep", _sleep)
+    return delays
+
+
+def test_retries_429_with_retry_after(sleeps):
+    status_list = [429, 503]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if status_list:
+            status = status_list.pop(0)
+            return httpx.Response(status, headers={"Retry-After": "3"})
+        return embedding_response(request)
+
+    embedding = make_embedding(handler)
+
+    assert asyncio.run(embedding.aembed_documents(["1", "2"])) == [
+        [1.0, 0.0],
+        [2.0, 0.0],
+    ]
+    assert sleeps == [3.0, 3.0]
+
+
+def test_5xx_retries_run_out(sleeps):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(502)
+
+    embedding = make_embedding(handler, max_retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(embedding.aembed_query("1"))
+    # 최초 요청 + 재시도 2회, 지수 백오프
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+    calls.clear()
+    sleeps.clear()
+    with pytest.raises(httpx.HTTPStatusError):
+        embedding.embed_query("1")
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_client_error_is_not_retried(sleeps):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(400)
+
+    embedding = make_embedding(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(embedding.aembed_query("1"))
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_transport_error_is_retried(sleeps):
+    failures = [httpx.ConnectError("connection refused")]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if failures:
+            raise failures.pop()
+        return embedding_response(request)
+
+    embedding = make_embedding(handler)
+
+    assert embedding.embed_documents(["7"]) == [[7.0, 0.0]]
+    assert sleeps == [0.5]
+
+
+def test_batches_are_split_and_keep_order():
+    batch_sizes = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        batch_sizes.append(len(texts))
+        # 앞 배치가 늦게 끝나도 결과는 입력 순서를 유지해야 함
+        await asyncio.sleep(0.01 * (10 - int(texts[0]) // 3))
+        return embedding_response(request)
+
+    embedding = make_embedding(handler, max_batch_size=3, max_in_flight=4)
+    texts = [str(i) for i in range(10)]
+
+    vectors = asyncio.run(embedding.aembed_documents(texts))
+
+    assert vectors == [[float(i), 0.0] for i in range(10)]
+    assert sorted(batch_sizes) == [1, 3, 3, 3]
+
+
+def test_in_flight_requests_are_bounded():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return embedding_response(request)
+
+    embedding = make_embedding(handler, max_batch_size=1, max_in_flight=2)
+
+    vectors = asyncio.run(embedding.aembed_documents([str(i) for i in range(8)]))
+
+    assert len(vectors) == 8
+    assert peak == 2
@@ -0,0 +1,166 @@
+import asyncio
+
+from bson import ObjectId
+
+from search.infra.bm25_index_repository_impl import BM25IndexRepository
+from utils.lexical import tokenize
+
+
+def test_tokenize_korean_bigrams_and_codes():
+    assert tokenize("유압밸브 KV-2041A") == [
+        "유압",
+        "압밸",
+        "밸브",
+        "kv-2041a",
+        "kv",
+        "2041a",
+    ]
+    assert tokenize("펌프 Ｖ２") == ["펌프", "v2"]
+
+
+def test_index_persists_across_reload_and_compaction(tmp_path, make_chunk):
+    app_id = ObjectId()
+    document_id = ObjectId()
+    chunk_list = [
+        make_chunk(f"점검 항목 {i}", document_id, tags=[f"P-{i:04d}"])
+        for i in range(10)
+    ]
+
+    async def _build():
+        repository = BM25IndexRepository(str(tmp_path), compaction_threshold=8)
+        await repository.add_chunks(app_id, chunk_list)
+        await repository.delete_chunks(app_id, [chunk_list[3].id])
+        # compaction 이후의 변경은 log로 남는다
+        replaced = make_chunk("교체 항목", ObjectId(), tags=["P-0003"])
+        await repository.add_chunks(app_id, [replaced])
+        return replaced, await repository.search(app_id, "P-0003", 5)
+
+    async def _reload():
+        repository = BM25IndexRepository(str(tmp_path), compaction_threshold=8)
+        return await repository.search(app_id, "P-0003", 5)
+
+    replaced, before = asyncio.run(_build())
+    after = asyncio.run(_reload())
+
+    assert before[0].chunk_id == replaced.id
+    assert chunk_list[3].id not in {hit.chunk_id for hit in before}
+    assert [(hit.chunk_id, hit.score) for hit in after] == [
+        (hit.chunk_id, hit.score) for hit in before
+    ]
+
+
+def test_delete_chunks_by_document_ids(tmp_path, make_chunk):
+    app_id = ObjectId()
+    document_id, other_id = ObjectId(), ObjectId()
+    repository = BM25IndexRepository(str(tmp_path))
+
+    async def _run():
+        await repository.add_chunks(
+            app_id,
+            [
+                make_chunk("냉각수 펌프", document_id),
+                make_chunk("냉각수 밸브", other_id),
+            ],
+        )
+        deleted = await repository.delete_chunks_by_document_ids(app_id, [document_id])
+        return deleted, await repository.search(app_id, "냉각수", 5)
+
+    deleted, hit_list = asyncio.run(_run())
+
+    assert deleted == 1
+    assert [hit.document_id for hit in hit_list] == [other_id]
+
+
+def test_workers_sharing_index_dir_see_each_others_writes(tmp_path, make_chunk):
+    app_id = ObjectId()
+    # 같은 디렉터리를 쓰는 두 uvicorn worker
+    worker_a = BM25IndexRepository(str(tmp_path), compaction_threshold=4)
+    worker_b = BM25IndexRepository(str(tmp_path), compaction_threshold=4)
+
+    pump = make_chunk("냉각수 펌프")
+    valve = make_chunk("냉각수 밸브")
+    filter_ = make_chunk("냉각수 필터")
+
+    async def _search(repository):
+        return {hit.chunk_id for hit in await repository.search(app_id, "냉각수", 10)}
+
+    async def _run():
+        assert await _search(worker_b) == set()
+
+        await worker_a.add_chunks(app_id, [pump, valve])
+        seen_by_b = await _search(worker_b)
+
+        # b가 삭제하고 compaction까지 한 뒤에도 a의 쓰기가 유실되지 않아야 함
+        await worker_b.delete_chunks(app_id, [pump.id])
+        await worker_b.add_chunks(app_id, [make_chunk("압력 센서")])
+        await worker_a.add_chunks(app_id, [filter_])
+
+        reloaded = BM25IndexRepository(str(tmp_path))
+        return (
+            seen_by_b,
+            await _search(worker_a),
+            await _search(worker_b),
+            await _search(reloaded),
+        )
+
+    seen_by_b, seen_by_a, seen_by_b_after, reloaded = asyncio.run(_run())
+
+    assert seen_by_b == {pump.id, valve.id}
+    assert seen_by_a == seen_by_b_after == reloaded == {valve.id, filter_.id}
+    # compaction 후에는 현재 segment와 그 log만 남는다
+    segments = {path.stem for path in (tmp_path / f"app_{app_id}").glob("seg-*")}
+    assert len(segments) == 1
+
+
+def test_partial_log_line_from_crashed_writer_is_discarded(tmp_path, make_chunk):
+    app_id = ObjectId()
+    pump = make_chunk("냉각수 펌프")
+    valve = make_chunk("냉각수 밸브")
+
+    async def _run():
+        await BM25IndexRepository(str(tmp_path)).add_chunks(app_id, [pump])
+
+        # 쓰는 도중 종료된 worker가 남긴 개행 없는 log 조각
+        log_path = next((tmp_path / f"app_{app_id}").glob("seg-*.jsonl"))
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "entries": [["')
+
+        repository = BM25IndexRepository(str(tmp_path))
+        await repository.add_chunks(app_id, [valve])
+        reloaded = BM25IndexRepository(str(tmp_path))
+        return await reloaded.search(app_id, "냉각수", 5)
+
+    hit_list = asyncio.run(_run())
+
+    assert {hit.chunk_id for hit in hit_list} == {pump.id, valve.id}
+
+
+def test_rebuild_replaces_index_with_given_chunks(tmp_path, make_chunk):
+    app_id = ObjectId()
+    stale = make_chunk("냉각수 펌프")
+    kept = make_chunk("냉각수 밸브")
+    missing = make_chunk("냉각수 필터")
+
+    async def _batches():
+        yield [kept]
+        yield [missing]
+
+    async def _run():
+        repository = BM25IndexRepository(str(tmp_path), compaction_threshold=100)
+        await repository.add_chunks(app_id, [stale, kept])
+
+        count = await repository.rebuild(app_id, _batches())
+        reloaded = BM25IndexRepository(str(tmp_path))
+        return (
+            count,
+            await repository.search(app_id, "냉각수", 5),
+            await reloaded.search(app_id, "냉각수", 5),
+        )
+
+    count, hit_list, reloaded_hit_list = asyncio.run(_run())
+
+    assert count == 2
+    assert {hit.chunk_id for hit in hit_list} == {kept.id, missing.id}
+    assert [hit.chunk_id for hit in reloaded_hit_list] == [
+        hit.chunk_id for hit in hit_list
+    ]
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from common.concurrency import ConcurrencyLimiter
+from llm.application.llm_response_cache import LLMResponseCache
+from llm.application.llm_service import LLMService
+from llm.domain.model.llm_schema import Message, Role
+from llm.infra.repository.fake_llm_repository_impl import FakeLLMRepository
+
+MESSAGES = [Message(role=Role.USER, content="하나 둘 셋 넷")]
+
+
+def test_limiter_rejects_when_queue_wait_exceeds_timeout():
+    limiter = ConcurrencyLimiter(max_concurrency=1, acquire_timeout=0.05)
+    service = LLMService(FakeLLMRepository(token_delay=0.05), limiter=limiter)
+
+    async def _run():
+        return await asyncio.gather(
+            service.chat_async(MESSAGES),
+            service.chat_async(MESSAGES),
+            return_exceptions=True,
+        )
+
+    result_list = asyncio.run(_run())
+
+    assert result_list[0] == "[fake] 하나 둘 셋 넷"
+    assert isinstance(result_list[1], HTTPException)
+    assert result_list[1].status_code == 503
+    assert limiter.in_flight == 0
+
+
+def test_stream_times_out_and_releases_slot():
+    limiter = ConcurrencyLimiter(max_concurrency=1, acquire_timeout=0.05)
+    service = LLMService(
+        FakeLLMRepository(token_delay=0.05), limiter=limiter, timeout=0.12
+    )
+
+    async def _run():
+        token_list = []
+        with pytest.raises(HTTPException) as e:
+            async for token in await service.chat_astream(MESSAGES):
+                token_list.append(token)
+        return token_list, e.value
+
+    token_list, error = asyncio.run(_run())
+
+    assert error.status_code == 504
+    assert 0 < len(token_list) < 5
+    assert limiter.in_flight == 0
+
+
+def test_stream_rejects_before_streaming_when_overloaded():
+    limiter = ConcurrencyLimiter(max_concurrency=1, acquire_timeout=0.05)
+    service = LLMService(FakeLLMRepository(), limiter=limiter)
+
+    async def _run():
+        # 자리는 stream을 반환하기 전에 확보되고, 소비 전이라도 닫으면 반납된다
+        first = await service.chat_astream(MESSAGES)
+        assert limiter.in_flight == 1
+
+        with pytest.raises(HTTPException) as e:
+            await service.chat_astream(MESSAGES)
+
+        await first.aclose()
+        assert limiter.in_flight == 0
+
+        second = await service.chat_astream(MESSAGES)
+        return e.value, [token async for token in second]
+
+    error, token_list = asyncio.run(_run())
+
+    assert error.status_code == 503
+    assert "".join(token_list) == "[fake] 하나 둘 셋 넷"
+    assert limiter.in_flight == 0
+
+
+def test_response_cache_single_flight_and_opt_out():
+    llm_repository = FakeLLMRepository(token_delay=0.01)
+    service = LLMService(llm_repository, response_cache=LLMResponseCache())
+    variant = [Message(role=Role.USER, content="  하나 둘\n셋   넷 ")]
+
+    async def _run():
+        result_list = await asyncio.gather(
+            *[service.chat_async(MESSAGES) for _ in range(3)]
+        )
+        result_list.append(await service.chat_async(variant))
+        result_list.append(await service.chat_async(MESSAGES, use_cache=False))
+        return result_list
+
+    result_list = asyncio.run(_run())
+
+    assert set(result_list) == {"[fake] 하나 둘 셋 넷"}
+    # 동시 요청 3건 + 공백만 다른 요청 1건은 한 번만 호출, opt-out 요청은 별도 호출
+    assert llm_repository.calls == 2
+    assert service.response_cache.stats()["coalesced"] == 2
+
+
+def test_response_cache_expires_and_skips_failures():
+    class FailingLLMRepository(FakeLLMRepository):
+        async def ainvoke(self, messages):
+            self.calls += 1
+            raise RuntimeError("LLM 오류")
+
+    cache = LLMResponseCache(ttl=0.05)
+    service = LLMService(FakeLLMRepository(), response_cache=cache)
+    failing = LLMService(FailingLLMRepository(), response_cache=cache)
+
+    async def _run():
+        await service.chat_async(MESSAGES)
+        await asyncio.sleep(0.06)
+        await service.chat_async(MESSAGES)
+
+        other = [Message(role=Role.USER, content="실패")]
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await failing.chat_async(other)
+
+    asyncio.run(_run())
+
+    assert service.llm_repository.calls == 2
+    assert failing.llm_repository.calls == 2
@@ -0,0 +1,129 @@
+import json
+import os
+
+from utils.markdown_cache import MarkdownCache
+
+PAGES = [{"text": "# 제목\n본문", "metadata": {"page": 1}}]
+
+
+def make_cache(tmp_path, max_bytes=1024 * 1024, max_entries=100) -> MarkdownCache:
+    return MarkdownCache(
+        cache_dir=str(tmp_path / "markdown"),
+        max_bytes=max_bytes,
+        max_entries=max_entries,
+    )
+
+
+def set_entries(cache: MarkdownCache, count: int) -> list:
+    # mtime 해상도에 의존하지 않도록 사용 시각을 명시적으로 지정
+    keys = []
+    for i in range(count):
+        key = cache.get_key(f"hash-{i}", {})
+        cache.set(key, PAGES, [])
+        os.utime(cache._get_path(key), (1000 + i, 1000 + i))
+        keys.append(key)
+    return keys
+
+
+def test_get_returns_cached_pages(tmp_path):
+    cache = make_cache(tmp_path)
+    image = tmp_path / "page-1.png"
+    image.write_bytes(b"png")
+
+    key = cache.get_key("hash", {"dpi": 150})
+    cache.set(key, PAGES, [str(image)])
+
+    assert cache.get(key) == PAGES
+
+
+def test_get_misses_on_unknown_key_and_missing_image(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.get(cache.get_key("hash", {})) is None
+
+    key = cache.get_key("hash", {"dpi": 150})
+    cache.set(key, PAGES, [str(tmp_path / "deleted.png")])
+
+    assert cache.get(key) is None
+    assert not os.path.exists(cache._get_path(key))
+
+
+def test_key_changes_with_options(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.get_key("hash", {"dpi": 150, "write_images": True})
+    cache.set(key, PAGES, [])
+
+    assert cache.get_key("hash", {"write_images": True, "dpi": 150}) == key
+    assert cache.get(cache.get_key("hash", {"dpi": 300, "write_images": True})) is None
+
+
+def test_malformed_entry_is_a_miss(tmp_path):
+    cache = make_cache(tmp_path)
+    os.makedirs(cache.cache_dir)
+
+    key = cache.get_key("hash", {})
+    with open(cache._get_path(key), "w", encoding="utf-8") as f:
+        json.dump({"pages": PAGES}, f)
+    broken_key = cache.get_key("broken", {})
+    with open(cache._get_path(broken_key), "w", encoding="utf-8") as f:
+        f.write("{")
+
+    assert cache.get(key) is None
+    assert cache.get(broken_key) is None
+    assert os.listdir(cache.cache_dir) == []
+
+
+def test_evict_by_entry_count(tmp_path):
+    cache = make_cache(tmp_path, max_entries=3)
+    keys = set_entries(cache, 3)
+
+    # 가장 오래 사용하지 않은 항목부터 삭제되므로 조회한 항목은 남는다
+    assert cache.get(keys[0]) == PAGES
+    cache.set(cache.get_key("hash-new", {}), PAGES, [])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == PAGES
+    assert cache.get(keys[2]) == PAGES
+    assert len(os.listdir(cache.cache_dir)) == 3
+
+
+def test_evict_by_size(tmp_path):
+    cache = make_cache(tmp_path)
+    keys = set_entries(cache, 4)
+    entry_size = os.path.getsize(cache._get_path(keys[0]))
+
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+
+    assert [cache.get(key) is not None for key in keys] == [False, False, True, True]
+
+
+def test_evict_skips_entries_removed_concurrently(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path, max_entries=1)
+    keys = set_entries(cache, 2)
+    removed_path = cache._get_path(keys[0])
+
+    class RemovedEntry:
+        # 목록 조회 이후 다른 프로세스가 삭제한 항목
+        name = os.path.basename(removed_path)
+        path = removed_path
+
+        def stat(self):
+            raise FileNotFoundError(removed_path)
+
+    real_scandir = os.scandir
+
+    class RacingScandir:
+        def __init__(self, path):
+            self.iterator = real_scandir(path)
+
+        def __enter__(self):
+            entries = [e for e in self.iterator if e.path != removed_path]
+            return [RemovedEntry()] + entries
+
+        def __exit__(self, *exc):
+            self.iterator.close()
+
+    monkeypatch.setattr(os, "scandir", RacingScandir)
+    cache.evict()
+
+    assert cache.get(keys[1]) == PAGES
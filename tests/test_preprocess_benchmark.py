@@ -0,0 +1,71 @@
+import random
+import re
+import timeit
+
+from utils.preprocess import process_page_markdown
+
+
+# 기존 구현 (비교 기준)
+def legacy_extract_images_and_clean_text(md_text: str) -> tuple[str, list[str]]:
+    pattern = r"!\[\]\((.*?)\)"
+    image_paths = re.findall(pattern, md_text)
+    cleaned_text = re.sub(pattern, "", md_text).replace("#", "").replace("*", "")
+    return cleaned_text.strip(), image_paths
+
+
+def legacy_extract_tags(md_text: str) -> list[str]:
+    lines = md_text.splitlines()
+    tags = []
+    for line in lines:
+        match = re.match(r"^#{1,4} (.+)", line)
+        if match:
+            tags.append(match.group(1).strip().replace("*", ""))
+    return tags
+
+
+def legacy_process_page_markdown(md_text: str) -> tuple[str, list[str], list[str]]:
+    cleaned_text, image_paths = legacy_extract_images_and_clean_text(md_text)
+    return cleaned_text, image_paths, legacy_extract_tags(md_text)
+
+
+def make_corpus(page_count: int = 500, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    words = ["문서", "청크", "embedding", "**강조**", "pdf", "표", "그림", "데이터"]
+    pages = []
+
+    for page in range(page_count):
+        lines = []
+        for section in range(rng.randint(2, 5)):
+            level = "#" * rng.randint(1, 5)
+            lines.append(f"{level} **Section {page}-{section}**")
+            for _ in range(rng.randint(10, 30)):
+                lines.append(" ".join(rng.choices(words, k=rng.randint(5, 20))))
+                if rng.random() < 0.05:
+                    lines.append(f"![](./static/data/app/doc/p{page}-{section}.png)")
+            lines.append("")
+        pages.append("\n".join(lines))
+
+    return pages
+
+
+def test_process_page_markdown_matches_legacy():
+    for md_text in make_corpus(page_count=100):
+        assert process_page_markdown(md_text) == legacy_process_page_markdown(md_text)
+
+
+def test_process_page_markdown_benchmark():
+    # 공유 CI 머신에서는 시간 측정이 불안정하므로 결과만 출력 (pytest -s)
+    corpus = make_corpus()
+
+    def run(func):
+        return min(
+            timeit.repeat(lambda: [func(page) for page in corpus], number=3, repeat=5)
+        )
+
+    legacy = run(legacy_process_page_markdown)
+    current = run(process_page_markdown)
+
+    print(
+        f"\nlegacy {legacy * 1000:.1f}ms, current {current * 1000:.1f}ms, "
+        f"speedup x{legacy / current:.2f} ({len(corpus)} pages x 3)"
+    )
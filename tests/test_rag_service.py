@@ -0,0 +1,108 @@
+import asyncio
+from typing import List
+
+import pytest
+from fastapi import HTTPException
+
+from common.latency import LatencyTracker
+from common.sse import format_sse
+from llm.application.llm_service import LLMService
+from llm.domain.model.llm_schema import Role
+from llm.infra.repository.fake_llm_repository_impl import FakeLLMRepository
+from search.application.rag_service import RAGService
+from search.domain.model.search_schema import RAGEventType, SearchResultSchema
+from search.interface.dto.search_mapper import SearchMapper
+
+
+@pytest.fixture
+def make_result(make_chunk):
+    def _make_result(content: str, score: float) -> SearchResultSchema:
+        return SearchResultSchema(chunk=make_chunk(content, page=3), score=score)
+
+    return _make_result
+
+
+class FakeSearchService:
+    def __init__(self, result_list: List[SearchResultSchema]):
+        self.result_list = result_list
+
+    async def search_by_app(self, app_id, query, top_k, user_id, mode):
+        if user_id != "tester":
+            raise HTTPException(status_code=403, detail="App을 검색할 권한이 없습니다.")
+        return self.result_list[:top_k]
+
+
+def make_service(result_list, llm_repository, context_max_chars=6000):
+    return RAGService(
+        search_service=FakeSearchService(result_list),
+        llm_service=LLMService(llm_repository),
+        ttft_tracker=LatencyTracker(window=10),
+        context_max_chars=context_max_chars,
+    )
+
+
+async def collect(service: RAGService, user_id: str = "tester"):
+    event_stream = await service.chat_by_app("app", "밸브 교체 주기는?", 2, user_id)
+    return [event async for event in event_stream]
+
+
+def test_rag_streams_context_tokens_and_metrics(make_result):
+    result_list = [
+        make_result("밸브는 6개월마다 교체한다.", 0.9),
+        make_result("펌프는 1년마다 점검한다.", 0.5),
+    ]
+    llm_repository = FakeLLMRepository(
+        response="밸브는 6개월마다 교체합니다 [1].", token_delay=0.001
+    )
+    service = make_service(result_list, llm_repository)
+
+    event_list = asyncio.run(collect(service))
+
+    assert event_list[0].event == RAGEventType.CONTEXT
+    assert [result.chunk.id for result in event_list[0].context_list] == [
+        result.chunk.id for result in result_list
+    ]
+
+    token_list = [e.content for e in event_list if e.event == RAGEventType.TOKEN]
+    assert "".join(token_list) == "밸브는 6개월마다 교체합니다 [1]."
+
+    metrics = event_list[-1].metrics
+    assert event_list[-1].event == RAGEventType.DONE
+    assert metrics.token_count == len(token_list) == 4
+    assert metrics.ttft_ms is not None and metrics.ttft_ms <= metrics.elapsed_ms
+    assert metrics.tokens_per_sec > 0
+    assert service.ttft_tracker.percentiles(50)["p50"] == pytest.approx(metrics.ttft_ms)
+
+
+def test_rag_prompt_orders_context_and_respects_limit(make_result):
+    result_list = [make_result("가" * 30, 0.9), make_result("나" * 30, 0.5)]
+    service = make_service(result_list, FakeLLMRepository(), context_max_chars=50)
+
+    messages = service.build_messages("질문", result_list)
+
+    assert [m.role for m in messages] == [Role.SYSTEM, Role.USER]
+    assert "[1] (p.3) " + "가" * 30 in messages[0].content
+    assert "나" not in messages[0].content
+    assert messages[1].content == "질문"
+
+
+def test_rag_search_error_raises_before_stream(make_result):
+    service = make_service([make_result("본문", 1.0)], FakeLLMRepository())
+
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(collect(service, user_id="other"))
+
+    assert e.value.status_code == 403
+
+
+def test_rag_event_to_sse(make_result):
+    service = make_service([make_result("본문", 1.0)], FakeLLMRepository())
+    event_list = asyncio.run(collect(service))
+
+    payload = "".join(
+        format_sse(*SearchMapper.to_rag_event(event)) for event in event_list
+    )
+
+    assert payload.startswith("event: context\ndata: [{")
+    assert 'event: token\ndata: {"content": "[fake] "}\n\n' in payload
+    assert "event: done\ndata: " in payload and '"ttft_ms"' in payload
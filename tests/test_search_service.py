@@ -0,0 +1,163 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from langchain_core.embeddings import Embeddings
+
+from chunks.domain.model.chunk_schema import ChunkSchema
+from common.latency import LatencyTracker
+from embed.application.embedding_service import EmbeddingService
+from embed.infra.memory_vector_repository_impl import MemoryVectorRepository
+from search.application.lexical_index_service import LexicalIndexService
+from search.application.search_service import SearchService, fuse_by_reciprocal_rank
+from search.domain.model.search_schema import SearchHitSchema, SearchMode
+from search.infra.bm25_index_repository_impl import BM25IndexRepository
+
+VOCABULARY = ["사과", "바나나", "포도", "milvus", "mongo"]
+
+
+class BagOfWordsEmbedding(Embeddings):
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [[float(text.count(word)) for word in VOCABULARY] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class FakeAppService:
+    def __init__(self, app_id: ObjectId, creator: str):
+        self.app = SimpleNamespace(id=app_id, creator=creator)
+
+    async def get_app(self, app_id: str):
+        return self.app
+
+
+class FakeChunkRepository:
+    def __init__(self, chunk_list: List[ChunkSchema]):
+        self.chunks = {chunk.id: chunk for chunk in chunk_list}
+        self.calls = 0
+
+    async def get_chunks_by_ids(self, chunk_ids: List[ObjectId]) -> List[ChunkSchema]:
+        self.calls += 1
+        return [self.chunks[id] for id in reversed(chunk_ids) if id in self.chunks]
+
+
+def make_service(chunk_list: List[ChunkSchema], index_dir):
+    app_id = ObjectId()
+    embedding_service = EmbeddingService(
+        BagOfWordsEmbedding(), MemoryVectorRepository()
+    )
+    asyncio.run(embedding_service.embed_chunks(app_id, chunk_list))
+    lexical_index_service = LexicalIndexService(BM25IndexRepository(str(index_dir)))
+    asyncio.run(lexical_index_service.index_chunks(app_id, chunk_list))
+
+    chunk_repository = FakeChunkRepository(chunk_list)
+    service = SearchService(
+        app_service=FakeAppService(app_id, "tester"),
+        embedding_service=embedding_service,
+        lexical_index_service=lexical_index_service,
+        chunk_repository=chunk_repository,
+    )
+    return service, chunk_repository
+
+
+def test_search_returns_top_k_in_score_order(tmp_path, make_chunk):
+    chunk_list = [
+        make_chunk("사과 사과 바나나"),
+        make_chunk("포도 포도 포도"),
+        make_chunk("milvus mongo"),
+        make_chunk("사과 포도"),
+    ]
+    service, chunk_repository = make_service(chunk_list, tmp_path)
+
+    result_list = asyncio.run(service.search_by_app("app", "사과", 2, "tester"))
+
+    assert [result.chunk.id for result in result_list] == [
+        chunk_list[0].id,
+        chunk_list[3].id,
+    ]
+    assert result_list[0].score >= result_list[1].score
+    assert chunk_list[1].id not in {result.chunk.id for result in result_list}
+    assert chunk_repository.calls == 1
+
+
+def test_search_skips_vectors_without_chunk(tmp_path, make_chunk):
+    chunk_list = [make_chunk("사과"), make_chunk("사과 바나나")]
+    service, chunk_repository = make_service(chunk_list, tmp_path)
+    del chunk_repository.chunks[chunk_list[0].id]
+
+    result_list = asyncio.run(service.search_by_app("app", "사과", 5, "tester"))
+
+    assert [result.chunk.id for result in result_list] == [chunk_list[1].id]
+
+
+def test_search_requires_app_owner(tmp_path, make_chunk):
+    service, _ = make_service([make_chunk("사과")], tmp_path)
+
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(service.search_by_app("app", "사과", 5, "other"))
+
+    assert e.value.status_code == 403
+
+
+def test_lexical_search_matches_exact_code(tmp_path, make_chunk):
+    chunk_list = [
+        make_chunk("밸브 부품 번호 KV-2041A 교체 절차"),
+        make_chunk("밸브 부품 번호 KV-2014A 점검 절차"),
+        make_chunk("사과 바나나"),
+    ]
+    service, _ = make_service(chunk_list, tmp_path)
+
+    result_list = asyncio.run(
+        service.search_by_app(
+            "app", "KV-2041A 교체", 5, "tester", mode=SearchMode.LEXICAL
+        )
+    )
+
+    assert result_list[0].chunk.id == chunk_list[0].id
+    assert chunk_list[2].id not in {result.chunk.id for result in result_list}
+
+
+def test_hybrid_search_finds_code_missing_from_vector(tmp_path, make_chunk):
+    chunk_list = [
+        make_chunk("사과 사과 사과"),
+        make_chunk("포도 바나나"),
+        make_chunk("모델 AX-100 정격 전압"),
+    ]
+    service, _ = make_service(chunk_list, tmp_path)
+
+    result_list = asyncio.run(
+        service.search_by_app("app", "사과 AX-100", 2, "tester", mode="hybrid")
+    )
+
+    assert {result.chunk.id for result in result_list} == {
+        chunk_list[0].id,
+        chunk_list[2].id,
+    }
+
+
+def test_reciprocal_rank_fusion_prefers_agreement():
+    hits = {
+        name: SearchHitSchema(chunk_id=ObjectId(), document_id=ObjectId(), score=0)
+        for name in "abc"
+    }
+
+    fused = fuse_by_reciprocal_rank(
+        [[hits["a"], hits["b"]], [hits["c"], hits["b"]]], rrf_k=60, top_k=2
+    )
+
+    assert [hit.chunk_id for hit in fused] == [hits["b"].chunk_id, hits["a"].chunk_id]
+    assert fused[0].score == pytest.approx(2 / 62)
+
+
+def test_latency_tracker_percentiles():
+    tracker = LatencyTracker(window=100)
+    for ms in range(1, 101):
+        tracker.record(ms / 1000)
+
+    percentiles = tracker.percentiles(50, 95, 99)
+
+    assert percentiles == pytest.approx({"p50": 50.0, "p95": 95.0, "p99": 99.0})
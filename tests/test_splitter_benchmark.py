@@ -0,0 +1,102 @@
+import random
+import timeit
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from utils.preprocess import get_spliter, process_page_markdown, split_page_markdown
+
+
+# 기존 구현 (비교 기준): 호출마다 splitter 생성, 페이지마다 split_documents 호출
+def legacy_split_page_markdown(
+    page_chunks: list[dict],
+    chunk_size: int,
+    chunk_overlap: int,
+    file_path: str,
+) -> list[Document]:
+    spliter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=["\n\n", "\n", " ", ""],
+    )
+    documents = []
+
+    for i, chunk in enumerate(page_chunks):
+        cleaned_text, inline_image_links, tags = process_page_markdown(chunk["text"])
+        base_doc = Document(
+            page_content=cleaned_text,
+            metadata={"source": file_path, "page": i + 1, "tags": tags},
+        )
+
+        if cleaned_text.strip():
+            split_docs = spliter.split_documents([base_doc])
+        elif inline_image_links:
+            split_docs = [base_doc]
+        else:
+            split_docs = []
+
+        for j, sub_doc in enumerate(split_docs):
+            if j == 0 and inline_image_links:
+                sub_doc.metadata["images"] = inline_image_links
+            documents.append(sub_doc)
+
+    return documents
+
+
+def make_pages(page_count: int = 400, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    words = ["문서", "청크", "embedding", "pdf", "표", "그림", "데이터", "검색"]
+    pages = []
+
+    for page in range(page_count):
+        if page % 50 == 7:
+            # 이미지만 있는 페이지
+            pages.append({"text": f"![](./static/data/app/doc/p{page}.png)"})
+            continue
+        if page % 50 == 8:
+            # 빈 페이지
+            pages.append({"text": "  \n"})
+            continue
+
+        lines = [f"## Section {page}"]
+        for _ in range(rng.randint(20, 40)):
+            lines.append(" ".join(rng.choices(words, k=rng.randint(5, 20))))
+        if page % 10 == 0:
+            lines.append(f"![](./static/data/app/doc/p{page}.png)")
+        pages.append({"text": "\n".join(lines)})
+
+    return pages
+
+
+def test_get_spliter_is_cached():
+    assert get_spliter(250, 20) is get_spliter(250, 20, ["\n\n", "\n", " ", ""])
+    assert get_spliter(250, 20) is not get_spliter(300, 20)
+
+
+def test_split_page_markdown_matches_per_page_split():
+    pages = make_pages(page_count=120)
+
+    expected = legacy_split_page_markdown(pages, 250, 20, "a.pdf")
+    actual = split_page_markdown(pages, 250, 20, "a.pdf")
+
+    assert [(d.page_content, d.metadata) for d in actual] == [
+        (d.page_content, d.metadata) for d in expected
+    ]
+
+
+def test_split_page_markdown_benchmark():
+    # 공유 CI 머신에서는 시간 측정이 불안정하므로 결과만 출력 (pytest -s)
+    pages = make_pages()
+
+    def run(func):
+        return min(
+            timeit.repeat(lambda: func(pages, 250, 20, "a.pdf"), number=1, repeat=5)
+        )
+
+    legacy = run(legacy_split_page_markdown)
+    current = run(split_page_markdown)
+
+    print(
+        f"\nper-page {legacy * 1000:.1f}ms, current {current * 1000:.1f}ms, "
+        f"speedup x{legacy / current:.2f} ({len(pages)} pages)"
+    )
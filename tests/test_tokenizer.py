@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils import tokenizer
+from utils.preprocess import get_spliter
+from utils.tokenizer import (
+    CHARACTER,
+    TOKEN,
+    count_tokens,
+    estimate_tokens,
+    get_length_function,
+)
+
+
+class FakeTokenizer:
+    """공백 단위로 토큰을 세는 tokenizers.Tokenizer 대역"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text: str, add_special_tokens: bool = True):
+        self.calls += 1
+        return SimpleNamespace(ids=list(range(len(text.split()))))
+
+
+@pytest.fixture
+def fake_tokenizer(monkeypatch) -> FakeTokenizer:
+    fake = FakeTokenizer()
+    monkeypatch.setattr(tokenizer, "get_local_tokenizer", lambda: fake)
+    tokenizer._count_tokens_cached.cache_clear()
+    yield fake
+    tokenizer._count_tokens_cached.cache_clear()
+
+
+def test_character_mode_counts_characters():
+    assert get_length_function(CHARACTER) is len
+    assert get_length_function(CHARACTER)("유압 밸브") == 5
+
+
+def test_token_mode_estimates_without_tokenizer(monkeypatch):
+    monkeypatch.setattr(tokenizer, "get_local_tokenizer", lambda: None)
+    tokenizer._count_tokens_cached.cache_clear()
+
+    length_function = get_length_function(TOKEN)
+
+    # 한글 글자당 1, 영숫자 4글자당 1, 기호 1
+    assert estimate_tokens("유압 valve-2041") == 2 + 2 + 1 + 1
+    assert length_function("유압 valve-2041") == estimate_tokens("유압 valve-2041")
+    tokenizer._count_tokens_cached.cache_clear()
+
+
+def test_token_mode_uses_local_tokenizer(fake_tokenizer):
+    length_function = get_length_function(TOKEN)
+
+    assert length_function("a b c") == 3
+    assert length_function("a b c") == 3
+    assert fake_tokenizer.calls == 1
+
+
+def test_long_texts_bypass_cache(fake_tokenizer, monkeypatch):
+    monkeypatch.setattr(tokenizer.chunk_setting, "token_count_cache_max_chars", 8)
+
+    text = "a b c d e f"
+    assert count_tokens(text) == 6
+    assert count_tokens(text) == 6
+    assert fake_tokenizer.calls == 2
+    assert tokenizer._count_tokens_cached.cache_info().currsize == 0
+
+
+def test_token_mode_splitter_respects_chunk_size(fake_tokenizer):
+    text = " ".join(f"w{i}" for i in range(100))
+
+    chunks = get_spliter(10, 0, length_unit=TOKEN).split_text(text)
+
+    assert all(count_tokens(chunk) <= 10 for chunk in chunks)
+    assert " ".join(chunks) == text
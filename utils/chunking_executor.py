@@ -0,0 +1,121 @@
+import asyncio
+import multiprocessing
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from config import get_settings
+
+chunk_setting = get_settings().chunk
+
+CHUNKING_POOL_SIZE = chunk_setting.chunking_pool_size
+CHUNKING_TIMEOUT_SEC = chunk_setting.chunking_timeout_sec
+CHUNKING_START_METHOD = chunk_setting.chunking_start_method
+
+T = TypeVar("T")
+
+
+class ChunkingExecutor:
+    """
+    PDF 파싱/청킹처럼 CPU를 오래 점유하는 동기 함수를 프로세스 풀에서 실행한다.
+
+    - pool_size: 워커 프로세스 수. 동시에 제출하는 작업도 pool_size개로 제한하므로
+      제출된 작업은 바로 실행되며, 초과 요청은 이벤트 루프에서 대기한다.
+    - timeout: 작업 1건의 최대 실행 시간(초). 초과 시 워커 프로세스를 종료하고
+      풀을 재생성한 뒤 TimeoutError를 발생시킨다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = CHUNKING_POOL_SIZE,
+        timeout: float = CHUNKING_TIMEOUT_SEC,
+        start_method: str = CHUNKING_START_METHOD,
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.start_method = start_method
+        # 슬롯은 워커에서 작업이 실제로 끝날 때 반환 (시간 초과로 기다리기를 멈춘 시점이 아님)
+        self._semaphore = asyncio.Semaphore(pool_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # 시간 초과로 강제 종료한 풀 (함께 실행 중이던 작업은 새 풀에서 재실행)
+        self._recycled_pools: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # 워커 프로세스는 첫 작업 제출 시점에 생성
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.pool_size,
+                mp_context=multiprocessing.get_context(self.start_method),
+            )
+        return self._pool
+
+    async def _submit(
+        self, call: Callable[[], T]
+    ) -> Tuple[ProcessPoolExecutor, "asyncio.Future[T]"]:
+        await self._semaphore.acquire()
+        loop = asyncio.get_running_loop()
+
+        try:
+            pool = self._get_pool()
+            future: Future = pool.submit(call)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        future.add_done_callback(lambda _: self._release(loop))
+        return pool, asyncio.wrap_future(future, loop=loop)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        # 완료 콜백은 풀의 관리 스레드에서 호출됨
+        try:
+            loop.call_soon_threadsafe(self._semaphore.release)
+        except RuntimeError:
+            pass  # 이벤트 루프가 이미 종료됨
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """
+        func(*args, **kwargs)를 워커 프로세스에서 실행하고 결과를 기다린다.
+        func와 인자, 반환값은 pickle 가능해야 한다.
+        """
+        call = partial(func, *args, **kwargs)
+
+        for attempt in range(2):
+            pool, future = await self._submit(call)
+            try:
+                return await asyncio.wait_for(future, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                self._recycle(pool)
+                raise TimeoutError(
+                    f"청킹 작업이 제한 시간({self.timeout}초)을 초과했습니다."
+                )
+            except BrokenProcessPool:
+                # 다른 작업의 시간 초과로 풀이 종료된 경우 새 풀에서 한 번 더 실행
+                if attempt == 0 and pool in self._recycled_pools:
+                    continue
+                # 워커 프로세스가 비정상 종료된 경우 다음 요청을 위해 풀을 재생성
+                self._discard(pool)
+                raise
+
+    def _recycle(self, pool: ProcessPoolExecutor) -> None:
+        """
+        실행 중인 워커는 shutdown으로 중단되지 않으므로 프로세스를 종료해 슬롯을 회수한다.
+        어떤 프로세스가 시간 초과된 작업을 실행 중인지 알 수 없어 풀 전체를 재생성한다.
+        """
+        if pool in self._recycled_pools:
+            return
+
+        self._recycled_pools.add(pool)
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        self._discard(pool)
+
+    def _discard(self, pool: ProcessPoolExecutor) -> None:
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait: bool = False) -> None:
+        if self._pool is not None:
+            self._discard(self._pool)
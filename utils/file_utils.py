@@ -1,41 +1,77 @@
 import os
 import hashlib
 import shutil
+import tempfile
+from typing import Tuple
 from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
 
 BASE_DIR = os.path.abspath(
     os.path.dirname(os.path.dirname(__file__))
 )  # 현재 파일 기준 절대 경로
 DATA_DIR = os.path.join(BASE_DIR, "static/data")  # 최상위 ./static/data 디렉토리
+UPLOAD_BUFFER_SIZE = 1024 * 1024  # 업로드 파일을 읽고 쓰는 버퍼 크기 (1MB)
 
 
-async def compute_file_hash(file: UploadFile) -> str:
-    """SHA-256 해시를 비동기적으로 계산"""
-    hasher = hashlib.sha256()
-    while chunk := await file.read(8192):
-        hasher.update(chunk)
-    await file.seek(0)
-    return hasher.hexdigest()
+def _write_and_hash(buffer, hasher, chunk: bytes) -> None:
+    hasher.update(chunk)
+    buffer.write(chunk)
 
 
-async def save_file(
+async def save_temp_file_with_hash(
     file: UploadFile,
     file_path: str,  # app_id/source
-) -> str:
-    # 저장 경로 구성
+) -> Tuple[str, str, int]:
+    """
+    업로드 파일을 고정 크기 버퍼로 한 번만 읽으면서
+    임시 파일 저장과 SHA-256 해시 계산을 함께 수행
+
+    Returns:
+        (임시 파일 경로, 해시값, 파일 크기)
+    """
     save_dir = os.path.join(DATA_DIR, file_path)
     os.makedirs(save_dir, exist_ok=True)
 
-    dest_path = os.path.join(save_dir, file.filename)
+    # 최종 경로와 같은 디렉토리에 만들어야 rename이 원자적으로 수행됨
+    fd, temp_path = tempfile.mkstemp(dir=save_dir, prefix=".upload-", suffix=".tmp")
 
-    # 파일 저장
-    with open(dest_path, "wb") as buffer:
-        content = await file.read()
-        buffer.write(content)
+    hasher = hashlib.sha256()
+    size = 0
+
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_BUFFER_SIZE):
+                await run_in_threadpool(_write_and_hash, buffer, hasher, chunk)
+                size += len(chunk)
+    except BaseException:
+        discard_temp_file(temp_path)
+        raise
+
+    return temp_path, hasher.hexdigest(), size
+
+
+def commit_temp_file(
+    temp_path: str,
+    file_path: str,  # app_id/source
+    filename: str,
+) -> str:
+    """
+    임시 파일을 static/data/{file_path}/{filename} 으로 원자적으로 이동
+
+    Returns:
+        저장된 파일의 전체 경로
+    """
+    dest_path = os.path.join(DATA_DIR, file_path, filename)
+    os.replace(temp_path, dest_path)
 
     return dest_path
 
 
+def discard_temp_file(temp_path: str) -> None:
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+
 def rename_file(
     file_path: str,  # app_id/source
     old_filename: str,  # 기존 파일 이름 (ex: old.pdf)
@@ -0,0 +1,34 @@
+import re
+import unicodedata
+from typing import List
+
+# 한글 연속 구간, 또는 구분자(-_./)로 이어진 영숫자 코드 (ex. AB-1234, v2.5.9)
+LEXICAL_TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+(?:[-_./][a-z0-9]+)*")
+CODE_SEPARATOR_PATTERN = re.compile(r"[-_./]")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    BM25 색인/검색용 토큰 분리. 형태소 분석기 없이 동작하도록
+    한글은 글자 bigram(한 글자 단어는 그대로)으로, 영숫자 코드는 전체 코드와 구분자로 나눈 조각을 함께 사용한다.
+    """
+
+    tokens: List[str] = []
+
+    for match in LEXICAL_TOKEN_PATTERN.finditer(
+        unicodedata.normalize("NFKC", text).lower()
+    ):
+        token = match.group()
+
+        if "가" <= token[0] <= "힣":
+            if len(token) == 1:
+                tokens.append(token)
+            else:
+                tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+            continue
+
+        tokens.append(token)
+        if CODE_SEPARATOR_PATTERN.search(token):
+            tokens.extend(CODE_SEPARATOR_PATTERN.split(token))
+
+    return tokens
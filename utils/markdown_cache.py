@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from common.log_config import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILE_EXTENSION = ".json"
+
+
+class MarkdownCache:
+    """
+    pymupdf4llm 페이지별 마크다운 추출 결과를 (문서 해시, 추출 옵션) 키로 저장하는 디스크 캐시.
+    청킹은 프로세스 풀에서 실행되므로 프로세스 간 공유가 가능한 파일 단위로 저장하며,
+    max_bytes/max_entries를 넘으면 가장 오래 사용하지 않은(mtime 기준) 항목부터 삭제한다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, max_entries: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    def get_key(self, document_hash: str, options: Dict[str, Any]) -> str:
+        payload = json.dumps([document_hash, options], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_FILE_EXTENSION)
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시된 페이지 목록을 반환한다.
+        추출 당시 저장한 이미지 파일이 하나라도 없으면 무효 처리하고 None을 반환한다.
+        """
+        path = self._get_path(key)
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Markdown Cache] 캐시 읽기 실패, 삭제: {e}")
+            self._remove(path)
+            return None
+
+        try:
+            images, pages = entry["images"], entry["pages"]
+        except (KeyError, TypeError) as e:
+            logger.warning(f"[Markdown Cache] 잘못된 캐시 항목, 삭제: {e}")
+            self._remove(path)
+            return None
+
+        if not all(os.path.exists(image) for image in images):
+            self._remove(path)
+            return None
+
+        # LRU 판단을 위해 사용 시각 갱신 (다른 프로세스가 그 사이 삭제했을 수 있음)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return pages
+
+    def set(self, key: str, pages: List[Dict[str, Any]], images: List[str]) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"[Markdown Cache] 캐시 저장 실패: {e}")
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"pages": pages, "images": images},
+                    f,
+                    ensure_ascii=False,
+                    default=str,
+                )
+            os.replace(temp_path, self._get_path(key))
+        except Exception as e:
+            logger.warning(f"[Markdown Cache] 캐시 저장 실패: {e}")
+            self._remove(temp_path)
+            return
+
+        try:
+            self.evict()
+        except OSError as e:
+            logger.warning(f"[Markdown Cache] 캐시 정리 실패: {e}")
+
+    def evict(self) -> None:
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_FILE_EXTENSION):
+                    continue
+                # 다른 프로세스가 먼저 삭제한 항목은 건너뜀
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+
+        while entries and (
+            len(entries) > self.max_entries or total_bytes > self.max_bytes
+        ):
+            _, size, path = entries.pop(0)
+            self._remove(path)
+            total_bytes -= size
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,74 @@
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Callable
+
+from common.log_config import get_logger
+from config import get_settings
+
+try:
+    from tokenizers import Tokenizer
+except ImportError:  # tokenizers 미설치 시 근사치 사용
+    Tokenizer = None
+
+logger = get_logger(__name__)
+
+chunk_setting = get_settings().chunk
+
+CHARACTER = "character"
+TOKEN = "token"
+
+# 한글/한자/가나는 글자당 1토큰, 영숫자 단어는 4글자당 1토큰, 나머지 기호는 1토큰으로 근사
+# 실제 토크나이저보다 크게 세는 쪽으로 근사하여 청크가 모델 한도를 넘지 않도록 함
+TOKEN_ESTIMATE_PATTERN = re.compile(r"([가-힣㄰-㆏一-鿿぀-ヿ])|([A-Za-z0-9_]+)|(\S)")
+
+
+@lru_cache(maxsize=1)
+def get_local_tokenizer():
+    """
+    chunk_tokenizer_path에 tokenizer.json이 설정되어 있으면 로드한다. (프로세스당 1회)
+    """
+    path = chunk_setting.chunk_tokenizer_path
+    if not path:
+        return None
+    if Tokenizer is None or not os.path.exists(path):
+        logger.warning(f"[Tokenizer] {path} 로드 불가, 토큰 수를 근사치로 계산합니다.")
+        return None
+    return Tokenizer.from_file(path)
+
+
+def estimate_tokens(text: str) -> int:
+    count = 0
+    for _, word, _ in TOKEN_ESTIMATE_PATTERN.findall(text):
+        count += math.ceil(len(word) / 4) if word else 1
+    return count
+
+
+def _count_tokens(text: str) -> int:
+    tokenizer = get_local_tokenizer()
+    if tokenizer is None:
+        return estimate_tokens(text)
+    return len(tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+@lru_cache(maxsize=chunk_setting.token_count_cache_size)
+def _count_tokens_cached(text: str) -> int:
+    return _count_tokens(text)
+
+
+def count_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수. splitter가 같은 조각의 길이를 반복해서 계산하므로 결과를 캐시한다.
+    캐시는 키로 문자열 자체를 보관하므로 token_count_cache_max_chars 이하의 조각만 캐시하여
+    메모리 사용량을 (항목 수 x 최대 길이)로 제한한다.
+    """
+    if len(text) > chunk_setting.token_count_cache_max_chars:
+        return _count_tokens(text)
+    return _count_tokens_cached(text)
+
+
+def get_length_function(length_unit: str) -> Callable[[str], int]:
+    if length_unit == TOKEN:
+        return count_tokens
+    return len